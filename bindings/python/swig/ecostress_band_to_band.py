@@ -139,7 +139,51 @@ import geocal_swig.with_parameter
 import geocal_swig.geocal_exception
 import geocal_swig.observer
 band_to_band_tie_points = _ecostress_band_to_band.band_to_band_tie_points
-
-__all__ = ["band_to_band_tie_points"]
+band_to_band_tie_points_multi_band = _ecostress_band_to_band.band_to_band_tie_points_multi_band
+class Vector_GeometricTiePoints(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    iterator = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_iterator)
+    def __iter__(self):
+        return self.iterator()
+    __nonzero__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___nonzero__)
+    __bool__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___bool__)
+    __len__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___len__)
+    __getslice__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___getslice__)
+    __setslice__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___setslice__)
+    __delslice__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___delslice__)
+    __delitem__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___delitem__)
+    __getitem__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___getitem__)
+    __setitem__ = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints___setitem__)
+    pop = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_pop)
+    append = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_append)
+    empty = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_empty)
+    size = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_size)
+    swap = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_swap)
+    begin = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_begin)
+    end = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_end)
+    rbegin = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_rbegin)
+    rend = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_rend)
+    clear = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_clear)
+    get_allocator = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_get_allocator)
+    pop_back = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_pop_back)
+    erase = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_erase)
+
+    def __init__(self, *args):
+        _ecostress_band_to_band.Vector_GeometricTiePoints_swiginit(self, _ecostress_band_to_band.new_Vector_GeometricTiePoints(*args))
+    push_back = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_push_back)
+    front = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_front)
+    back = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_back)
+    assign = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_assign)
+    resize = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_resize)
+    insert = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_insert)
+    reserve = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_reserve)
+    capacity = _swig_new_instance_method(_ecostress_band_to_band.Vector_GeometricTiePoints_capacity)
+    __swig_destroy__ = _ecostress_band_to_band.delete_Vector_GeometricTiePoints
+
+# Register Vector_GeometricTiePoints in _ecostress_band_to_band:
+_ecostress_band_to_band.Vector_GeometricTiePoints_swigregister(Vector_GeometricTiePoints)
+
+__all__ = ["band_to_band_tie_points","band_to_band_tie_points_multi_band","Vector_GeometricTiePoints"]
 
 
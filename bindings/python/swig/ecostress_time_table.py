@@ -170,6 +170,8 @@ class EcostressTimeTable(geocal_swig.time_table.TimeTable):
     scan_index_to_line = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable_scan_index_to_line)
     line_to_scan_index = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable_line_to_scan_index)
     close_to_scan_edge = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable_close_to_scan_edge)
+    time_j2000 = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable_time_j2000)
+    line_time_j2000 = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable_line_time_j2000)
     _v_averaging_done = _swig_new_instance_method(_ecostress_time_table.EcostressTimeTable__v_averaging_done)
 
     @property
@@ -164,6 +164,17 @@ class GroundCoordinateArray(geocal_swig.generic_object.GenericObject):
     a push whisk broom. So we use different logic for coming up with the
     initial guess as the ray length, but it is the same idea.
 
+    ground_coor_scan_arr can optionally use multiple threads (see
+    number_thread). The samples of a scan are divided into contiguous
+    blocks, one per thread, and each block starts with a full ray cast at
+    the sample closest to nadir and then works outward like the single
+    threaded version. The orbit data for each sample is calculated up
+    front before starting the threads, and each thread after the first
+    uses its own copy of the ImageGroundConnection for the DEM, since the
+    orbit and DEM have internal caches that aren't thread safe. The
+    results agree with the single threaded calculation to within the ray
+    casting resolution.
+
     C++ includes: ground_coordinate_array.h 
     """
 
@@ -188,6 +199,16 @@ class GroundCoordinateArray(geocal_swig.generic_object.GenericObject):
     def igc(self):
         return self._v_igc()
 
+    _v_number_thread = _swig_new_instance_method(_ground_coordinate_array.GroundCoordinateArray__v_number_thread)
+
+    @property
+    def number_thread(self):
+        return self._v_number_thread()
+
+    @number_thread.setter
+    def number_thread(self, value):
+      self._v_number_thread(value)
+
     ground_coor_arr = _swig_new_instance_method(_ground_coordinate_array.GroundCoordinateArray_ground_coor_arr)
     ground_coor_scan_arr = _swig_new_instance_method(_ground_coordinate_array.GroundCoordinateArray_ground_coor_scan_arr)
     cover = _swig_new_instance_method(_ground_coordinate_array.GroundCoordinateArray_cover)
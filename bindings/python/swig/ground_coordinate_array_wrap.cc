@@ -7000,6 +7000,127 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_GroundCoordinateArray__v_number_thread__SWIG_0(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  Ecostress::GroundCoordinateArray *arg1 = (Ecostress::GroundCoordinateArray *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  boost::shared_ptr< Ecostress::GroundCoordinateArray const > tempshared1 ;
+  boost::shared_ptr< Ecostress::GroundCoordinateArray const > *smartarg1 = 0 ;
+  int result;
+  
+  (void)self;
+  if ((nobjs < 1) || (nobjs > 1)) SWIG_fail;
+  {
+    int newmem = 0;
+    res1 = SWIG_ConvertPtrAndOwn(swig_obj[0], &argp1, SWIGTYPE_p_boost__shared_ptrT_Ecostress__GroundCoordinateArray_t, 0 |  0 , &newmem);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "GroundCoordinateArray__v_number_thread" "', argument " "1"" of type '" "Ecostress::GroundCoordinateArray const *""'");
+    }
+    if (newmem & SWIG_CAST_NEW_MEMORY) {
+      tempshared1 = *reinterpret_cast< boost::shared_ptr< const Ecostress::GroundCoordinateArray > * >(argp1);
+      delete reinterpret_cast< boost::shared_ptr< const Ecostress::GroundCoordinateArray > * >(argp1);
+      arg1 = const_cast< Ecostress::GroundCoordinateArray * >(tempshared1.get());
+    } else {
+      smartarg1 = reinterpret_cast< boost::shared_ptr< const Ecostress::GroundCoordinateArray > * >(argp1);
+      arg1 = const_cast< Ecostress::GroundCoordinateArray * >((smartarg1 ? smartarg1->get() : 0));
+    }
+  }
+  {
+    try {
+      result = (int)((Ecostress::GroundCoordinateArray const *)arg1)->number_thread();
+    } catch (Swig::DirectorException &e) {
+      SWIG_fail; 
+    } catch (const std::exception& e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+  }
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_GroundCoordinateArray__v_number_thread__SWIG_1(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  Ecostress::GroundCoordinateArray *arg1 = (Ecostress::GroundCoordinateArray *) 0 ;
+  int *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  boost::shared_ptr< Ecostress::GroundCoordinateArray > tempshared1 ;
+  boost::shared_ptr< Ecostress::GroundCoordinateArray > *smartarg1 = 0 ;
+  int temp2 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  
+  (void)self;
+  if ((nobjs < 2) || (nobjs > 2)) SWIG_fail;
+  {
+    int newmem = 0;
+    res1 = SWIG_ConvertPtrAndOwn(swig_obj[0], &argp1, SWIGTYPE_p_boost__shared_ptrT_Ecostress__GroundCoordinateArray_t, 0 |  0 , &newmem);
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "GroundCoordinateArray__v_number_thread" "', argument " "1"" of type '" "Ecostress::GroundCoordinateArray *""'");
+    }
+    if (newmem & SWIG_CAST_NEW_MEMORY) {
+      tempshared1 = *reinterpret_cast< boost::shared_ptr<  Ecostress::GroundCoordinateArray > * >(argp1);
+      delete reinterpret_cast< boost::shared_ptr<  Ecostress::GroundCoordinateArray > * >(argp1);
+      arg1 = const_cast< Ecostress::GroundCoordinateArray * >(tempshared1.get());
+    } else {
+      smartarg1 = reinterpret_cast< boost::shared_ptr<  Ecostress::GroundCoordinateArray > * >(argp1);
+      arg1 = const_cast< Ecostress::GroundCoordinateArray * >((smartarg1 ? smartarg1->get() : 0));
+    }
+  }
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "GroundCoordinateArray__v_number_thread" "', argument " "2"" of type '" "int""'");
+  } 
+  temp2 = static_cast< int >(val2);
+  arg2 = &temp2;
+  {
+    try {
+      (arg1)->number_thread((int const &)*arg2);
+    } catch (Swig::DirectorException &e) {
+      SWIG_fail; 
+    } catch (const std::exception& e) {
+      SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_GroundCoordinateArray__v_number_thread(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  
+  if (!(argc = SWIG_Python_UnpackTuple(args, "GroundCoordinateArray__v_number_thread", 0, 2, argv))) SWIG_fail;
+  --argc;
+  if (argc == 1) {
+    PyObject *retobj = _wrap_GroundCoordinateArray__v_number_thread__SWIG_0(self, argc, argv);
+    if (!SWIG_Python_TypeErrorOccurred(retobj)) return retobj;
+    SWIG_fail;
+  }
+  if (argc == 2) {
+    PyObject *retobj = _wrap_GroundCoordinateArray__v_number_thread__SWIG_1(self, argc, argv);
+    if (!SWIG_Python_TypeErrorOccurred(retobj)) return retobj;
+    SWIG_fail;
+  }
+  
+fail:
+  SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'GroundCoordinateArray__v_number_thread'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Ecostress::GroundCoordinateArray::number_thread() const\n"
+    "    Ecostress::GroundCoordinateArray::number_thread(int const &)\n");
+  return 0;
+}
+
+
 SWIGINTERN PyObject *_wrap_GroundCoordinateArray_ground_coor_arr(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Ecostress::GroundCoordinateArray *arg1 = (Ecostress::GroundCoordinateArray *) 0 ;
@@ -7029,13 +7150,18 @@ SWIGINTERN PyObject *_wrap_GroundCoordinateArray_ground_coor_arr(PyObject *self,
     }
   }
   {
+    std::string ecostress_error;
+    bool ecostress_have_error = false;
+    Py_BEGIN_ALLOW_THREADS
     try {
       result = ((Ecostress::GroundCoordinateArray const *)arg1)->ground_coor_arr();
-    } catch (Swig::DirectorException &e) {
-      SWIG_fail; 
-    } catch (const std::exception& e) {
-      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch(const std::exception& e) {
+      ecostress_have_error = true;
+      ecostress_error = e.what();
     }
+    Py_END_ALLOW_THREADS
+    if(ecostress_have_error)
+    SWIG_exception(SWIG_RuntimeError, ecostress_error.c_str());
   }
   {
     // Treat as pointer for the purposes of the macro
@@ -7108,13 +7234,18 @@ SWIGINTERN PyObject *_wrap_GroundCoordinateArray_ground_coor_scan_arr__SWIG_0(Py
   } 
   arg3 = static_cast< int >(val3);
   {
+    std::string ecostress_error;
+    bool ecostress_have_error = false;
+    Py_BEGIN_ALLOW_THREADS
     try {
       result = ((Ecostress::GroundCoordinateArray const *)arg1)->ground_coor_scan_arr(arg2,arg3);
-    } catch (Swig::DirectorException &e) {
-      SWIG_fail; 
-    } catch (const std::exception& e) {
-      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch(const std::exception& e) {
+      ecostress_have_error = true;
+      ecostress_error = e.what();
     }
+    Py_END_ALLOW_THREADS
+    if(ecostress_have_error)
+    SWIG_exception(SWIG_RuntimeError, ecostress_error.c_str());
   }
   {
     // Treat as pointer for the purposes of the macro
@@ -7179,13 +7310,18 @@ SWIGINTERN PyObject *_wrap_GroundCoordinateArray_ground_coor_scan_arr__SWIG_1(Py
   } 
   arg2 = static_cast< int >(val2);
   {
+    std::string ecostress_error;
+    bool ecostress_have_error = false;
+    Py_BEGIN_ALLOW_THREADS
     try {
       result = ((Ecostress::GroundCoordinateArray const *)arg1)->ground_coor_scan_arr(arg2);
-    } catch (Swig::DirectorException &e) {
-      SWIG_fail; 
-    } catch (const std::exception& e) {
-      SWIG_exception(SWIG_RuntimeError, e.what());
+    } catch(const std::exception& e) {
+      ecostress_have_error = true;
+      ecostress_error = e.what();
     }
+    Py_END_ALLOW_THREADS
+    if(ecostress_have_error)
+    SWIG_exception(SWIG_RuntimeError, ecostress_error.c_str());
   }
   {
     // Treat as pointer for the purposes of the macro
@@ -8381,6 +8517,12 @@ static PyMethodDef SwigMethods[] = {
 		"The ImageGroundConnection we are working with.\n"
 		"\n"
 		""},
+	 { "GroundCoordinateArray__v_number_thread", _wrap_GroundCoordinateArray__v_number_thread, METH_VARARGS, "\n"
+		"\n"
+		"void Ecostress::GroundCoordinateArray::number_thread(int V)\n"
+		"Ecostress::GroundCoordinateArray::number_thread\n"
+		"\n"
+		""},
 	 { "GroundCoordinateArray_ground_coor_arr", _wrap_GroundCoordinateArray_ground_coor_arr, METH_O, "\n"
 		"\n"
 		"blitz::Array< double, 5 > GroundCoordinateArray::ground_coor_arr() const\n"
@@ -8414,7 +8556,10 @@ static PyMethodDef SwigMethods[] = {
 		"If include_angle was specified in the construtor, we return a\n"
 		"number_line x number_sample x nsub_line x nsub_sample x 7 array with\n"
 		"coordinates as latitude, longitude, height, view_zenith, view_azimuth,\n"
-		"solar_zenith, solar_azimuth. \n"
+		"solar_zenith, solar_azimuth.\n"
+		"\n"
+		"This uses number_thread threads. The returned array is newly allocated\n"
+		"for each call. \n"
 		""},
 	 { "GroundCoordinateArray_cover", _wrap_GroundCoordinateArray_cover, METH_VARARGS, "\n"
 		"\n"
@@ -8532,6 +8677,12 @@ static PyMethodDef SwigMethods_proxydocs[] = {
 		"The ImageGroundConnection we are working with.\n"
 		"\n"
 		""},
+	 { "GroundCoordinateArray__v_number_thread", _wrap_GroundCoordinateArray__v_number_thread, METH_VARARGS, "\n"
+		"\n"
+		"void Ecostress::GroundCoordinateArray::number_thread(int V)\n"
+		"Ecostress::GroundCoordinateArray::number_thread\n"
+		"\n"
+		""},
 	 { "GroundCoordinateArray_ground_coor_arr", _wrap_GroundCoordinateArray_ground_coor_arr, METH_O, "\n"
 		"\n"
 		"blitz::Array< double, 5 > GroundCoordinateArray::ground_coor_arr() const\n"
@@ -8565,7 +8716,10 @@ static PyMethodDef SwigMethods_proxydocs[] = {
 		"If include_angle was specified in the construtor, we return a\n"
 		"number_line x number_sample x nsub_line x nsub_sample x 7 array with\n"
 		"coordinates as latitude, longitude, height, view_zenith, view_azimuth,\n"
-		"solar_zenith, solar_azimuth. \n"
+		"solar_zenith, solar_azimuth.\n"
+		"\n"
+		"This uses number_thread threads. The returned array is newly allocated\n"
+		"for each call. \n"
 		""},
 	 { "GroundCoordinateArray_cover", _wrap_GroundCoordinateArray_cover, METH_VARARGS, "\n"
 		"\n"
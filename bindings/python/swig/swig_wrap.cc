@@ -17,6 +17,7 @@ extern "C" {
   INIT_TYPE INIT_FUNC(_ecostress_igc_collection)(void);
   INIT_TYPE INIT_FUNC(_ecostress_rad_apply)(void);
   INIT_TYPE INIT_FUNC(_ecostress_rad_average)(void);
+  INIT_TYPE INIT_FUNC(_ecostress_rad_scan)(void);
   INIT_TYPE INIT_FUNC(_ecostress_band_to_band)(void);
   INIT_TYPE INIT_FUNC(_ground_coordinate_array)(void);
   INIT_TYPE INIT_FUNC(_simulated_radiance)(void);
@@ -44,6 +45,7 @@ static void module_init(PyObject* module)
   INIT_MODULE(module, "_ecostress_igc_collection", INIT_FUNC(_ecostress_igc_collection));
   INIT_MODULE(module, "_ecostress_rad_apply", INIT_FUNC(_ecostress_rad_apply));
   INIT_MODULE(module, "_ecostress_rad_average", INIT_FUNC(_ecostress_rad_average));
+  INIT_MODULE(module, "_ecostress_rad_scan", INIT_FUNC(_ecostress_rad_scan));
   INIT_MODULE(module, "_ecostress_band_to_band", INIT_FUNC(_ecostress_band_to_band));
   INIT_MODULE(module, "_ground_coordinate_array", INIT_FUNC(_ground_coordinate_array));
   INIT_MODULE(module, "_simulated_radiance", INIT_FUNC(_simulated_radiance));
@@ -5,6 +5,7 @@ import re, sys, os
 #from .write_standard_metadata import WriteStandardMetadata
 #from .misc import ecostress_file_name
 from geocal import Time
+from ecostress.l0b_index_file import L0bIndexFile
 import numpy as np
 import struct
 
@@ -69,7 +70,7 @@ SCENE_DUR = SCAN_DUR * SCPS
 def l0b_scan():
   args = len(sys.argv)
   if( args <= 1 ):
-    print("Usage: python l0b_scan L0B_FILE_NAME [OSP_DIR] [OUT_DIR] [SP] [OFF] [EP]")
+    print("Usage: python l0b_scan L0B_FILE_NAME [OSP_DIR] [OUT_DIR] [SP] [OFF] [EP] [INDEX_DIR]")
     exit()
   else:
     l0b_name = sys.argv[1]
@@ -95,6 +96,9 @@ def l0b_scan():
   
   if args > 6: pkte = int( sys.argv[6] )  # ending packet
   else: pkte = -1
+
+  if args > 7: index_dir = sys.argv[7]  # cache directory for L0B index
+  else: index_dir = None
   
   fin = h5py.File(l0b_name,"r", driver='core')
   bip = fin["/flex/bip"]
@@ -187,6 +191,17 @@ def l0b_scan():
     print("")
   '''
   
+  # Use the L0B index file for the sequence start search if we can,
+  # otherwise fall back to scanning each packet
+  try:
+    l0b_index = L0bIndexFile(l0b_name, fin, ev_codes, MAX_FPIE, cache_dir=index_dir)
+    seq_idx = [np.flatnonzero(l0b_index.seq_fp[seq] >= 0) for seq in range(3)]
+    gap_idx = np.flatnonzero(gpt[1:] - gpt[:-1] > SCAN_DUR) + 1
+    print("Using L0B index file %s" % l0b_index.fname)
+  except OSError as exc:
+    print("Not using L0B index file: %s" % exc)
+    l0b_index = None
+
   ev0 = 0
   scenes = []
   sid = 0
@@ -200,7 +215,31 @@ def l0b_scan():
       # seek to start of sequence
       e0 = idx
       e2 = 2
-      while e0 < pkte and e2 == 2:
+      if l0b_index is not None and e0 < pkte:
+        # next packet with the sequence start
+        i = np.searchsorted(seq_idx[seq], e0)
+        em = seq_idx[seq][i] if i < seq_idx[seq].shape[0] else pkte
+        em = min(em, pkte)
+        # time gaps before that, same test as packet by packet below
+        if seq > 0 and gpt[e0] - t0 > SCAN_DUR:
+          eg = e0
+        else:
+          i = np.searchsorted(gap_idx, e0 + 1)
+          eg = gap_idx[i] if i < gap_idx.shape[0] else pkte
+        if seq > 0 and eg <= em and eg < pkte:
+          e0 = eg
+          t0 = gpt[e0]
+          print("Discontinuity seeking %s IDX=%d" %(ev_names[seq],e0))
+          cont = 0
+        elif em < pkte:
+          e0 = em
+          t0 = gpt[e0]
+          e1 = int(l0b_index.seq_fp[seq, e0])
+          e2 = int(l0b_index.seq_phase[seq, e0])
+        else:
+          e0 = pkte
+          t0 = gpt[pkte-1]
+      while l0b_index is None and e0 < pkte and e2 == 2:
         dt = gpt[e0] - t0
         t0 = gpt[e0]
         if dt > SCAN_DUR and seq > 0:
@@ -1,4 +1,5 @@
 #include "ecostress_band_to_band.h"
+#include <boost/make_shared.hpp>
 using namespace Ecostress;
 
 
@@ -21,13 +22,36 @@ GeoCal::GeometricTiePoints Ecostress::band_to_band_tie_points
 (const EcostressImageGroundConnection& Igc,
  int Scan_index, int Band,
  int Nline_pt, int Nsamp_pt)
+{
+  return *band_to_band_tie_points_multi_band(Igc, Scan_index,
+		      std::vector<int>(1, Band), Nline_pt, Nsamp_pt)[0];
+}
+
+//-----------------------------------------------------------------------
+/// Variation of band_to_band_tie_points that handles a list of
+/// bands for the same scan. The center height and the ground
+/// location of each point of the Igc.band() grid only depend on the
+/// scan, so we calculate these once and then just do the
+/// image_coordinate_scan_index for each band. This returns the
+/// GeometricTiePoints in the same order as Band_list.
+//-----------------------------------------------------------------------
+
+std::vector<boost::shared_ptr<GeoCal::GeometricTiePoints> >
+Ecostress::band_to_band_tie_points_multi_band
+(const EcostressImageGroundConnection& Igc,
+ int Scan_index, const std::vector<int>& Band_list,
+ int Nline_pt, int Nsamp_pt)
 {
   int sline = Scan_index * Igc.number_line_scan();
   int eline = (Scan_index + 1) * Igc.number_line_scan() - 1;
   int esamp = Igc.number_sample() - 1;
   int lstep = (eline - sline) / Nline_pt;
   int sstep = esamp / Nsamp_pt;
-  GeoCal::GeometricTiePoints res;
+  std::vector<boost::shared_ptr<GeoCal::GeometricTiePoints> > res;
+  for(int i = 0; i < (int) Band_list.size(); ++i)
+    res.push_back(boost::make_shared<GeoCal::GeometricTiePoints>());
+  if(Band_list.size() == 0)
+    return res;
   // We aren't super sensitive to the exact height, but we do want
   // to capture gross height changes. So find height of the center
   // point, and then use for other points we calculate
@@ -44,14 +68,17 @@ GeoCal::GeometricTiePoints Ecostress::band_to_band_tie_points
 	smp = esamp;
       GeoCal::ImageCoordinate ric(ln, smp);
       boost::shared_ptr<GeoCal::GroundCoordinate> gp = Igc.ground_coordinate_approx_height(ric, height);
-      GeoCal::ImageCoordinate ic;
-      bool success;
-      Igc.image_coordinate_scan_index(*gp, Scan_index, ic, success, Band);
-      if(success) {
-	// Change to being relative to scan rather than full image.
-	ic.line -= sline;
-	ric.line -= sline;
-	res.add_point(ric, ic);
+      // Change to being relative to scan rather than full image.
+      GeoCal::ImageCoordinate ric_scan(ric.line - sline, ric.sample);
+      for(int i = 0; i < (int) Band_list.size(); ++i) {
+	GeoCal::ImageCoordinate ic;
+	bool success;
+	Igc.image_coordinate_scan_index(*gp, Scan_index, ic, success,
+					Band_list[i]);
+	if(success) {
+	  ic.line -= sline;
+	  res[i]->add_point(ric_scan, ic);
+	}
       }
     }
   }
@@ -7,4 +7,9 @@ namespace Ecostress {
   (const EcostressImageGroundConnection& Igc,
    int Scan_index, int Band,
    int Nline_pt=10, int Nsamp_pt=30);
+  std::vector<boost::shared_ptr<GeoCal::GeometricTiePoints> >
+  band_to_band_tie_points_multi_band
+  (const EcostressImageGroundConnection& Igc,
+   int Scan_index, const std::vector<int>& Band_list,
+   int Nline_pt=10, int Nsamp_pt=30);
 }
@@ -0,0 +1,30 @@
+#include "unit_test_support.h"
+#include "ecostress_band_to_band.h"
+#include "ecostress_igc_fixture.h"
+
+using namespace Ecostress;
+using namespace blitz;
+
+BOOST_FIXTURE_TEST_SUITE(ecostress_band_to_band, EcostressIgcFixture)
+
+BOOST_AUTO_TEST_CASE(multi_band)
+{
+  int scan_index = 10;
+  std::vector<int> band_list;
+  for(int b = 1; b <= 5; ++b)
+    band_list.push_back(b);
+  std::vector<boost::shared_ptr<GeoCal::GeometricTiePoints> > tplist =
+    band_to_band_tie_points_multi_band(*igc_hres, scan_index, band_list);
+  BOOST_CHECK_EQUAL((int) tplist.size(), 5);
+  // Should be identical to doing each band separately
+  for(int i = 0; i < (int) band_list.size(); ++i) {
+    GeoCal::GeometricTiePoints tp =
+      band_to_band_tie_points(*igc_hres, scan_index, band_list[i]);
+    BOOST_CHECK(tp.x().rows() > 0);
+    BOOST_CHECK_EQUAL(tplist[i]->x().rows(), tp.x().rows());
+    BOOST_CHECK_MATRIX_CLOSE(tplist[i]->x(), tp.x());
+    BOOST_CHECK_MATRIX_CLOSE(tplist[i]->y(), tp.y());
+  }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,178 @@
+#include "ecostress_rad_scan.h"
+#include "ecostress_dqi.h"
+#include <algorithm>
+#include <cmath>
+using namespace Ecostress;
+
+//-----------------------------------------------------------------------
+/// Register one line of the scan, putting the results in Res. This
+/// is the same calculation as GeometricModelImageHandleFill, but
+/// working directly with the radiance array.
+//-----------------------------------------------------------------------
+
+static void register_line(const double* Rad, int Nline, int Nsamp, int Line,
+			  const blitz::Array<double, 1>& C, double Fill_value,
+			  double* Lorig, double* Sorig, double* Res)
+{
+  if(C.rows() == 0) {
+    std::copy(Rad + Line * Nsamp, Rad + (Line + 1) * Nsamp, Res);
+    return;
+  }
+  // Collect the terms that only depend on the line, so the
+  // coordinates are a simple quadratic in sample that the compiler
+  // can vectorize.
+  double l = Line;
+  double a0 = C(0) + C(1) * l + C(3) * l * l;
+  double a1 = C(2) + C(4) * l;
+  double a2 = C(5);
+  double b0 = C(6) + C(7) * l + C(9) * l * l;
+  double b1 = C(8) + C(10) * l;
+  double b2 = C(11);
+  for(int j = 0; j < Nsamp; ++j) {
+    double s = j;
+    Lorig[j] = a0 + (a1 + a2 * s) * s;
+    Sorig[j] = b0 + (b1 + b2 * s) * s;
+  }
+  for(int j = 0; j < Nsamp; ++j) {
+    double icl = Lorig[j];
+    double ics = Sorig[j];
+    if(icl - 1 < 0 || icl >= Nline || ics - 1 < 0 || ics >= Nsamp) {
+      Res[j] = Fill_value;
+      continue;
+    }
+    int ln = (int) floor(icl + 0.5);
+    int smp = (int) floor(ics + 0.5);
+    // Grab fill values by nearest neighbor, since we can't really
+    // do bilinear interpolation of fill values
+    if(ln < 0 || ln >= Nline || smp < 0 || smp >= Nsamp) {
+      Res[j] = Fill_value;
+      continue;
+    }
+    double v = Rad[ln * Nsamp + smp];
+    if(v < fill_value_threshold) {
+      Res[j] = v;
+      continue;
+    }
+    int i2 = (int) icl;
+    int j2 = (int) ics;
+    if(i2 < 0)
+      i2 +=1;
+    if(j2 < 0)
+      j2 +=1;
+    if(i2+1 >= Nline)
+      i2 -=1;
+    if(j2+1 >= Nsamp)
+      j2 -=1;
+    double t1 = Rad[i2 * Nsamp + j2];
+    double t2 = Rad[i2 * Nsamp + j2 + 1];
+    double t3 = Rad[(i2 + 1) * Nsamp + j2];
+    double t4 = Rad[(i2 + 1) * Nsamp + j2 + 1];
+    double mint = std::min(t1,std::min(t2,std::min(t3,t4)));
+    if(mint < fill_value_threshold) {
+      // Replace fill values with the average of the good values
+      double sum = 0;
+      double count = 0;
+      if(t1 > fill_value_threshold) {
+	sum += t1;
+	count++;
+      }
+      if(t2 > fill_value_threshold) {
+	sum += t2;
+	count++;
+      }
+      if(t3 > fill_value_threshold) {
+	sum += t3;
+	count++;
+      }
+      if(t4 > fill_value_threshold) {
+	sum += t4;
+	count++;
+      }
+      double avg = (count > 0 ? sum / count : mint);
+      if(t1 < fill_value_threshold)
+	t1 = avg;
+      if(t2 < fill_value_threshold)
+	t2 = avg;
+      if(t3 < fill_value_threshold)
+	t3 = avg;
+      if(t4 < fill_value_threshold)
+	t4 = avg;
+    }
+    double t5 = t1 + (t2 - t1) * (ics - j2);
+    double t6 = t3 + (t4 - t3) * (ics - j2);
+    Res[j] = t5 + (t6 - t5) * (icl - i2);
+  }
+}
+
+//-----------------------------------------------------------------------
+/// This generates the L1B_RAD data for one scan of one band. This
+/// is the same as EcostressRadAverage of a
+/// GeometricModelImageHandleFill of EcostressRadApply, but done in
+/// one pass over in memory arrays. This avoids the tiling and virtual
+/// function calls for each pixel in the RasterImage stack.
+///
+/// Dn, Gain and Offset are the data for the full scan (e.g., 256 x
+/// 5400). For the SWIR band, which doesn't have a gain and offset,
+/// just pass in 1 and 0.
+///
+/// Coefficient is the quadratic band to band registration, going from
+/// the registered line and sample (l, s) to the line and sample in
+/// the original data:
+///
+///    line   = c0 + c1 l + c2 s + c3 l^2 + c4 l s  + c5 s^2
+///    sample = c6 + c7 l + c8 s + c9 l^2 + c10 l s + c11 s^2
+///
+/// Coefficient can be empty, in which case we don't do band to band
+/// registration. Fill_value is used for data that we don't see in
+/// the registered image (e.g., FILL_VALUE_NOT_SEEN).
+///
+/// The result is averaged to half the number of lines, with the
+/// same handling of bad data as EcostressRadAverage.
+//-----------------------------------------------------------------------
+
+blitz::Array<double, 2> Ecostress::rad_scan_register_average
+(const blitz::Array<int, 2>& Dn, const blitz::Array<double, 2>& Gain,
+ const blitz::Array<double, 2>& Offset,
+ const blitz::Array<double, 1>& Coefficient,
+ double Fill_value)
+{
+  using namespace blitz;
+  int nline = Dn.rows();
+  int nsamp = Dn.cols();
+  if(Gain.rows() != nline || Gain.cols() != nsamp ||
+     Offset.rows() != nline || Offset.cols() != nsamp)
+    throw GeoCal::Exception("Dn, Gain and Offset need to be the same size");
+  if(nline % 2 != 0)
+    throw GeoCal::Exception("Dn needs to have an even number of lines");
+  if(Coefficient.rows() != 0 && Coefficient.rows() != 12)
+    throw GeoCal::Exception("Coefficient needs to be empty or have 12 values");
+  // Freshly allocated, so this is contiguous
+  Array<double, 2> rad(nline, nsamp);
+  rad = where(Dn < 0 || Gain < -9998 || Offset < -9998,
+	      -9999.0,
+	      Dn * Gain + Offset);
+  Array<double, 2> res(nline / 2, nsamp);
+  Array<double, 1> lorig(nsamp), sorig(nsamp), r1(nsamp), r2(nsamp);
+  for(int i = 0; i < res.rows(); ++i) {
+    register_line(rad.data(), nline, nsamp, 2 * i, Coefficient, Fill_value,
+		  lorig.data(), sorig.data(), r1.data());
+    register_line(rad.data(), nline, nsamp, 2 * i + 1, Coefficient,
+		  Fill_value, lorig.data(), sorig.data(), r2.data());
+    for(int j = 0; j < nsamp; ++j) {
+      double v1 = r1(j);
+      double v2 = r2(j);
+      if(v1 <= fill_value_threshold) {
+	if(v2 <= fill_value_threshold)
+	  res(i,j) = std::max(v1, v2);
+	else
+	  res(i,j) = v2;
+      } else {
+	if(v2 <= fill_value_threshold)
+	  res(i,j) = v1;
+	else
+	  res(i,j) = (v1 + v2) / 2;
+      }
+    }
+  }
+  return res;
+}
@@ -0,0 +1,13 @@
+#ifndef ECOSTRESS_RAD_SCAN_H
+#define ECOSTRESS_RAD_SCAN_H
+#include "geocal/geocal_exception.h"
+#include <blitz/array.h>
+
+namespace Ecostress {
+  blitz::Array<double, 2> rad_scan_register_average
+  (const blitz::Array<int, 2>& Dn, const blitz::Array<double, 2>& Gain,
+   const blitz::Array<double, 2>& Offset,
+   const blitz::Array<double, 1>& Coefficient,
+   double Fill_value);
+}
+#endif
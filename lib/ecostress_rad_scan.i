@@ -0,0 +1,18 @@
+// -*- mode: c++; -*-
+// (Not really c++, but closest emacs mode)
+
+%include "ecostress_common.i"
+
+%{
+#include "ecostress_rad_scan.h"
+%}
+namespace Ecostress {
+  blitz::Array<double, 2> rad_scan_register_average
+  (const blitz::Array<int, 2>& Dn, const blitz::Array<double, 2>& Gain,
+   const blitz::Array<double, 2>& Offset,
+   const blitz::Array<double, 1>& Coefficient,
+   double Fill_value);
+}
+
+// List of things "import *" will include
+%python_export("rad_scan_register_average")
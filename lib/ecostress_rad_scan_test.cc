@@ -0,0 +1,67 @@
+#include "unit_test_support.h"
+#include "ecostress_rad_scan.h"
+#include "ecostress_rad_apply.h"
+#include "ecostress_rad_average.h"
+#include "ecostress_dqi.h"
+#include "geocal/gdal_raster_image.h"
+#include "geocal/sub_raster_image.h"
+
+using namespace Ecostress;
+using namespace blitz;
+
+class RadScanFixture : public GlobalFixture {
+public:
+  RadScanFixture()
+  {
+    dn_name = test_data_dir() + "ECOSTRESS_L1A_PIX_80005_001_20150124T204250_0100_02.h5.expected";
+    gain_name = test_data_dir() + "L1A_RAD_GAIN_80005_001_20150124T204250_0100_02.h5.expected";
+    GeoCal::GdalRasterImage dnimg("HDF5:\"" + dn_name + "\"://UncalibratedDN/b2_image");
+    GeoCal::GdalRasterImage gimg("HDF5:\"" + gain_name + "\"://Gain/b1_gain");
+    GeoCal::GdalRasterImage oimg("HDF5:\"" + gain_name + "\"://Offset/b1_offset");
+    dn.reference(dnimg.read(sline, 0, nline, dnimg.number_sample()));
+    gain.reference(gimg.read_double(sline, 0, nline, dnimg.number_sample()));
+    offset.reference(oimg.read_double(sline, 0, nline, dnimg.number_sample()));
+  }
+  static const int sline = 10 * 256;
+  static const int nline = 256;
+  std::string dn_name, gain_name;
+  Array<int, 2> dn;
+  Array<double, 2> gain, offset;
+};
+
+BOOST_FIXTURE_TEST_SUITE(ecostress_rad_scan, RadScanFixture)
+
+BOOST_AUTO_TEST_CASE(no_registration)
+{
+  Array<double, 1> coeff;
+  Array<double, 2> res = rad_scan_register_average(dn, gain, offset, coeff,
+						   FILL_VALUE_NOT_SEEN);
+  BOOST_CHECK_EQUAL(res.rows(), nline / 2);
+  BOOST_CHECK_EQUAL(res.cols(), dn.cols());
+  // Should match the RasterImage version
+  boost::shared_ptr<GeoCal::RasterImage> rad =
+    boost::make_shared<EcostressRadApply>(dn_name, gain_name, 1);
+  EcostressRadAverage ravg(boost::make_shared<GeoCal::SubRasterImage>
+			   (rad, sline, 0, nline, rad->number_sample()));
+  BOOST_CHECK_MATRIX_CLOSE(res, ravg.read_double(0, 0, ravg.number_line(),
+						 ravg.number_sample()));
+}
+
+BOOST_AUTO_TEST_CASE(shift)
+{
+  Array<double, 1> coeff0;
+  Array<double, 2> res0 = rad_scan_register_average(dn, gain, offset, coeff0,
+						    FILL_VALUE_NOT_SEEN);
+  // Shift by one sample
+  Array<double, 1> coeff(12);
+  coeff = 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0;
+  Array<double, 2> res = rad_scan_register_average(dn, gain, offset, coeff,
+						   FILL_VALUE_NOT_SEEN);
+  int ns = res.cols();
+  BOOST_CHECK_MATRIX_CLOSE_TOL(res(Range(1, toEnd), Range(0, ns - 2)),
+			       res0(Range(1, toEnd), Range(1, ns - 1)), 1e-6);
+  // Last sample isn't seen
+  BOOST_CHECK(all(res(Range::all(), ns - 1) == FILL_VALUE_NOT_SEEN));
+}
+
+BOOST_AUTO_TEST_SUITE_END()
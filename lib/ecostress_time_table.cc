@@ -195,6 +195,49 @@ void EcostressTimeTable::time_with_derivative
   F.sample = 0;
 }
 
+//-------------------------------------------------------------------------
+/// Return the J2000 time for an array of image coordinates, given
+/// as arrays of line and sample. This is the same as calling time for
+/// each point, but we do the whole array at once rather than going
+/// through python for each point.
+//-------------------------------------------------------------------------
+
+blitz::Array<double, 1> EcostressTimeTable::time_j2000
+(const blitz::Array<double, 1>& Line, const blitz::Array<double, 1>& Sample)
+  const
+{
+  if(Line.rows() != Sample.rows())
+    throw Exception("Line and Sample need to be the same size");
+  blitz::Array<double, 1> res(Line.rows());
+  Time t;
+  FrameCoordinate fc;
+  for(int i = 0; i < res.rows(); ++i) {
+    time(ImageCoordinate(Line(i), Sample(i)), t, fc);
+    res(i) = t.j2000();
+  }
+  return res;
+}
+
+//-------------------------------------------------------------------------
+/// Return the J2000 time for the lines Start_line to
+/// Start_line + Number_line - 1, at the given sample. With the default
+/// sample of 0 this is the line start time.
+//-------------------------------------------------------------------------
+
+blitz::Array<double, 1> EcostressTimeTable::line_time_j2000
+(int Start_line, int Number_line, double Sample) const
+{
+  range_min_check(Number_line, 0);
+  blitz::Array<double, 1> res(Number_line);
+  Time t;
+  FrameCoordinate fc;
+  for(int i = 0; i < res.rows(); ++i) {
+    time(ImageCoordinate(Start_line + i, Sample), t, fc);
+    res(i) = t.j2000();
+  }
+  return res;
+}
+
 void EcostressTimeTable::print(std::ostream& Os) const
 {
   Os << "EcostressTimeTable:\n"
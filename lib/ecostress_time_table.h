@@ -134,6 +134,11 @@ public:
 //-------------------------------------------------------------------------
   int line_to_scan_index(double Line) const
   { return (int) floor(Line / number_line_scan()); }
+
+  blitz::Array<double, 1> time_j2000(const blitz::Array<double, 1>& Line,
+				     const blitz::Array<double, 1>& Sample) const;
+  blitz::Array<double, 1> line_time_j2000(int Start_line, int Number_line,
+					  double Sample = 0) const;
 protected:
   EcostressTimeTable() : mirror_rpm_(25.4), frame_time_(0.0000321875),
 			 number_filled_time_(0) { }
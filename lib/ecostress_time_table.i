@@ -32,6 +32,10 @@ public:
   void scan_index_to_line(int Scan_index, int& OUTPUT, int& OUTPUT) const;
   int line_to_scan_index(double Line) const;
   bool close_to_scan_edge(int Line, int Width=3) const;
+  blitz::Array<double, 1> time_j2000(const blitz::Array<double, 1>& Line,
+				     const blitz::Array<double, 1>& Sample) const;
+  blitz::Array<double, 1> line_time_j2000(int Start_line, int Number_line,
+					  double Sample = 0) const;
   %python_attribute(averaging_done, bool);
   %python_attribute(number_line_scan, int);
   %python_attribute(number_good_scan, int);
@@ -140,6 +140,35 @@ BOOST_AUTO_TEST_CASE(image_coordinate_jac_test)
   BOOST_CHECK_MATRIX_CLOSE_TOL(jac_calc, jac_fd, 1e-2);
 }
 
+BOOST_AUTO_TEST_CASE(time_j2000_test)
+{
+  GeoCal::Time tstart = GeoCal::Time::parse_time("2015-01-24T20:42:52Z");
+  EcostressTimeTable tt(tstart);
+  EcostressTimeTableSubset tt2(tt, 100, 200);
+  GeoCal::Time t;
+  GeoCal::FrameCoordinate fc;
+  blitz::Array<double, 1> tline = tt.line_time_j2000(120, 20);
+  blitz::Array<double, 1> tline2 = tt2.line_time_j2000(120, 20, 10.5);
+  BOOST_CHECK_EQUAL(tline.rows(), 20);
+  for(int i = 0; i < tline.rows(); ++i) {
+    tt.time(GeoCal::ImageCoordinate(120 + i, 0), t, fc);
+    BOOST_CHECK_CLOSE(tline(i), t.j2000(), 1e-8);
+    tt2.time(GeoCal::ImageCoordinate(120 + i, 10.5), t, fc);
+    BOOST_CHECK_CLOSE(tline2(i), t.j2000(), 1e-8);
+  }
+  blitz::Array<double, 1> ln(3), smp(3);
+  ln = 0, 127.4, 300;
+  smp = 20.4, 0, 1000;
+  blitz::Array<double, 1> tpt = tt.time_j2000(ln, smp);
+  blitz::Array<double, 1> tpt2 = tt2.time_j2000(ln, smp);
+  for(int i = 0; i < tpt.rows(); ++i) {
+    tt.time(GeoCal::ImageCoordinate(ln(i), smp(i)), t, fc);
+    BOOST_CHECK_CLOSE(tpt(i), t.j2000(), 1e-8);
+    tt.time(GeoCal::ImageCoordinate(ln(i), smp(i) + 100), t, fc);
+    BOOST_CHECK_CLOSE(tpt2(i), t.j2000(), 1e-8);
+  }
+}
+
 BOOST_AUTO_TEST_CASE(read_file)
 {
   EcostressTimeTable tt(test_data_dir() + "ECOSTRESS_L1A_PIX_80005_001_20150124T204250_0100_02.h5.expected");
@@ -5,6 +5,9 @@
 #include "geocal/ostream_pad.h"
 #include "geocal/vicar_raster_image.h"
 #include "geocal/simple_dem.h"
+#include "geocal/serialize_function.h"
+#include <exception>
+#include <thread>
 
 using namespace Ecostress;
 
@@ -27,6 +30,10 @@ void GroundCoordinateArray::serialize(Archive & ar, const unsigned int version)
   ar & GEOCAL_NVP_(igc)
     & GEOCAL_NVP(include_angle) & GEOCAL_NVP(nsub_line)
     & GEOCAL_NVP(nsub_sample);
+  // Older version didn't have number_thread_, we default to 1 in the
+  // default constructor.
+  if(version > 0)
+    ar & GEOCAL_NVP_(number_thread);
   boost::serialization::split_member(ar, *this, version);
 }
 
@@ -71,9 +78,6 @@ void GroundCoordinateArray::init()
 	  camera_slv(i,j,k) = cam->sc_look_vector(GeoCal::FrameCoordinate(2*(i + (double) j / nsub_line), (double) k / nsub_sample), b);
 	else
 	  camera_slv(i,j,k) = cam->sc_look_vector(GeoCal::FrameCoordinate(i + (double) j / nsub_line, (double) k / nsub_sample), b);
-  dist.resize(nl, nsub_line, nsub_sample);
-  res.resize(nl, igc_->number_sample(), nsub_line, nsub_sample,
-	     (include_angle ? 7 : 3));
 }
 
 //-------------------------------------------------------------------------
@@ -292,7 +296,7 @@ blitz::Array<double,5> GroundCoordinateArray::ground_coor_arr() const
       blitz::Range::all(), blitz::Range::all()) =
       ground_coor_scan_arr(lstart, lend-lstart);
   }
-  return res;
+  return r;
 }
 
 //-------------------------------------------------------------------------
@@ -311,16 +315,21 @@ blitz::Array<double,5> GroundCoordinateArray::ground_coor_arr() const
 /// array with coordinates as
 /// latitude, longitude, height, view_zenith, view_azimuth,
 /// solar_zenith, solar_azimuth.
+///
+/// This uses number_thread threads. The returned array is newly
+/// allocated for each call.
 //-------------------------------------------------------------------------
 
 blitz::Array<double,5>
 GroundCoordinateArray::ground_coor_scan_arr
 (int Start_line, int Number_line) const
 {
-  int ms = igc_->number_sample() / 2;
+  int nsamp = igc_->number_sample();
+  int ms = nsamp / 2;
   GeoCal::Time t;
   GeoCal::FrameCoordinate fc;
   tt->time(GeoCal::ImageCoordinate(Start_line, ms), t, fc);
+  int sl, el;
   if(tt->averaging_done())
     sl = (int) floor(fc.line / 2 + 0.5);
   else
@@ -329,44 +338,105 @@ GroundCoordinateArray::ground_coor_scan_arr
     el = (int) tt->number_line_scan();
   else
     el = std::min(sl + Number_line, (int) tt->number_line_scan());
-  ground_coor_arr_samp(Start_line, ms, true);
-  blitz::Array<double, 3> dist_middle(dist.copy());
-  for(int smp = ms + 1; smp < igc_->number_sample(); ++smp)
-    ground_coor_arr_samp(Start_line, smp);
-  dist = dist_middle;
-  for(int smp = ms - 1; smp >= 0; --smp)
-    ground_coor_arr_samp(Start_line, smp);
-  return blitz::Array<double, 5>(res(blitz::Range(sl, el-1),
-				     blitz::Range::all(),
-				     blitz::Range::all(),
-				     blitz::Range::all(),
-				     blitz::Range::all()));
+  blitz::Array<double, 5> res(std::max(el - sl, 0), nsamp, nsub_line,
+			      nsub_sample, (include_angle ? 7 : 3));
+  std::lock_guard<std::mutex> lock(igc_mutex);
+  // The orbit data and solar look vector only depend on the sample,
+  // not the line in the scan. Calculate these up front in this
+  // thread, so the orbit caches are only touched by one thread.
+  std::vector<boost::shared_ptr<GeoCal::QuaternionOrbitData> > od(nsamp);
+  std::vector<GeoCal::CartesianFixedLookVector> slv(nsamp);
+  auto igc1 = boost::dynamic_pointer_cast<EcostressImageGroundConnection>(igc_);
+  auto igc2 = boost::dynamic_pointer_cast<EcostressImageGroundConnectionSubset>(igc_);
+  int scan_index = tt->line_to_scan_index(Start_line);
+  for(int smp = 0; smp < nsamp; ++smp) {
+    tt->time(GeoCal::ImageCoordinate(Start_line, smp), t, fc);
+    if(igc1)
+      od[smp] = igc1->orbit_data(t, scan_index, smp);
+    else if(igc2)
+      od[smp] = igc2->orbit_data(t, scan_index, smp);
+    else
+      throw GeoCal::Exception("Need EcostressImageGroundConnection or EcostressImageGroundConnectionSubset");
+    if(include_angle)
+      slv[smp] = GeoCal::CartesianFixedLookVector::solar_look_vector(t);
+  }
+  int nthread = std::max(std::min(number_thread_, nsamp), 1);
+  if(nthread == 1) {
+    ground_coor_arr_block(igc_, od, slv, sl, el, 0, nsamp, ms, res);
+    return res;
+  }
+  while((int) igc_thread.size() < nthread - 1)
+    igc_thread.push_back
+      (GeoCal::serialize_read_string<GeoCal::ImageGroundConnection>
+       (GeoCal::serialize_write_string(igc_)));
+  // Divide the samples into contiguous blocks, and start each block
+  // at the sample closest to the middle. The first block is done in
+  // this thread.
+  std::vector<std::thread> thread;
+  std::vector<std::exception_ptr> error(nthread);
+  auto run_block = [&](int i) {
+    int bstart = (int) ((long) nsamp * i / nthread);
+    int bend = (int) ((long) nsamp * (i + 1) / nthread);
+    int binit = std::min(std::max(ms, bstart), bend - 1);
+    try {
+      ground_coor_arr_block((i == 0 ? igc_ : igc_thread[i - 1]), od, slv,
+			    sl, el, bstart, bend, binit, res);
+    } catch(...) {
+      error[i] = std::current_exception();
+    }
+  };
+  for(int i = 1; i < nthread; ++i)
+    thread.emplace_back(run_block, i);
+  run_block(0);
+  for(auto& th : thread)
+    th.join();
+  for(auto& e : error)
+    if(e)
+      std::rethrow_exception(e);
+  return res;
+}
+
+//-------------------------------------------------------------------------
+/// Calculate the ground coordinates for the samples Start_sample to
+/// End_sample - 1. We do a full ray cast at Initial_sample, and then
+/// work out from there in each direction using the previous sample as
+/// the starting guess. Od and Slv are the orbit data and solar look
+/// vector for each sample of the scan.
+//-------------------------------------------------------------------------
+
+void GroundCoordinateArray::ground_coor_arr_block
+(const boost::shared_ptr<GeoCal::ImageGroundConnection>& Igc,
+ const std::vector<boost::shared_ptr<GeoCal::QuaternionOrbitData> >& Od,
+ const std::vector<GeoCal::CartesianFixedLookVector>& Slv,
+ int Sl, int El, int Start_sample, int End_sample,
+ int Initial_sample, blitz::Array<double, 5>& Res) const
+{
+  if(Start_sample >= End_sample)
+    return;
+  blitz::Array<double, 3> dist(cam->number_line(b), nsub_line, nsub_sample);
+  ground_coor_arr_samp(Igc, *Od[Initial_sample], Slv[Initial_sample],
+		       Initial_sample, Sl, El, dist, Res, true);
+  blitz::Array<double, 3> dist_initial(dist.copy());
+  for(int smp = Initial_sample + 1; smp < End_sample; ++smp)
+    ground_coor_arr_samp(Igc, *Od[smp], Slv[smp], smp, Sl, El, dist, Res);
+  dist = dist_initial;
+  for(int smp = Initial_sample - 1; smp >= Start_sample; --smp)
+    ground_coor_arr_samp(Igc, *Od[smp], Slv[smp], smp, Sl, El, dist, Res);
 }
 
-void GroundCoordinateArray::ground_coor_arr_samp(int Start_line, int Sample,
-						 bool Initial_samp) const
+void GroundCoordinateArray::ground_coor_arr_samp
+(const boost::shared_ptr<GeoCal::ImageGroundConnection>& Igc,
+ const GeoCal::QuaternionOrbitData& Od,
+ const GeoCal::CartesianFixedLookVector& Slv, int Sample, int Sl, int El,
+ blitz::Array<double, 3>& Dist, blitz::Array<double, 5>& Res,
+ bool Initial_samp) const
 {
   using namespace GeoCal;
-  Time t;
-  FrameCoordinate fc;
-  tt->time(ImageCoordinate(Start_line, Sample), t, fc);
-  boost::shared_ptr<QuaternionOrbitData> od;
-  auto igc1 = boost::dynamic_pointer_cast<EcostressImageGroundConnection>(igc_);
-  auto igc2 = boost::dynamic_pointer_cast<EcostressImageGroundConnectionSubset>(igc_);
-  if(igc1)
-    od = igc1->orbit_data(t, tt->line_to_scan_index(Start_line), Sample);
-  else if(igc2)
-    od = igc2->orbit_data(t, tt->line_to_scan_index(Start_line), Sample);
-  else
-    throw GeoCal::Exception("Need EcostressImageGroundConnection or EcostressImageGroundConnectionSubset");
-  boost::shared_ptr<CartesianFixed> cf = od->position_cf();
-  CartesianFixedLookVector slv;
-  if(include_angle)
-    slv = CartesianFixedLookVector::solar_look_vector(t);
-  for(int i = sl; i < el; ++i) 
+  boost::shared_ptr<CartesianFixed> cf = Od.position_cf();
+  for(int i = Sl; i < El; ++i) 
     for(int j = 0; j < nsub_line; ++j)
       for(int k = 0; k < nsub_sample; ++k) {
-	CartesianFixedLookVector lv = od->cf_look_vector(camera_slv(i, j, k));
+	CartesianFixedLookVector lv = Od.cf_look_vector(camera_slv(i, j, k));
 	boost::shared_ptr<CartesianFixed> pt;
 	// This was fixed in geocal
 	// (c5dfb5c487dd43eb07d49c93558eea1207ff0000).
@@ -382,16 +452,16 @@ void GroundCoordinateArray::ground_coor_arr_samp(int Start_line, int Sample,
 	// that have this issue. See git Issue #138
 	try {	
 	  if(Initial_samp)
-	    pt = igc_->dem().intersect(*cf, lv, resolution,
-				       max_height);
+	    pt = Igc->dem().intersect(*cf, lv, resolution,
+				      max_height);
 	  else {
-	    double start_dist = dist(i, j, k);
-	    if(i - 1 >= sl)
-	      start_dist = std::min(start_dist, dist(i-1, j, k));
-	    if(i + 1 < el)
-	      start_dist = std::min(start_dist, dist(i+1, j, k));
-	    pt = igc_->dem().intersect_start_length(*cf, lv, resolution,
-						    start_dist);
+	    double start_dist = Dist(i, j, k);
+	    if(i - 1 >= Sl)
+	      start_dist = std::min(start_dist, Dist(i-1, j, k));
+	    if(i + 1 < El)
+	      start_dist = std::min(start_dist, Dist(i+1, j, k));
+	    pt = Igc->dem().intersect_start_length(*cf, lv, resolution,
+						   start_dist);
 	  }
 	} catch(const Exception& e) {
 	  // Work around error in SrtmDem
@@ -400,18 +470,19 @@ void GroundCoordinateArray::ground_coor_arr_samp(int Start_line, int Sample,
 	  pt = GeoCal::SimpleDem().intersect(*cf, lv, resolution,
 					     max_height);
 	}
-	pt->lat_lon_height(res(i, Sample, j, k, 0), res(i, Sample, j, k, 1),
-			   res(i, Sample, j, k, 2));
-	dist(i, j, k) = sqrt(sqr(pt->position[0] - cf->position[0]) +
+	int r = i - Sl;
+	pt->lat_lon_height(Res(r, Sample, j, k, 0), Res(r, Sample, j, k, 1),
+			   Res(r, Sample, j, k, 2));
+	Dist(i, j, k) = sqrt(sqr(pt->position[0] - cf->position[0]) +
 			     sqr(pt->position[1] - cf->position[1]) +
 			     sqr(pt->position[2] - cf->position[2]));
 	if(include_angle) {
 	  LnLookVector vln(CartesianFixedLookVector(*pt,*cf),*pt);
-	  res(i,Sample,j, k, 3) = vln.view_zenith();
-	  res(i,Sample,j, k, 4) = vln.view_azimuth();
-	  LnLookVector sln(slv, *pt);
-	  res(i,Sample,j, k, 5) = sln.view_zenith();
-	  res(i,Sample,j, k, 6) = sln.view_azimuth();
+	  Res(r,Sample,j, k, 3) = vln.view_zenith();
+	  Res(r,Sample,j, k, 4) = vln.view_azimuth();
+	  LnLookVector sln(Slv, *pt);
+	  Res(r,Sample,j, k, 5) = sln.view_zenith();
+	  Res(r,Sample,j, k, 6) = sln.view_azimuth();
 	}
       }
 }
@@ -4,6 +4,7 @@
 #include "ecostress_time_table.h"
 #include "geocal/memory_raster_image.h"
 #include "geocal/vicar_lite_file.h"
+#include <mutex>
 
 namespace Ecostress {
 /****************************************************************//**
@@ -28,12 +29,24 @@ namespace Ecostress {
   have a push whisk broom. So we use different logic for coming up
   with the initial guess as the ray length, but it is the same
   idea. 
+
+  ground_coor_scan_arr can optionally use multiple threads
+  (see number_thread). The samples of a scan are divided into
+  contiguous blocks, one per thread, and each block starts with a
+  full ray cast at the sample closest to nadir and then works
+  outward like the single threaded version. The orbit data for each
+  sample is calculated up front before starting the threads, and
+  each thread after the first uses its own copy of the
+  ImageGroundConnection for the DEM, since the orbit and DEM have
+  internal caches that aren't thread safe. The results agree with
+  the single threaded calculation to within the ray casting
+  resolution.
 *******************************************************************/
 
 class GroundCoordinateArray : public GeoCal::Printable<GroundCoordinateArray>,
 			      boost::noncopyable {
-// We can't copy this because of the result_cache. We could create a
-// copy constructor if this becomes an issue.
+// We can't copy this because of the per thread copies of the igc. We
+// could create a copy constructor if this becomes an issue.
 public:
 //-------------------------------------------------------------------------
 /// Constructor.
@@ -47,7 +60,7 @@ public:
 			bool Include_angle=false, int Nsub_line = 1,
 			int Nsub_sample = 1)
     : igc_(Igc), include_angle(Include_angle), nsub_line(Nsub_line),
-      nsub_sample(Nsub_sample){ init(); }
+      nsub_sample(Nsub_sample), number_thread_(1) { init(); }
   virtual ~GroundCoordinateArray() {}
   virtual void print(std::ostream& Os) const;
 
@@ -57,6 +70,19 @@ public:
   
   const boost::shared_ptr<GeoCal::ImageGroundConnection>&  igc() const
   { return igc_;}
+
+//-------------------------------------------------------------------------
+/// Number of threads to use in ground_coor_scan_arr. The default is
+/// 1, which is what you want if you are already running scans in
+/// parallel in separate processes.
+//-------------------------------------------------------------------------
+
+  int number_thread() const { return number_thread_; }
+  void number_thread(int V)
+  {
+    range_min_check(V, 1);
+    number_thread_ = V;
+  }
   blitz::Array<double,5> ground_coor_arr() const;
   blitz::Array<double,5>
   ground_coor_scan_arr(int Start_line, int Number_line=-1) const;
@@ -82,11 +108,14 @@ private:
   boost::shared_ptr<GeoCal::ImageGroundConnection> igc_;
   bool include_angle;
   int nsub_line, nsub_sample;
-  mutable blitz::Array<double, 5> res; // Cache of results for ground_coor_arr
-  mutable blitz::Array<double, 3> dist; // Last distance we went with
-					// ray casting
-  mutable int sl, el;			// Start frame line and end
-					// frame line for processing.
+  int number_thread_;
+  // Copies of igc_ for each thread after the first, created the
+  // first time we need them.
+  mutable std::vector<boost::shared_ptr<GeoCal::ImageGroundConnection> >
+  igc_thread;
+  // Only one call to ground_coor_scan_arr at a time uses igc_ and
+  // igc_thread.
+  mutable std::mutex igc_mutex;
   // The ScLookVector is identical for all samples, so we calculate
   // once and cache
   blitz::Array<GeoCal::ScLookVector, 3> camera_slv;
@@ -97,9 +126,19 @@ private:
   boost::shared_ptr<EcostressTimeTable> tt;
   double resolution, max_height;
   void init();
-  void ground_coor_arr_samp(int Start_line, int Sample,
-			    bool initial_samp = false) const;
-  GroundCoordinateArray() {}
+  void ground_coor_arr_block
+  (const boost::shared_ptr<GeoCal::ImageGroundConnection>& Igc,
+   const std::vector<boost::shared_ptr<GeoCal::QuaternionOrbitData> >& Od,
+   const std::vector<GeoCal::CartesianFixedLookVector>& Slv,
+   int Sl, int El, int Start_sample, int End_sample,
+   int Initial_sample, blitz::Array<double, 5>& Res) const;
+  void ground_coor_arr_samp
+  (const boost::shared_ptr<GeoCal::ImageGroundConnection>& Igc,
+   const GeoCal::QuaternionOrbitData& Od,
+   const GeoCal::CartesianFixedLookVector& Slv, int Sample, int Sl, int El,
+   blitz::Array<double, 3>& Dist, blitz::Array<double, 5>& Res,
+   bool Initial_samp = false) const;
+  GroundCoordinateArray() : number_thread_(1) {}
   friend class boost::serialization::access;
   template<class Archive>
   void serialize(Archive & ar, const unsigned int version);
@@ -111,6 +150,7 @@ private:
 }
 
 BOOST_CLASS_EXPORT_KEY(Ecostress::GroundCoordinateArray);
+BOOST_CLASS_VERSION(Ecostress::GroundCoordinateArray, 1);
 #endif
 
   
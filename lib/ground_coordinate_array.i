@@ -13,6 +13,31 @@
 %import "vicar_lite_file.i"
 
 %ecostress_shared_ptr(Ecostress::GroundCoordinateArray);
+
+// ground_coor_scan_arr and ground_coor_arr don't touch any python
+// objects, so release the GIL while they run. This lets other python
+// threads run while we calculate. We need to catch exceptions before
+// getting the GIL back, and then translate them the same way the
+// default exception handling does.
+%define %ecostress_release_gil(NAME)
+%exception NAME {
+  std::string ecostress_error;
+  bool ecostress_have_error = false;
+  Py_BEGIN_ALLOW_THREADS
+  try {
+    $action
+  } catch(const std::exception& e) {
+    ecostress_have_error = true;
+    ecostress_error = e.what();
+  }
+  Py_END_ALLOW_THREADS
+  if(ecostress_have_error)
+    SWIG_exception(SWIG_RuntimeError, ecostress_error.c_str());
+}
+%enddef
+
+%ecostress_release_gil(Ecostress::GroundCoordinateArray::ground_coor_scan_arr);
+%ecostress_release_gil(Ecostress::GroundCoordinateArray::ground_coor_arr);
 namespace Ecostress {
 class GroundCoordinateArray : public GeoCal::GenericObject {
 public:
@@ -20,6 +45,7 @@ public:
   (const boost::shared_ptr<GeoCal::ImageGroundConnection>& Igc,
    bool Include_angle=false, int Nsub_line = 1, int Nsub_sample = 1);
   %python_attribute(igc, boost::shared_ptr<GeoCal::ImageGroundConnection>);
+  %python_attribute_with_set(number_thread, int);
   blitz::Array<double,5> ground_coor_arr() const;
   blitz::Array<double,5>
   ground_coor_scan_arr(int Start_line, int Number_line=-1) const;
@@ -28,6 +28,31 @@ BOOST_AUTO_TEST_CASE(basic_test)
   BOOST_CHECK(distance(pt_hres, pt) < 1.0);
 }
 
+BOOST_AUTO_TEST_CASE(thread_test)
+{
+  GroundCoordinateArray gca(igc, true);
+  GroundCoordinateArray gca_thread(igc, true);
+  BOOST_CHECK_EQUAL(gca_thread.number_thread(), 1);
+  gca_thread.number_thread(4);
+  BOOST_CHECK_EQUAL(gca_thread.number_thread(), 4);
+  blitz::Array<double, 5> res = gca.ground_coor_scan_arr(4, 20);
+  blitz::Array<double, 5> res_thread = gca_thread.ground_coor_scan_arr(4, 20);
+  BOOST_CHECK_EQUAL(res_thread.rows(), 20);
+  BOOST_CHECK_EQUAL(res_thread.cols(), 5400);
+  BOOST_CHECK_EQUAL(res_thread.shape()[4], 7);
+  for(int i = 0; i < res.rows(); i += 5)
+    for(int j = 0; j < res.cols(); j += 50) {
+      GeoCal::Geodetic pt(res(i,j,0,0,0),res(i,j,0,0,1),res(i,j,0,0,2));
+      GeoCal::Geodetic pt_thread(res_thread(i,j,0,0,0),res_thread(i,j,0,0,1),
+				 res_thread(i,j,0,0,2));
+      BOOST_CHECK(distance(pt, pt_thread) < 1.0);
+    }
+  // Each call returns a new array, so earlier results aren't
+  // overwritten.
+  blitz::Array<double, 5> res2 = gca_thread.ground_coor_scan_arr(128 + 4, 20);
+  BOOST_CHECK_CLOSE(res_thread(0,20,0,0,0), res(0,20,0,0,0), 1e-4);
+}
+
 BOOST_AUTO_TEST_CASE(projection_test)
 {
   // Don't normally run this, it takes a bit of time for a unit test
@@ -73,11 +98,13 @@ BOOST_AUTO_TEST_CASE(serialization)
 {
   boost::shared_ptr<GroundCoordinateArray> gca =
     boost::make_shared<GroundCoordinateArray>(igc);
+  gca->number_thread(3);
   std::string d = GeoCal::serialize_write_string(gca);
   if(false)
     std::cerr << d;
   boost::shared_ptr<GroundCoordinateArray> igcr =
     GeoCal::serialize_read_string<GroundCoordinateArray>(d);
+  BOOST_CHECK_EQUAL(igcr->number_thread(), 3);
 }
 
 BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import queue
+import threading
+from loguru import logger
+from typing import Any, Callable
+
+
+class BackgroundWriter(object):
+    """This runs output jobs (e.g., writing a scene to HDF5 files) in a
+    background thread, so the caller can go on to produce the next set of
+    data while the previous one is being written and compressed.
+
+    At most max_in_flight jobs are queued or running at a time. submit
+    blocks once we reach that, which gives back-pressure so memory use
+    stays bounded if writing is slower than producing. If max_in_flight
+    is 0, jobs are just run immediately in the calling thread.
+
+    An exception in a job is raised again in the calling thread by the
+    next call to submit or by close. Jobs submitted after a failure are
+    skipped."""
+
+    def __init__(self, max_in_flight: int = 2) -> None:
+        self.max_in_flight = max_in_flight
+        self.exception: BaseException | None = None
+        self.thread: threading.Thread | None = None
+        if max_in_flight > 0:
+            self.slots = threading.BoundedSemaphore(max_in_flight)
+            self.queue: queue.Queue = queue.Queue()
+            self.thread = threading.Thread(
+                target=self._run, name="BackgroundWriter", daemon=True
+            )
+            self.thread.start()
+
+    @property
+    def asynchronous(self) -> bool:
+        """True if jobs run in the background. If so, the caller needs
+        to pass copies of any buffers it will reuse."""
+        return self.thread is not None
+
+    def _run(self) -> None:
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            func, args, kwargs = job
+            try:
+                if self.exception is None:
+                    func(*args, **kwargs)
+            except BaseException as e:
+                self.exception = e
+            finally:
+                self.slots.release()
+
+    def _check(self) -> None:
+        if self.exception is not None:
+            raise self.exception
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> None:
+        """Run func(*args, **kwargs), in the background if we are
+        asynchronous."""
+        self._check()
+        if self.thread is None:
+            func(*args, **kwargs)
+            return
+        self.slots.acquire()
+        self._check()
+        self.queue.put((func, args, kwargs))
+
+    def close(self) -> None:
+        """Wait for all the jobs to finish, and stop the thread."""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+        self._check()
+
+    def __enter__(self) -> BackgroundWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Already have an error, so we let that propagate. But log any
+            # error from the jobs so it isn't lost.
+            try:
+                self.close()
+            except Exception as e:
+                logger.error(f"BackgroundWriter job failed: {e}")
+
+
+__all__ = ["BackgroundWriter"]
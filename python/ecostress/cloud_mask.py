@@ -2,6 +2,7 @@ from __future__ import annotations
 import numpy as np
 import geocal  # type: ignore
 from .cloud_processing import CloudProcessing
+from .worker_context import WorkerContext
 from ecostress_swig import (  # type: ignore
     EcostressTimeTable,
     GroundCoordinateArray,
@@ -36,14 +37,20 @@ class CloudMask:
         l1_osp_dir: str | os.PathLike,
         rad_lut_fname: str | os.PathLike | None = None,
         b11_lut_file_pattern: str | os.PathLike | None = None,
+        number_thread: int = 1,
     ) -> None:
         """Initialize, passing in the l1b radiance file we use.
 
         By default we get the CloudProcessing parameter files from
         the L1 OSP directory, but you can optionally supply these
         (e.g., comparing against old data).
+
+        number_thread is the number of threads the GroundCoordinateArray
+        uses to calculate each scan, if we need to calculate the
+        latitude and longitude.
         """
         self.radfname = radfname
+        self.number_thread = number_thread
         self._cloud: np.ndarray | None = None
         self._cloud_conf: np.ndarray | None = None
         self.l1_osp_dir = Path(l1_osp_dir)
@@ -71,23 +78,28 @@ class CloudMask:
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         start_line, number_line = it
         try:
-            # Note res here refers to an internal cache array of gc_arr
             res = self.gc_arr.ground_coor_scan_arr(start_line, number_line)
             logger.info(f"Done with [{start_line}, {start_line + res.shape[0]}]")
         except RuntimeError:
             res = np.empty((number_line, self.igc.image.number_sample, 1, 1, 3))
             res[:] = FILL_VALUE_BAD_OR_MISSING
             logger.info(f"Skipping [{start_line}, {start_line + res.shape[0]}]")
-        # Note the copy() here is very important. As an optimization,
-        # ground_coor_scan_arr return a reference to an internal cache
-        # variable. This array gets overwritten in the next call to
-        # ground_coor_scan_arr. So we need to explicitly copy anything
-        # we want to keep.
+        # Copy so we return contiguous arrays, rather than views that
+        # keep all of res around.
         lat = res[:, :, 0, 0, 0].copy()
         lon = res[:, :, 0, 0, 1].copy()
         height = res[:, :, 0, 0, 2].copy()
         return (lat, lon, height)
 
+    @staticmethod
+    def _loc_worker(
+        it: tuple[WorkerContext, int, int],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Variation of _loc_parallel_func for use with a pool, where the
+        # CloudMask comes from a WorkerContext
+        ctx, start_line, number_line = it
+        return ctx.obj._loc_parallel_func((start_line, number_line))
+
     def _fill_in(
         self,
         igc: geocal.ImageGroundConnection | None,
@@ -126,6 +138,7 @@ class CloudMask:
         if lat is None or lon is None or height is None:
             assert igc is not None
             self.gc_arr = GroundCoordinateArray(igc)
+            self.gc_arr.number_thread = self.number_thread
             self.igc = igc
             it = []
             for i in range(self.igc.number_scan):
@@ -134,7 +147,8 @@ class CloudMask:
             if pool is None:
                 r = list(map(self._loc_parallel_func, it))
             else:
-                r = pool.map(self._loc_parallel_func, it)
+                with WorkerContext(self) as ctx:
+                    r = pool.map(CloudMask._loc_worker, [(ctx, *t) for t in it])
             lat = np.vstack([rv[0] for rv in r])
             lon = np.vstack([rv[1] for rv in r])
             height = np.vstack([rv[2] for rv in r])
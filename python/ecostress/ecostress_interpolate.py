@@ -7,7 +7,10 @@ from ecostress_swig import (  # type: ignore
     DQI_NOT_SEEN,
     fill_value_threshold,
 )
+from .shared_array import SharedArray
 from loguru import logger
+import scipy.spatial  # type: ignore
+from multiprocessing import Pool
 import typing
 
 if typing.TYPE_CHECKING:
@@ -39,14 +42,11 @@ def _find_horizontal_stripes(
     else:
         raise ValueError("n_bands must be 3 or 5")
 
-    # make a copy of the dataset so we do not modify the original
-    dataset = dataset.copy()
-
-    # remove bad
-    dataset[dataset < fill_value_threshold] = np.nan
-
     for band in bands_to_process:
-        band_data = dataset[:, :, band]
+        # make a copy of the band so we do not modify the original, and
+        # remove bad. We only copy one band at a time to limit memory use.
+        band_data = dataset[:, :, band].astype(np.float64)
+        band_data[band_data < fill_value_threshold] = np.nan
 
         # Compute row-wise differences to detect rapid intensity changes
         row_diff = np.abs(np.diff(band_data, axis=0))
@@ -82,6 +82,193 @@ def _find_horizontal_stripes(
     return data_quality
 
 
+class _GoodPixelIndex(object):
+    """Scene wide index of the pixels that are DQI_GOOD in each band, used
+    to pull the training set for a KNN window.
+
+    The windows overlap heavily (by default each pixel is in 4 windows),
+    and each window needs the pixels good in the target band and all
+    the selected feature bands. Rather than comparing the data quality
+    against DQI_GOOD for every window, we build the good mask for every
+    band once for the whole scene, and a window just combines its piece
+    of the bands it needs. Only the target band changes as we
+    interpolate, and only from not good to DQI_INTERPOLATED, so the
+    index stays valid for the whole interpolation."""
+
+    def __init__(self, data_quality: np.ndarray) -> None:
+        self.good = data_quality == DQI_GOOD
+
+    def window(
+        self, bands: typing.Iterable[int], rs: slice, cs: slice
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rows and columns of the good pixels in the window, in row major
+        order (the same order as indexing with a boolean mask)."""
+        i, j = np.nonzero(np.all(self.good[rs, cs][:, :, list(bands)], axis=2))
+        return i + rs.start, j + cs.start
+
+    def good_fraction(self, band: int, rs: slice, cs: slice) -> float:
+        """Fraction of the window that is good in the given band."""
+        return float(np.mean(self.good[rs, cs, band]))
+
+
+class _NeighborTiles(object):
+    """Neighbor search for the KNN windows, built once for the scene
+    rather than fitting a new KNN model for every window.
+
+    The scene is divided into square tiles of tile_size pixels. For each
+    combination of target band and feature bands we build a kd-tree over
+    the feature values of the pixels in a tile that are DQI_GOOD in all
+    those bands. A window is covered by the tiles whose centers fall
+    inside it, and its nearest neighbors are the nearest of the
+    neighbors found in each of those tiles. With the default block_step
+    of window_size // 2 the tiles are the window blocks, so this is the
+    window short a row and a column.
+
+    Like the per window fit, we cap the number of training pixels. Each
+    tile keeps at most max_samples randomly chosen pixels, seeded from
+    random_state and the tile so the result doesn't depend on the order
+    we build the trees in.
+
+    The trees are built the first time they are needed. The blocks are
+    processed in order for each band, so once a block starts below a row
+    of tiles we don't need that row again, and we drop the trees to
+    limit the memory used. Doing the blocks out of order still works, it
+    just rebuilds trees."""
+
+    def __init__(
+        self,
+        dataset: np.ndarray,
+        good_index: _GoodPixelIndex,
+        tile_size: int,
+        max_samples: int,
+        random_state: int = 1234,
+        n_jobs: int = 1,
+    ) -> None:
+        self.dataset = dataset
+        self.good_index = good_index
+        self.tile_size = tile_size
+        self.max_samples = max_samples
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        # See kneighbors. Found by timing synthetic striped scenes.
+        self.merge_ratio = 8.0
+        self.band = -1
+        self.trees: dict[
+            tuple[tuple[int, ...], int, int],
+            tuple[scipy.spatial.cKDTree | None, np.ndarray, int],
+        ] = {}
+
+    def _tiles(self, start: int, stop: int, n: int) -> list[int]:
+        """Tiles along one axis of length n with their center in
+        [start, stop). If the window is smaller than a tile this might not
+        be any, in which case we use the tile containing the window
+        center."""
+        ts = self.tile_size
+        res = [
+            t
+            for t in range(start // ts, (stop - 1) // ts + 1)
+            if start <= (t * ts + min(n, (t + 1) * ts) - 1) / 2 < stop
+        ]
+        return res if res else [((start + stop - 1) // 2) // ts]
+
+    def _tree(
+        self, bands: tuple[int, ...], tr: int, tc: int
+    ) -> tuple[scipy.spatial.cKDTree | None, np.ndarray, int]:
+        """kd-tree, target values and number of good pixels (before
+        subsampling) for the given tile. bands is the target band followed
+        by the feature bands. The tree is None if there aren't any good
+        pixels."""
+        key = (bands, tr, tc)
+        if key not in self.trees:
+            ts = self.tile_size
+            ti, tj = self.good_index.window(
+                bands, slice(tr * ts, (tr + 1) * ts), slice(tc * ts, (tc + 1) * ts)
+            )
+            count = ti.size
+            if count > self.max_samples:
+                rng = np.random.default_rng([self.random_state, tr, tc])
+                idx = np.sort(rng.choice(count, self.max_samples, replace=False))
+                ti = ti[idx]
+                tj = tj[idx]
+            tree = None
+            if count > 0:
+                tree = scipy.spatial.cKDTree(self.dataset[ti, tj][:, bands[1:]])
+            self.trees[key] = (
+                tree,
+                self.dataset[ti, tj, bands[0]].astype(float),
+                count,
+            )
+        return self.trees[key]
+
+    def window_trees(
+        self, band: int, features: list[int], rs: slice, cs: slice
+    ) -> tuple[list[tuple[scipy.spatial.cKDTree, np.ndarray]], int]:
+        """The trees and target values covering the window for the target
+        band and features, and the number of good pixels they cover."""
+        h, w = self.dataset.shape[:2]
+        rows = self._tiles(rs.start, rs.stop, h)
+        if band != self.band:
+            self.trees.clear()
+            self.band = band
+        else:
+            self.trees = {k: v for k, v in self.trees.items() if k[1] >= rows[0]}
+        bands = (band, *features)
+        res = []
+        count = 0
+        for tr in rows:
+            for tc in self._tiles(cs.start, cs.stop, w):
+                tree, y, n = self._tree(bands, tr, tc)
+                if tree is not None:
+                    res.append((tree, y))
+                    count += n
+        return res, count
+
+    def kneighbors(
+        self,
+        trees: list[tuple[scipy.spatial.cKDTree, np.ndarray]],
+        X_pred: np.ndarray,
+        k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Distances and target values of the k nearest neighbors of each
+        row of X_pred, sorted by distance. The trees should have at least
+        k points between them.
+
+        Searching each tree costs about the same as building a tree of a
+        few points per search. So if we have a lot of points to predict
+        compared to the size of the trees, it is faster to make one tree
+        from the (already subsampled) tile data and search that once.
+        This gives the same neighbors."""
+        npoint = sum(tree.n for tree, _ in trees)
+        if len(trees) > 1 and X_pred.shape[0] * len(trees) > npoint / self.merge_ratio:
+            trees = [
+                (
+                    scipy.spatial.cKDTree(
+                        np.concatenate([t.data for t, _ in trees]),
+                        balanced_tree=False,
+                    ),
+                    np.concatenate([y for _, y in trees]),
+                )
+            ]
+        dists = []
+        y_nei = []
+        for tree, y in trees:
+            d, idx = tree.query(
+                X_pred, k=list(range(1, min(k, tree.n) + 1)), workers=self.n_jobs
+            )
+            dists.append(d)
+            y_nei.append(y[idx])
+        d = np.concatenate(dists, axis=1)
+        order = np.argsort(d, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(d, order, axis=1), np.take_along_axis(
+            np.concatenate(y_nei, axis=1), order, axis=1
+        )
+
+
+# Indexes used by _block_parallel_func, so each worker process only
+# builds them once.
+_worker_index: dict[str, tuple[_GoodPixelIndex, _NeighborTiles | None]] = {}
+
+
 class EcostressAeDeepEnsembleInterpolate(object):
     """Class to interpolate missing data in ECOSTRESS scenes.
     Steffen Mauceri, JPL, 2025
@@ -118,6 +305,7 @@ class EcostressAeDeepEnsembleInterpolate(object):
             3.0,
         ],  # Weights for each band in loss function
         verbose: bool = True,
+        predict_batch_size: int = 65536,
     ) -> None:
         """
         Deep Ensemble version of the autoencoder-based interpolation model.
@@ -135,6 +323,8 @@ class EcostressAeDeepEnsembleInterpolate(object):
             n_good_bands_required: Minimum number of good bands required for interpolation
             band_weights: Weights for each band in the loss function. Higher weights emphasize that band's error more.
             verbose: Whether to print verbose output
+            predict_batch_size: Number of missing pixels to predict at once in
+                interpolate_missing, which bounds the memory used
         """
         self.grid_size = grid_size
         self.n_bands = n_bands
@@ -148,6 +338,7 @@ class EcostressAeDeepEnsembleInterpolate(object):
         self.n_good_bands_required = n_good_bands_required
         self.band_weights = band_weights
         self.verbose = verbose
+        self.predict_batch_size = predict_batch_size
 
         # Will store normalization parameters
         self.mu: np.ndarray | None = None
@@ -591,39 +782,41 @@ class EcostressAeDeepEnsembleInterpolate(object):
             missing_any_band[:, :half] = False
             missing_any_band[:, -half:] = False
 
-        missing_indices = np.argwhere(missing_any_band)
-        missing_coords = [tuple(idx) for idx in missing_indices]
+        mi, mj = np.nonzero(missing_any_band)
 
-        if len(missing_coords) == 0:
+        if mi.size == 0:
             logger.info(
                 "No missing data found, returning original dataset without interpolating."
             )
             return (dataset, np.zeros_like(dataset), data_quality)
 
-        all_subgrids = np.zeros(
-            (len(missing_coords), self.grid_size, self.grid_size, self.n_bands),
-            dtype=np.float32,
+        # We only use a prediction if we have at least
+        # self.n_good_bands_required good bands at the pixel
+        enough_good = (
+            np.count_nonzero(data_quality_subset == DQI_GOOD, axis=2)
+            >= self.n_good_bands_required
+        )
+        # View of every grid_size x grid_size patch, indexed by the upper left
+        # corner. This doesn't copy the data.
+        patches = np.lib.stride_tricks.sliding_window_view(
+            normalized_data, (self.grid_size, self.grid_size), axis=(0, 1)
         )
-        for idx, (i, j) in enumerate(missing_coords):
-            all_subgrids[idx] = normalized_data[
-                i - half : i + half + 1, j - half : j + half + 1, :
-            ]
-
-        mean_preds, uncertainty = self.model_predict(all_subgrids)
-
         result = np.zeros_like(dataset_subset)
-        # Write predictions back into 'result' and 'uncertainty_map'
-        for idx, (i, j) in enumerate(missing_coords):
-            for band in range(self.n_bands):
-                if interpolation_candidates[i, j, band]:
-                    # check that we have a valid prediciton here. Requires at least self.n_good_bands_required good bands
-                    if (
-                        np.sum(data_quality_subset[i, j, :] == DQI_GOOD)
-                        >= self.n_good_bands_required
-                    ):
-                        result[i, j, band] = mean_preds[idx, half, half, band]
-                        uncertainty_map[i, j, band] = uncertainty[idx, half, half, band]
-                        data_quality_subset[i, j, band] = DQI_INTERPOLATED
+        # Go through the missing pixels in batches, so we don't need to
+        # hold the patches and predictions for every missing pixel at once.
+        for bstart in range(0, mi.size, self.predict_batch_size):
+            bi = mi[bstart : bstart + self.predict_batch_size]
+            bj = mj[bstart : bstart + self.predict_batch_size]
+            subgrids = np.moveaxis(patches[bi - half, bj - half], 1, -1).astype(
+                np.float32
+            )
+            mean_preds, uncertainty = self.model_predict(subgrids)
+            # Write predictions back into 'result' and 'uncertainty_map'
+            write = interpolation_candidates[bi, bj] & enough_good[bi, bj, np.newaxis]
+            r, band = np.nonzero(write)
+            result[bi[r], bj[r], band] = mean_preds[r, half, half, band]
+            uncertainty_map[bi[r], bj[r], band] = uncertainty[r, half, half, band]
+            data_quality_subset[bi[r], bj[r], band] = DQI_INTERPOLATED
 
         # Convert back to original scale
         denorm_result = self.denormalize_data(result)
@@ -680,9 +873,16 @@ class EcostressLocalWindowKNNInterpolator(object):
       the selected feature bands are GOOD
     - Features are the radiances from other bands at the same pixel location
     - Prediction uses the feature vector at the center pixel; uncertainty is residual std on training set
+    - neighbor_search "tiles" (the default) finds the neighbors with kd-trees built once for tiles of the
+      scene (see _NeighborTiles). "window" fits a KNN model for each window, which was the original
+      method and is slower. The two use slightly different training pixels, so the results agree
+      within the noise rather than exactly
 
     Notes:
     - Works on 5-band data by default; for 3-band processing uses bands [2, 4, 5] -> indices [1, 3, 4]
+    - The window blocks are independent, so with n_workers > 1 they are calculated in a pool of
+      processes. The results are written back in the same order as the serial calculation, and
+      each block seeds its own subsampling from random_state, so the results are identical
     """
 
     def __init__(
@@ -702,11 +902,15 @@ class EcostressLocalWindowKNNInterpolator(object):
         exclude_full_bad_edge_columns: bool = True,  # columns that are fully bad in any band, typically on the edges of a scene
         allow_relaxed_center_drop: bool = True,  # avoids missing blocks due to sporadic missing data in center pixels
         center_drop_max_fraction: float = 0.10,  # maximum fraction of centers that can be dropped
+        n_workers: int = 1,  # number of processes to use for the window blocks
+        neighbor_search: str = "tiles",  # "tiles" or "window"
     ) -> None:
         if window_size < 3 or window_size % 2 == 0:
             raise ValueError("window_size must be an odd integer >= 3")
         if n_neighbors < 1:
             raise ValueError("n_neighbors must be >= 1")
+        if neighbor_search not in ("tiles", "window"):
+            raise ValueError('neighbor_search must be "tiles" or "window"')
 
         self.n_bands = n_bands
         self.window_size = window_size
@@ -725,6 +929,30 @@ class EcostressLocalWindowKNNInterpolator(object):
         self.exclude_full_bad_edge_columns = exclude_full_bad_edge_columns
         self.allow_relaxed_center_drop = allow_relaxed_center_drop
         self.center_drop_max_fraction = max(0.0, min(0.5, center_drop_max_fraction))
+        self.n_workers = n_workers
+        self.neighbor_search = neighbor_search
+
+    def _neighbor_tiles(
+        self, dataset: np.ndarray, good_index: _GoodPixelIndex
+    ) -> _NeighborTiles | None:
+        """The _NeighborTiles to use for the blocks, or None if we are
+        fitting a KNN model for each window."""
+        if self.neighbor_search != "tiles":
+            return None
+        # Cap each tile at its share of max_train_samples for a window
+        tile_size = self.block_step
+        max_samples = max(
+            self.n_neighbors,
+            int(np.ceil(self.max_train_samples * (tile_size / self.window_size) ** 2)),
+        )
+        return _NeighborTiles(
+            dataset,
+            good_index,
+            tile_size,
+            max_samples,
+            self.random_state,
+            self.knn_n_jobs,
+        )
 
     def _bands_to_process(self) -> list[int]:
         if self.n_bands == 3:
@@ -780,6 +1008,44 @@ class EcostressLocalWindowKNNInterpolator(object):
             selected if len(selected) >= self.min_feature_bands_for_prediction else []
         )
 
+    def _subsample_index(self, n: int) -> np.ndarray:
+        """Index of the max_train_samples training pixels we use when we
+        have n > max_train_samples available."""
+        rng = np.random.default_rng(self.random_state)
+        return rng.choice(n, self.max_train_samples, replace=False)
+
+    @staticmethod
+    def _weighted_mean_and_uncertainty(
+        dists: np.ndarray, y_nei: np.ndarray, eps: float = 1e-6
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Inverse distance weighted mean and predictive uncertainty for a
+        batch of predictions, given the (n_pred, k) neighbor distances and
+        target values. Also returns a mask of the rows that have valid
+        weights, the caller should use a fallback for the other rows.
+
+        This works on all the predictions at once, y_nei is modified."""
+        w = 1.0 / (dists + eps)
+        # Drop exact self-match if present to avoid zero-variance edge case.
+        # We shift the row left and give the last column zero weight, so the
+        # sums are the same as for the shorter row.
+        if dists.shape[1] >= 2:
+            drop = dists[:, 0] <= eps
+            if np.any(drop):
+                w[drop, :-1] = w[drop, 1:]
+                w[drop, -1] = 0.0
+                y_nei[drop, :-1] = y_nei[drop, 1:]
+                y_nei[drop, -1] = 0.0
+        ws = np.sum(w, axis=1)
+        wgood = ws > 0
+        w = w / np.where(wgood, ws, 1.0)[:, np.newaxis]
+        mu = np.sum(w * y_nei, axis=1)
+        w2_sum = np.sum(w**2, axis=1)
+        denom = np.maximum(1e-12, 1.0 - w2_sum)
+        sw2 = np.sum(w * (y_nei - mu[:, np.newaxis]) ** 2, axis=1) / denom
+        # Predictive variance combines aleatoric (sw2) and epistemic (sw2 * w2_sum)
+        var_pred = sw2 * (1.0 + w2_sum)
+        return mu, np.sqrt(np.maximum(0.0, var_pred)), wgood
+
     def _fit_knn_and_predict(
         self,
         X_train: np.ndarray,
@@ -794,8 +1060,7 @@ class EcostressLocalWindowKNNInterpolator(object):
 
         # Optionally subsample to cap training size for speed
         if X_train.shape[0] > self.max_train_samples:
-            rng = np.random.default_rng(self.random_state)
-            idx = rng.choice(X_train.shape[0], self.max_train_samples, replace=False)
+            idx = self._subsample_index(X_train.shape[0])
             X_train = X_train[idx]
             y_train = y_train[idx]
 
@@ -806,10 +1071,10 @@ class EcostressLocalWindowKNNInterpolator(object):
             n_jobs=self.knn_n_jobs,
         )
         model.fit(X_train, y_train)
-        # Predictions (initial, used as fallback) and predictive-variance-based UQ
-        if batch:
-            y_pred = model.predict(X_pred)
-        else:
+        # In batch mode the weighted mean below replaces the model prediction
+        # for every row, so we only query the tree once and only use
+        # model.predict as a fallback.
+        if not batch:
             y_pred = model.predict(X_pred.reshape(1, -1))
 
         # Per-prediction uncertainty via predictive variance using neighbor weights
@@ -819,34 +1084,14 @@ class EcostressLocalWindowKNNInterpolator(object):
             dists, idxs = model.kneighbors(
                 X_pred, n_neighbors=n_nbrs, return_distance=True
             )
-            uq_vals = np.zeros(dists.shape[0], dtype=float)
-            y_pred_vals = np.array(y_pred, dtype=float)
-            for r in range(dists.shape[0]):
-                d = dists[r]
-                ii = idxs[r]
-                y_nei = y_train[ii].astype(float)
-                if y_nei.size == 0:
-                    # keep fallback prediction and zero UQ
-                    uq_vals[r] = 0.0
-                    continue
-                # Drop exact self-match if present to avoid zero-variance edge case
-                if d[0] <= eps and len(d) >= 2:
-                    d = d[1:]
-                    y_nei = y_nei[1:]
-                w = 1.0 / (d + eps)
-                ws = float(np.sum(w))
-                if ws <= 0:
-                    uq_vals[r] = 0.0
-                    continue
-                w = w / ws
-                mu = float(np.dot(w, y_nei))
-                y_pred_vals[r] = mu
-                w2_sum = float(np.sum(w**2))
-                denom = max(1e-12, 1.0 - w2_sum)
-                sw2 = float(np.sum(w * (y_nei - mu) ** 2)) / denom
-                # Predictive variance combines aleatoric (sw2) and epistemic (sw2 * w2_sum)
-                var_pred = sw2 * (1.0 + w2_sum)
-                uq_vals[r] = float(np.sqrt(max(0.0, var_pred)))
+            y_pred_vals, uq_vals, wgood = self._weighted_mean_and_uncertainty(
+                dists, y_train[idxs].astype(float)
+            )
+            if not np.all(wgood):
+                # keep fallback prediction and zero UQ
+                bad = ~wgood
+                y_pred_vals[bad] = model.predict(X_pred[bad])
+                uq_vals[bad] = 0.0
             return y_pred_vals, uq_vals
         else:
             dists, idxs = model.kneighbors(
@@ -876,6 +1121,323 @@ class EcostressLocalWindowKNNInterpolator(object):
             uq_val = float(np.sqrt(max(0.0, var_pred)))
             return y_pred, uq_val
 
+    def _block_starts(self, h: int, w: int) -> list[tuple[int, int]]:
+        """Top-left corner of each window block."""
+        step = self.block_step
+        win_h = self.window_size
+        win_w = self.window_size
+        # enumerate window top-left indices
+        row_starts = list(range(0, max(1, h - win_h + 1), step))
+        col_starts = list(range(0, max(1, w - win_w + 1), step))
+        # Edge handling: ensure we include a final block aligned to the bottom/right edges
+        # even if the step does not land exactly on the last possible start.
+        if h - win_h >= 0:
+            last_r0 = h - win_h
+            if len(row_starts) == 0 or row_starts[-1] != last_r0:
+                row_starts.append(last_r0)
+        if w - win_w >= 0:
+            last_c0 = w - win_w
+            if len(col_starts) == 0 or col_starts[-1] != last_c0:
+                col_starts.append(last_c0)
+        return [(r0, c0) for r0 in row_starts for c0 in col_starts]
+
+    def _block_centers(
+        self,
+        dq_out: np.ndarray,
+        needs: np.ndarray,
+        r0: int,
+        c0: int,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the rows and columns of the pixels in the inner region
+        of the window block with top-left corner (r0, c0) that need
+        interpolation, or None if there aren't any.
+
+        If the block touches the left or right edge, columns that are
+        fully bad in any band within the window are excluded. This is
+        written back to needs, so it also applies to the blocks after
+        this one that overlap it (the final row and column blocks overlap
+        the previous ones). This needs to be called for the blocks in
+        order. It only depends on which pixels are DQI_GOOD and
+        DQI_NOT_SEEN, which interpolation doesn't change, so we can do
+        this for all the blocks before doing any prediction."""
+        h, w, _ = dq_out.shape
+        bands = self._bands_to_process()
+        inner = self.inner_size
+        margin = max(0, (self.window_size - inner) // 2)
+        win_h = self.window_size
+        win_w = self.window_size
+        r1 = min(h, r0 + win_h)
+        c1 = min(w, c0 + win_w)
+        if r1 - r0 < 3 or c1 - c0 < 3:
+            return None
+        rs = slice(r0, r1)
+        cs = slice(c0, c1)
+
+        # center of window
+        ir0 = r0 + margin
+        ir1 = min(r1, ir0 + inner)
+        ic0 = c0 + margin
+        ic1 = min(c1, ic0 + inner)
+        # Edge handling: expand inner region to touch image borders when the window touches borders.
+        # This ensures border pixels can be predicted when possible.
+        if r0 == 0:
+            ir0 = r0
+        if r1 == h:
+            ir1 = r1
+        if c0 == 0:
+            ic0 = c0
+        if c1 == w:
+            ic1 = c1
+        if ir0 >= ir1 or ic0 >= ic1:
+            return None
+
+        # Candidate centers needing interpolation in inner region. Note this
+        # is a view, so the edge exclusion below updates needs.
+        needs_inner = needs[ir0:ir1, ic0:ic1]
+        # Additional edge handling: if this block touches left or right edge, exclude inner columns
+        # that are fully-bad across rows in ANY band within this window. This prevents edge columns
+        # that are missing in other channels from constraining shared feature selection.
+        touches_left_edge = ic0 == 0
+        touches_right_edge = ic1 == w
+        if self.exclude_full_bad_edge_columns and (
+            touches_left_edge or touches_right_edge
+        ):
+            # For columns inside current window [c0:c1), compute if they are fully-bad across rows for any band
+            # within the window rows [r0:r1).
+            col_fully_bad_any_band = np.zeros(c1 - c0, dtype=bool)
+            for btmp in bands:
+                needs_b_win = (dq_out[rs, cs, btmp] != DQI_GOOD) & (
+                    dq_out[rs, cs, btmp] != DQI_NOT_SEEN
+                )
+                col_fully_bad_any_band |= np.all(needs_b_win, axis=0)
+            # Map to inner slice [ic0:ic1)
+            inner_start = ic0 - c0
+            inner_end = inner_start + (ic1 - ic0)
+            inner_col_mask = col_fully_bad_any_band[inner_start:inner_end]
+            if np.any(inner_col_mask):
+                needs_inner[:, inner_col_mask] = False
+        if not np.any(needs_inner):
+            return None
+        inner_coords = np.argwhere(needs_inner)
+        return inner_coords[:, 0] + ir0, inner_coords[:, 1] + ic0
+
+    def _block_predict(
+        self,
+        dataset: np.ndarray,
+        dq_out: np.ndarray,
+        band: int,
+        r0: int,
+        c0: int,
+        ci: np.ndarray,
+        cj: np.ndarray,
+        good_index: _GoodPixelIndex | None = None,
+        neighbors: _NeighborTiles | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Predict the pixels ci, cj (from _block_centers) for the window
+        block with top-left corner (r0, c0) for the given band. Returns
+        the rows, columns, predicted values and uncertainty of the pixels
+        we interpolated, or None if we can't interpolate anything in this
+        block.
+
+        good_index should be a _GoodPixelIndex for dq_out, and neighbors
+        the _NeighborTiles (if neighbor_search is "tiles"), shared between
+        all the blocks. If not supplied we create them just for this
+        block."""
+        if good_index is None:
+            good_index = _GoodPixelIndex(dq_out)
+        if neighbors is None:
+            neighbors = self._neighbor_tiles(dataset, good_index)
+        h, w, _ = dataset.shape
+        rs = slice(r0, min(h, r0 + self.window_size))
+        cs = slice(c0, min(w, c0 + self.window_size))
+
+        # Feature selection and relaxed center drop:
+        # Try strict shared-features across all centers first. If that fails and allowed,
+        # relax by dropping up to center_drop_max_fraction of centers lacking selected features.
+        # Good mask for each center and band, and the same thing encoded as a
+        # bitmask so checking a combination of features is a single operation.
+        center_good = dq_out[ci, cj] == DQI_GOOD
+        center_code = center_good.astype(np.int64) @ (
+            np.int64(1) << np.arange(center_good.shape[1], dtype=np.int64)
+        )
+
+        def centers_with_all(cand: list[int]) -> np.ndarray:
+            m = sum(1 << fb for fb in cand)
+            return (center_code & m) == m
+
+        all_features = self._feature_bands(band)
+
+        def rank_features_by_window_good(fr_candidates: list[int]) -> list[int]:
+            if self.feature_selection_scope == "window_best":
+                fr_list: list[tuple[int, float]] = []
+                for fb_ in fr_candidates:
+                    fr_val = good_index.good_fraction(fb_, rs, cs)
+                    fr_list.append((fb_, fr_val))
+                return [
+                    fb_ for fb_, _ in sorted(fr_list, key=lambda t: t[1], reverse=True)
+                ]
+            # default: keep original order
+            return list(fr_candidates)
+
+        # Strict: require every center has the feature
+        strict_feats = [fb for fb in all_features if np.all(center_good[:, fb])]
+        strict_feats = rank_features_by_window_good(strict_feats)[
+            : self.max_feature_bands_for_prediction
+        ]
+
+        selected_feats: list[int] = []
+        centers_keep_mask: np.ndarray | None = None
+
+        if len(strict_feats) >= self.min_feature_bands_for_prediction:
+            selected_feats = strict_feats
+            # all centers kept in strict case
+            centers_keep_mask = np.ones(ci.size, dtype=bool)
+        elif self.allow_relaxed_center_drop:
+            # Relaxed: choose features that are good at the center for most centers
+            # Compute availability matrix [num_centers x num_candidate_features]
+            num_centers = ci.size
+            if num_centers == 0:
+                return None
+            # Rank all features by good fraction at centers
+            fr_per_feat: list[tuple[int, float]] = []
+            for fb in all_features:
+                good_count = int(np.count_nonzero(center_good[:, fb]))
+                fr_per_feat.append((fb, good_count / float(num_centers)))
+            ranked_feats = [
+                fb for fb, _ in sorted(fr_per_feat, key=lambda t: t[1], reverse=True)
+            ]
+            # Try to pick up to max_feature_bands while ensuring center retention >= 1 - drop_frac
+            for take_k in range(
+                self.max_feature_bands_for_prediction,
+                self.min_feature_bands_for_prediction - 1,
+                -1,
+            ):
+                cand = ranked_feats[:take_k]
+                if len(cand) < self.min_feature_bands_for_prediction:
+                    continue
+                # Compute which centers have all selected features
+                keep = centers_with_all(cand)
+                keep_count = int(np.count_nonzero(keep))
+                if keep_count > 0 and (keep_count / float(num_centers)) >= (
+                    1.0 - self.center_drop_max_fraction
+                ):
+                    selected_feats = cand
+                    centers_keep_mask = keep
+                    break
+            # If still nothing, try any minimal combo that yields at least min centers
+            if len(selected_feats) == 0:
+                for take_k in range(
+                    self.min_feature_bands_for_prediction,
+                    self.max_feature_bands_for_prediction + 1,
+                ):
+                    cand = ranked_feats[:take_k]
+                    if len(cand) < self.min_feature_bands_for_prediction:
+                        continue
+                    keep = centers_with_all(cand)
+                    keep_count = int(np.count_nonzero(keep))
+                    if keep_count > 0:
+                        selected_feats = cand
+                        centers_keep_mask = keep
+                        break
+        # If selection still insufficient, skip block
+        if (
+            len(selected_feats) < self.min_feature_bands_for_prediction
+            or centers_keep_mask is None
+            or not np.any(centers_keep_mask)
+        ):
+            return None
+
+        # Optionally cap selected features by window quality again
+        selected_feats = rank_features_by_window_good(selected_feats)[
+            : self.max_feature_bands_for_prediction
+        ]
+
+        # Training set for the window
+        if neighbors is not None:
+            # The distances don't depend on the order of the features, so
+            # sort them. Windows using the same bands then share trees.
+            selected_feats = sorted(selected_feats)
+            trees, train_count = neighbors.window_trees(band, selected_feats, rs, cs)
+        else:
+            ti, tj = good_index.window([band, *selected_feats], rs, cs)
+            train_count = ti.size
+        if train_count == 0:
+            return None
+        if train_count < max(self.n_neighbors, self.min_train_per_window):
+            return None
+
+        # Build batch prediction matrix for centers that have all selected features
+        ii = ci[centers_keep_mask]
+        jj = cj[centers_keep_mask]
+        if ii.size == 0:
+            return None
+        X_pred = dataset[ii, jj][:, selected_feats].astype(float)
+
+        # Predict in batch
+        if neighbors is not None:
+            dists, y_nei = neighbors.kneighbors(trees, X_pred, self.n_neighbors)
+            y_pred, uq, wgood = self._weighted_mean_and_uncertainty(dists, y_nei.copy())
+            if not np.all(wgood):
+                # Fall back to the plain mean and zero UQ
+                bad = ~wgood
+                y_pred[bad] = np.mean(y_nei[bad], axis=1)
+                uq[bad] = 0.0
+        else:
+            # We subsample before pulling the data out, so we only copy
+            # the pixels we actually use.
+            if train_count > self.max_train_samples:
+                idx = self._subsample_index(train_count)
+                ti = ti[idx]
+                tj = tj[idx]
+            X_train = dataset[ti, tj][:, selected_feats]
+            y_train = dataset[ti, tj, band]
+            y_pred, uq = self._fit_knn_and_predict(X_train, y_train, X_pred, batch=True)
+        if y_pred.size == 0:
+            return None
+        return ii, jj, np.asarray(y_pred, dtype=float), np.asarray(uq, dtype=float)
+
+    def _block_parallel_func(
+        self,
+        it: tuple[SharedArray, SharedArray, int, int, int, np.ndarray, np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Variation of _block_predict that is easier to use with a
+        multiprocessing pool."""
+        sdata, sdq, band, r0, c0, ci, cj = it
+        if sdq.shm.name not in _worker_index:
+            # New interpolation, so drop any index left from a previous one
+            _worker_index.clear()
+            good_index = _GoodPixelIndex(sdq.data)
+            _worker_index[sdq.shm.name] = (
+                good_index,
+                self._neighbor_tiles(sdata.data, good_index),
+            )
+        good_index, neighbors = _worker_index[sdq.shm.name]
+        return self._block_predict(
+            sdata.data, sdq.data, band, r0, c0, ci, cj, good_index, neighbors
+        )
+
+    def _blocks_parallel(
+        self,
+        dataset: np.ndarray,
+        dq_out: np.ndarray,
+        tasks: list[tuple[int, int, int, np.ndarray, np.ndarray]],
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None]:
+        """Run _block_predict for each of the tasks in a pool of
+        n_workers processes. The data is put in shared memory so we don't
+        need to pickle it for each block. Results are returned in the same
+        order as tasks."""
+        with (
+            SharedArray(dataset.shape, dataset.dtype) as sdata,
+            SharedArray(dq_out.shape, dq_out.dtype) as sdq,
+        ):
+            sdata.data[...] = dataset
+            sdq.data[...] = dq_out
+            with Pool(self.n_workers) as pool:
+                return pool.map(
+                    self._block_parallel_func,
+                    [(sdata, sdq, *t) for t in tasks],
+                )
+
     def find_horizontal_stripes(
         self,
         dataset: np.ndarray,
@@ -898,14 +1460,22 @@ class EcostressLocalWindowKNNInterpolator(object):
         return _find_horizontal_stripes(dataset, data_quality, self.n_bands, threshold)
 
     def interpolate_missing(
-        self, dataset: np.ndarray, data_quality: np.ndarray
+        self, dataset: np.ndarray, data_quality: np.ndarray, in_place: bool = False
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Interpolate missing pixels using an N x N sliding window KNN per pixel.
         Returns (interpolated_dataset, uncertainty, updated_data_quality).
+
+        If in_place is True, dataset and data_quality are updated rather than
+        copied, to save memory. This is safe because we only ever read pixels
+        that are DQI_GOOD, and the pixels we fill in are marked DQI_INTERPOLATED.
         """
-        result = dataset.copy()
+        if in_place:
+            result = dataset
+            dq_out = data_quality
+        else:
+            result = dataset.copy()
+            dq_out = data_quality.copy()
         uncertainty = np.zeros_like(dataset)
-        dq_out = data_quality.copy()
 
         h, w, _ = dataset.shape
 
@@ -952,6 +1522,7 @@ class EcostressLocalWindowKNNInterpolator(object):
                 if right_g > 0:
                     excluded_cols_mask_global[w - right_g :] = True
 
+        needs_all: dict[int, np.ndarray] = {}
         for band in bands:
             needs = (dq_out[:, :, band] != DQI_GOOD) & (
                 dq_out[:, :, band] != DQI_NOT_SEEN
@@ -966,259 +1537,47 @@ class EcostressLocalWindowKNNInterpolator(object):
                 # Also exclude globally flagged edge columns (fully-bad in any band)
                 if np.any(excluded_cols_mask_global):
                     needs[:, excluded_cols_mask_global] = False
-            if not np.any(needs):
-                continue
-
-            # Block processing mode: slide window with stride and predict inner region in batch
-            step = self.block_step
-            inner = self.inner_size
-            margin = max(0, (self.window_size - inner) // 2)
-            win_h = self.window_size
-            win_w = self.window_size
-
-            # enumerate window top-left indices
-            row_starts = list(range(0, max(1, h - win_h + 1), step))
-            col_starts = list(range(0, max(1, w - win_w + 1), step))
-            # Edge handling: ensure we include a final block aligned to the bottom/right edges
-            # even if the step does not land exactly on the last possible start.
-            if h - win_h >= 0:
-                last_r0 = h - win_h
-                if len(row_starts) == 0 or row_starts[-1] != last_r0:
-                    row_starts.append(last_r0)
-            if w - win_w >= 0:
-                last_c0 = w - win_w
-                if len(col_starts) == 0 or col_starts[-1] != last_c0:
-                    col_starts.append(last_c0)
-            total_blocks = len(row_starts) * len(col_starts)
+            if np.any(needs):
+                needs_all[band] = needs
+
+        # Find the pixels each block interpolates. This goes through the
+        # blocks in order, since the edge column exclusion carries over
+        # to the later blocks.
+        tasks = []
+        for band, needs in needs_all.items():
+            for r0, c0 in self._block_starts(h, w):
+                centers = self._block_centers(dq_out, needs, r0, c0)
+                if centers is not None:
+                    tasks.append((band, r0, c0, *centers))
+
+        # Each block only reads pixels that are DQI_GOOD, and only writes
+        # pixels that need interpolation (marking them DQI_INTERPOLATED), so
+        # the blocks are independent. We can calculate them in any order (or
+        # in parallel), and then write the results back in order.
+        if self.n_workers > 1 and len(tasks) > 1:
+            block_res = self._blocks_parallel(dataset, dq_out, tasks)
+        else:
             try:
                 from tqdm import tqdm  # type: ignore
 
-                block_iter = tqdm(
-                    ((r0, c0) for r0 in row_starts for c0 in col_starts),
-                    total=total_blocks,
-                    desc=f"KNN_WINDOW blocks band {band + 1}",
-                )
+                task_iter: typing.Iterable[
+                    tuple[int, int, int, np.ndarray, np.ndarray]
+                ] = tqdm(tasks, desc="KNN_WINDOW blocks")
             except Exception:
-                block_iter = ((r0, c0) for r0 in row_starts for c0 in col_starts)
-
-            for r0, c0 in block_iter:
-                r1 = min(h, r0 + win_h)
-                c1 = min(w, c0 + win_w)
-                if r1 - r0 < 3 or c1 - c0 < 3:
-                    continue
-                rs = slice(r0, r1)
-                cs = slice(c0, c1)
-
-                # center of window
-                ir0 = r0 + margin
-                ir1 = min(r1, ir0 + inner)
-                ic0 = c0 + margin
-                ic1 = min(c1, ic0 + inner)
-                # Edge handling: expand inner region to touch image borders when the window touches borders.
-                # This ensures border pixels can be predicted when possible.
-                if r0 == 0:
-                    ir0 = r0
-                if r1 == h:
-                    ir1 = r1
-                if c0 == 0:
-                    ic0 = c0
-                if c1 == w:
-                    ic1 = c1
-                if ir0 >= ir1 or ic0 >= ic1:
-                    continue
-
-                # Candidate centers needing interpolation in inner region
-                needs_inner = needs[ir0:ir1, ic0:ic1]
-                # Additional edge handling: if this block touches left or right edge, exclude inner columns
-                # that are fully-bad across rows in ANY band within this window. This prevents edge columns
-                # that are missing in other channels from constraining shared feature selection.
-                touches_left_edge = ic0 == 0
-                touches_right_edge = ic1 == w
-                if self.exclude_full_bad_edge_columns and (
-                    touches_left_edge or touches_right_edge
-                ):
-                    # For columns inside current window [c0:c1), compute if they are fully-bad across rows for any band
-                    # within the window rows [r0:r1).
-                    col_fully_bad_any_band = np.zeros(c1 - c0, dtype=bool)
-                    for btmp in bands:
-                        needs_b_win = (dq_out[rs, cs, btmp] != DQI_GOOD) & (
-                            dq_out[rs, cs, btmp] != DQI_NOT_SEEN
-                        )
-                        col_fully_bad_any_band |= np.all(needs_b_win, axis=0)
-                    # Map to inner slice [ic0:ic1)
-                    inner_start = ic0 - c0
-                    inner_end = inner_start + (ic1 - ic0)
-                    inner_col_mask = col_fully_bad_any_band[inner_start:inner_end]
-                    if np.any(inner_col_mask):
-                        needs_inner[:, inner_col_mask] = False
-                if not np.any(needs_inner):
-                    continue
-                inner_coords = np.argwhere(needs_inner)
-                if inner_coords.size == 0:
-                    continue
-
-                # Feature selection and relaxed center drop:
-                # Try strict shared-features across all centers first. If that fails and allowed,
-                # relax by dropping up to center_drop_max_fraction of centers lacking selected features.
-                centers_abs = [(ir0 + di, ic0 + dj) for di, dj in inner_coords]
-                all_features = self._feature_bands(band)
-
-                def rank_features_by_window_good(fr_candidates: list[int]) -> list[int]:
-                    if self.feature_selection_scope == "window_best":
-                        hmask_local = dq_out[rs, cs, :]
-                        fr_list: list[tuple[int, float]] = []
-                        for fb_ in fr_candidates:
-                            fr_val = float(np.mean(hmask_local[:, :, fb_] == DQI_GOOD))
-                            fr_list.append((fb_, fr_val))
-                        return [
-                            fb_
-                            for fb_, _ in sorted(
-                                fr_list, key=lambda t: t[1], reverse=True
-                            )
-                        ]
-                    # default: keep original order
-                    return list(fr_candidates)
-
-                # Strict: require every center has the feature
-                strict_feats = [
-                    fb
-                    for fb in all_features
-                    if all(dq_out[i, j, fb] == DQI_GOOD for (i, j) in centers_abs)
-                ]
-                strict_feats = rank_features_by_window_good(strict_feats)[
-                    : self.max_feature_bands_for_prediction
-                ]
-
-                selected_feats: list[int] = []
-                centers_keep_mask: np.ndarray | None = None
-
-                if len(strict_feats) >= self.min_feature_bands_for_prediction:
-                    selected_feats = strict_feats
-                    # all centers kept in strict case
-                    centers_keep_mask = np.ones(len(centers_abs), dtype=bool)
-                elif self.allow_relaxed_center_drop:
-                    # Relaxed: choose features that are good at the center for most centers
-                    # Compute availability matrix [num_centers x num_candidate_features]
-                    num_centers = len(centers_abs)
-                    if num_centers == 0:
-                        continue
-                    # Rank all features by good fraction at centers
-                    fr_per_feat: list[tuple[int, float]] = []
-                    for fb in all_features:
-                        good_count = sum(
-                            1 for (i, j) in centers_abs if dq_out[i, j, fb] == DQI_GOOD
-                        )
-                        fr_per_feat.append((fb, good_count / float(num_centers)))
-                    ranked_feats = [
-                        fb
-                        for fb, _ in sorted(
-                            fr_per_feat, key=lambda t: t[1], reverse=True
-                        )
-                    ]
-                    # Try to pick up to max_feature_bands while ensuring center retention >= 1 - drop_frac
-                    for take_k in range(
-                        self.max_feature_bands_for_prediction,
-                        self.min_feature_bands_for_prediction - 1,
-                        -1,
-                    ):
-                        cand = ranked_feats[:take_k]
-                        if len(cand) < self.min_feature_bands_for_prediction:
-                            continue
-                        # Compute which centers have all selected features
-                        keep = np.array(
-                            [
-                                all(dq_out[i, j, fb] == DQI_GOOD for fb in cand)
-                                for (i, j) in centers_abs
-                            ],
-                            dtype=bool,
-                        )
-                        keep_count = int(np.count_nonzero(keep))
-                        if keep_count > 0 and (keep_count / float(num_centers)) >= (
-                            1.0 - self.center_drop_max_fraction
-                        ):
-                            selected_feats = cand
-                            centers_keep_mask = keep
-                            break
-                    # If still nothing, try any minimal combo that yields at least min centers
-                    if len(selected_feats) == 0:
-                        for take_k in range(
-                            self.min_feature_bands_for_prediction,
-                            self.max_feature_bands_for_prediction + 1,
-                        ):
-                            cand = ranked_feats[:take_k]
-                            if len(cand) < self.min_feature_bands_for_prediction:
-                                continue
-                            keep = np.array(
-                                [
-                                    all(dq_out[i, j, fb] == DQI_GOOD for fb in cand)
-                                    for (i, j) in centers_abs
-                                ],
-                                dtype=bool,
-                            )
-                            keep_count = int(np.count_nonzero(keep))
-                            if keep_count > 0:
-                                selected_feats = cand
-                                centers_keep_mask = keep
-                                break
-                # If selection still insufficient, skip block
-                if (
-                    len(selected_feats) < self.min_feature_bands_for_prediction
-                    or centers_keep_mask is None
-                    or not np.any(centers_keep_mask)
-                ):
-                    continue
-
-                # Optionally cap selected features by window quality again
-                selected_feats = rank_features_by_window_good(selected_feats)[
-                    : self.max_feature_bands_for_prediction
-                ]
-
-                # Build training set for window
-                good_target = dq_out[rs, cs, band] == DQI_GOOD
-                mask = good_target.copy()
-                for fb in selected_feats:
-                    mask &= dq_out[rs, cs, fb] == DQI_GOOD
-                if not np.any(mask):
-                    continue
-                train_count = int(np.count_nonzero(mask))
-                if train_count < max(self.n_neighbors, self.min_train_per_window):
-                    continue
-                X_list: list[np.ndarray] = []
-                for fb in selected_feats:
-                    X_list.append(dataset[rs, cs, fb][mask])
-                X_train = np.stack(X_list, axis=1)
-                y_train = dataset[rs, cs, band][mask]
-
-                # Build batch prediction matrix for centers that have all selected features
-                centers_abs_keep = [
-                    centers_abs[idx] for idx, k in enumerate(centers_keep_mask) if k
-                ]
-                if len(centers_abs_keep) == 0:
-                    continue
-                X_pred = np.stack(
-                    [
-                        np.array(
-                            [dataset[i, j, fb] for fb in selected_feats], dtype=float
-                        )
-                        for (i, j) in centers_abs_keep
-                    ],
-                    axis=0,
-                )
-
-                # Predict in batch
-                y_pred, uq = self._fit_knn_and_predict(
-                    X_train, y_train, X_pred, batch=True
-                )
-                if y_pred.size == 0:
-                    continue
-                # Write back
-                for idx, (i, j) in enumerate(centers_abs_keep):
-                    result[i, j, band] = float(y_pred[idx])
-                    if isinstance(uq, np.ndarray):
-                        uncertainty[i, j, band] = float(uq[idx])
-                    else:
-                        uncertainty[i, j, band] = float(uq)
-                    dq_out[i, j, band] = DQI_INTERPOLATED
+                task_iter = tasks
+            good_index = _GoodPixelIndex(dq_out)
+            neighbors = self._neighbor_tiles(dataset, good_index)
+            block_res = (
+                self._block_predict(dataset, dq_out, *t, good_index, neighbors)
+                for t in task_iter
+            )
+        for (band, *_), r in zip(tasks, block_res):
+            if r is None:
+                continue
+            ii, jj, y_pred, uq = r
+            result[ii, jj, band] = y_pred
+            uncertainty[ii, jj, band] = uq
+            dq_out[ii, jj, band] = DQI_INTERPOLATED
 
         # Revert any remaining stripe flags to GOOD if original data was valid
         dq_out[
@@ -0,0 +1,244 @@
+from __future__ import annotations
+from .ecostress_interpolate import (
+    EcostressAeDeepEnsembleInterpolate,
+    EcostressLocalWindowKNNInterpolator,
+)
+from ecostress_swig import (  # type: ignore
+    DQI_GOOD,
+    DQI_INTERPOLATED,
+    DQI_STRIPE_NOT_INTERPOLATED,
+    DQI_BAD_OR_MISSING,
+    DQI_NOT_SEEN,
+    FILL_VALUE_BAD_OR_MISSING,
+    FILL_VALUE_STRIPED,
+    FILL_VALUE_NOT_SEEN,
+)
+import h5py  # type: ignore
+import itertools
+import numpy as np
+import time
+import tracemalloc
+import typing
+
+
+class InterpolateBenchmark(object):
+    """This is a harness for measuring the cost and accuracy of the
+    stripe interpolation, so we can tune the interpolator parameters
+    for production.
+
+    We start with a clean scene (e.g., a L1B_RAD file, or one generated
+    by L1bRadSimulate), and inject synthetic stripes into pixels that
+    are good. The stripes follow the band loss we see in ECOSTRESS data:
+    mostly 1 or 2 line stripes, with the occasional wider one, each
+    missing in a random subset of the bands (always leaving at least
+    2 bands good to use as features). Stripes are kept away from the
+    left and right edge, where the data is often missing anyway.
+
+    We then run EcostressLocalWindowKNNInterpolator or
+    EcostressAeDeepEnsembleInterpolate over a grid of parameters,
+    and for each case report the wall time, the peak memory, the RMSE
+    per band of the injected pixels against the original values, and
+    the fraction of the injected pixels that got interpolated.
+
+    The peak memory is what tracemalloc sees, so it includes the numpy
+    allocations but not TensorFlow's. Tracing slows the interpolation
+    down quite a bit, so we measure it in a second run of each case
+    (turn this off with measure_memory=False).
+
+    The stripe placement comes from a seeded random number generator,
+    so the results are reproducible."""
+
+    # Widths of the stripes we inject. This matches what we used when
+    # developing the interpolators.
+    DEFAULT_STRIPE_WIDTH = (1, 1, 1, 2, 2, 2, 2, 8, 8)
+
+    def __init__(
+        self,
+        dataset: np.ndarray,
+        data_quality: np.ndarray,
+        seed: int = 0,
+        stripe_width: typing.Sequence[int] = DEFAULT_STRIPE_WIDTH,
+        edge: int = 50,
+        measure_memory: bool = True,
+    ) -> None:
+        """Set up the benchmark for the given line x sample x band dataset
+        and data quality. The stripes are injected here, and the same
+        stripes are used for every case we run."""
+        self.dataset = dataset
+        self.data_quality = data_quality
+        self.seed = seed
+        self.stripe_width = tuple(stripe_width)
+        self.edge = edge
+        self.measure_memory = measure_memory
+        # Bands that aren't all bad. For 3 band data, this is [1, 3, 4]
+        self.bands = [
+            b
+            for b in range(dataset.shape[2])
+            if np.any(data_quality[:, :, b] != DQI_BAD_OR_MISSING)
+        ]
+        if len(self.bands) not in (3, 5):
+            raise ValueError(
+                f"Need 3 or 5 bands with data, found {len(self.bands)} bands"
+            )
+        self.striped_dataset, self.striped_data_quality, self.test_mask = (
+            self.inject_stripes()
+        )
+
+    @classmethod
+    def from_file(cls, fname: str, **kwargs: typing.Any) -> InterpolateBenchmark:
+        """Read the radiance from a L1B_RAD file (or one from
+        L1bRadSimulate). If the file has a data quality we use it,
+        otherwise it is determined from the fill values. Any data
+        that was previously interpolated is treated as missing."""
+        with h5py.File(fname, "r") as f:
+            nline, nsamp = f["/Radiance/radiance_1"].shape
+            dataset = np.empty((nline, nsamp, 5))
+            data_quality = np.full((nline, nsamp, 5), DQI_GOOD, dtype=np.int8)
+            for b in range(5):
+                dataset[:, :, b] = f["/Radiance/radiance_%d" % (b + 1)]
+                if "/Radiance/data_quality_%d" % (b + 1) in f:
+                    data_quality[:, :, b] = f["/Radiance/data_quality_%d" % (b + 1)]
+        data_quality[dataset == FILL_VALUE_NOT_SEEN] = DQI_NOT_SEEN
+        data_quality[dataset == FILL_VALUE_BAD_OR_MISSING] = DQI_BAD_OR_MISSING
+        bad = (data_quality == DQI_INTERPOLATED) | (dataset == FILL_VALUE_STRIPED)
+        dataset[bad] = FILL_VALUE_STRIPED
+        data_quality[bad] = DQI_STRIPE_NOT_INTERPOLATED
+        return cls(dataset, data_quality, **kwargs)
+
+    def inject_stripes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the dataset and data quality with stripes added, and a
+        mask of the pixels we removed."""
+        rng = np.random.default_rng(self.seed)
+        dataset = self.dataset.copy()
+        data_quality = self.data_quality.copy()
+        test_mask = np.zeros(dataset.shape, dtype=bool)
+        nline = dataset.shape[0]
+        cs = slice(self.edge, dataset.shape[1] - self.edge)
+        for width in self.stripe_width:
+            # Always leave at least 2 bands good
+            nband = rng.integers(1, len(self.bands) - 1)
+            bands = np.sort(rng.choice(self.bands, nband, replace=False))
+            # Look for rows where all the bands are good, so we are
+            # only removing good data.
+            for _ in range(100):
+                row = int(rng.integers(1, nline - width))
+                if not np.any(
+                    data_quality[row : row + width, cs][:, :, self.bands] != DQI_GOOD
+                ):
+                    break
+            else:
+                raise RuntimeError("Could not find a good location for a stripe")
+            for b in bands:
+                dataset[row : row + width, cs, b] = FILL_VALUE_STRIPED
+                data_quality[row : row + width, cs, b] = DQI_STRIPE_NOT_INTERPOLATED
+                test_mask[row : row + width, cs, b] = True
+        return dataset, data_quality, test_mask
+
+    def interpolator(
+        self, method: str, **kwargs: typing.Any
+    ) -> EcostressLocalWindowKNNInterpolator | EcostressAeDeepEnsembleInterpolate:
+        """Create the interpolator for the given method, "knn" or "ae"."""
+        if method == "knn":
+            return EcostressLocalWindowKNNInterpolator(
+                n_bands=len(self.bands), **kwargs
+            )
+        if method == "ae":
+            return EcostressAeDeepEnsembleInterpolate(
+                n_bands=len(self.bands), verbose=False, **kwargs
+            )
+        raise ValueError(f"Unknown interpolation method {method}")
+
+    def _interpolate(
+        self,
+        method: str,
+        train_parameters: dict[str, typing.Any] | None,
+        **kwargs: typing.Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        inter = self.interpolator(method, **kwargs)
+        dataset = self.striped_dataset.copy()
+        data_quality = self.striped_data_quality.copy()
+        if isinstance(inter, EcostressAeDeepEnsembleInterpolate):
+            inter.train(dataset, data_quality, **(train_parameters or {}))
+        res, _, dqi = inter.interpolate_missing(dataset, data_quality)
+        return res, dqi
+
+    def run(
+        self,
+        method: str,
+        train_parameters: dict[str, typing.Any] | None = None,
+        **kwargs: typing.Any,
+    ) -> dict[str, typing.Any]:
+        """Run one case, using the given interpolator parameters.
+        train_parameters are passed to train for the "ae" method.
+
+        Returns a dict with the parameters, wall_time (seconds),
+        peak_memory (MB, None if we aren't measuring it), rmse_b1 through
+        rmse_b5 (None for bands with no test pixels) and coverage
+        (fraction of the test pixels that were interpolated)."""
+        tstart = time.perf_counter()
+        res, dqi = self._interpolate(method, train_parameters, **kwargs)
+        wall_time = time.perf_counter() - tstart
+        peak_memory = None
+        if self.measure_memory:
+            tracemalloc.start()
+            try:
+                self._interpolate(method, train_parameters, **kwargs)
+                peak_memory = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            finally:
+                tracemalloc.stop()
+        done = self.test_mask & (dqi == DQI_INTERPOLATED)
+        result: dict[str, typing.Any] = {"method": method, **kwargs}
+        result["wall_time"] = wall_time
+        result["peak_memory"] = peak_memory
+        for b in range(self.dataset.shape[2]):
+            m = done[:, :, b]
+            result[f"rmse_b{b + 1}"] = (
+                float(np.sqrt(np.mean((res[m, b] - self.dataset[m, b]) ** 2)))
+                if np.any(m)
+                else None
+            )
+        ntest = np.count_nonzero(self.test_mask)
+        result["coverage"] = np.count_nonzero(done) / ntest if ntest > 0 else 0.0
+        return result
+
+    def run_grid(
+        self,
+        method: str,
+        grid: dict[str, typing.Sequence[typing.Any]],
+        train_parameters: dict[str, typing.Any] | None = None,
+    ) -> list[dict[str, typing.Any]]:
+        """Run every combination of the parameters in grid (e.g.,
+        {"window_size" : [101, 201], "n_neighbors" : [5, 10]}), returning
+        the list of results from run."""
+        keys = list(grid.keys())
+        return [
+            self.run(method, train_parameters=train_parameters, **dict(zip(keys, v)))
+            for v in itertools.product(*(grid[k] for k in keys))
+        ]
+
+    @staticmethod
+    def table(results: list[dict[str, typing.Any]]) -> str:
+        """Format the results from run_grid as a text table."""
+        if len(results) == 0:
+            return ""
+        cols: list[str] = []
+        for r in results:
+            cols.extend(k for k in r.keys() if k not in cols)
+
+        def fmt(v: typing.Any) -> str:
+            if v is None:
+                return "-"
+            if isinstance(v, float):
+                return f"{v:.4g}"
+            return str(v)
+
+        rows = [cols] + [[fmt(r.get(c)) for c in cols] for r in results]
+        width = [max(len(row[i]) for row in rows) for i in range(len(cols))]
+        lines = [
+            "  ".join(v.rjust(width[i]) for i, v in enumerate(row)) for row in rows
+        ]
+        lines.insert(1, "  ".join("-" * wd for wd in width))
+        return "\n".join(lines)
+
+
+__all__ = ["InterpolateBenchmark"]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+import h5py  # type: ignore
+import hashlib
+import os
+import numpy as np
+from .l1a_raw_assemble import sequence_start_table
+
+
+class L0bIndexFile(object):
+    """This is a persistent index of a L0B file, shared by l0b_scan.py
+    and L1aRawPixGenerate.
+
+    Both of these derive the same things from the L0B - the packet GPS
+    times, which packets start the hot BB, cold BB and image sequences
+    (see sequence_start_table), and the packet range covering each scene.
+    Reprocessing runs the same L0B many times, so we save this in a small
+    HDF5 file that is then memory mapped on later runs.
+
+    The index file goes next to the L0B file (with ".index.h5" added to
+    the name), or if cache_dir is supplied in that directory named by the
+    L0B checksum. The checksum is a sha256 of the per packet L0B data
+    (id_line, id_packet and the time fields) and the flex/bip shape, which
+    is everything the index depends on. We don't checksum all of flex/bip,
+    that would mean reading the full file which is what we are trying to
+    avoid. An index with a different checksum, version or ev_codes is
+    ignored and regenerated."""
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        l0b: str,
+        fin: h5py.File,
+        ev_codes: np.ndarray,
+        max_fpie: int,
+        cache_dir: str | None = None,
+    ) -> None:
+        """Open the index for the L0B file l0b (already opened as fin),
+        creating it if it doesn't exist or is out of date."""
+        self.l0b = l0b
+        self.ev_codes = np.asarray(ev_codes, dtype=np.int32)
+        self.max_fpie = max_fpie
+        self.checksum = self.l0b_checksum(fin)
+        if cache_dir is not None:
+            self.fname = os.path.join(cache_dir, self.checksum + ".index.h5")
+        else:
+            self.fname = l0b + ".index.h5"
+        self.created = False
+        if not self._is_valid():
+            self._create(fin)
+            self.created = True
+        self._read()
+
+    @staticmethod
+    def l0b_checksum(fin: h5py.File) -> str:
+        """Checksum of the per packet data in the L0B."""
+        h = hashlib.sha256()
+        h.update(str(fin["flex/bip"].shape).encode("utf-8"))
+        for dname in (
+            "flex/id_line",
+            "flex/id_packet",
+            "flex/time_fsw",
+            "flex/time_sync_fpie",
+            "flex/time_sync_fsw",
+        ):
+            h.update(np.ascontiguousarray(fin[dname][()]).tobytes())
+        return h.hexdigest()
+
+    def _is_valid(self) -> bool:
+        if not os.path.exists(self.fname):
+            return False
+        try:
+            with h5py.File(self.fname, "r") as f:
+                return (
+                    f.attrs["checksum"] == self.checksum
+                    and f.attrs["version"] == self.VERSION
+                    and np.array_equal(f["ev_codes"][()], self.ev_codes)
+                )
+        except (OSError, KeyError):
+            return False
+
+    def _create(self, fin: h5py.File) -> None:
+        print("Creating L0B index file %s" % self.fname)
+        gpt = (
+            fin["flex/time_fsw"][:]
+            + (
+                fin["flex/time_sync_fpie"][:].astype(np.int64)
+                - fin["flex/time_sync_fsw"][:].astype(np.int64)
+            )
+            / 1000000.0
+        )
+        lev = (fin["flex/id_line"][:] & 0x1FFFFF).astype(np.int32)
+        seq_fp, seq_phase = sequence_start_table(lev, self.ev_codes, self.max_fpie)
+        # Write to a temporary file and then move into place, so a reader
+        # never sees a partial index
+        tname = "%s.tmp%d" % (self.fname, os.getpid())
+        with h5py.File(tname, "w") as f:
+            f.attrs["checksum"] = self.checksum
+            f.attrs["version"] = self.VERSION
+            f.attrs["l0b"] = os.path.basename(self.l0b)
+            f.create_dataset("ev_codes", data=self.ev_codes)
+            # Not chunked, so we can memory map these
+            f.create_dataset("gpt", data=gpt)
+            f.create_dataset("gpt_cummax", data=np.maximum.accumulate(gpt))
+            f.create_dataset("seq_fp", data=seq_fp)
+            f.create_dataset("seq_phase", data=seq_phase)
+            d = f.create_dataset(
+                "scene", shape=(0, 4), maxshape=(None, 4), chunks=(64, 4), dtype="f8"
+            )
+            d.attrs["Description"] = (
+                "Scene start GPS time, scene end GPS time, first packet, "
+                "packet past end"
+            )
+        os.replace(tname, self.fname)
+
+    def _memmap(self, f: h5py.File, dname: str) -> np.ndarray:
+        """Memory map a contiguous dataset. Falls back to reading it if
+        HDF5 didn't give us a contiguous layout."""
+        d = f[dname]
+        offset = d.id.get_offset()
+        if offset is None or d.size == 0:
+            return d[()]
+        return np.memmap(
+            self.fname, mode="r", dtype=d.dtype, shape=d.shape, offset=offset
+        )
+
+    def _read(self) -> None:
+        with h5py.File(self.fname, "r") as f:
+            self.gpt = self._memmap(f, "gpt")
+            self.gpt_cummax = self._memmap(f, "gpt_cummax")
+            self.seq_fp = self._memmap(f, "seq_fp")
+            self.seq_phase = self._memmap(f, "seq_phase")
+            self.scene = f["scene"][()]
+
+    @property
+    def tot_pkts(self) -> int:
+        return self.gpt.shape[0]
+
+    def packet_after(self, t: float) -> int:
+        """First packet with a time > t, or 0 if there isn't one. This is
+        the same as np.argmax(gpt > t), but uses a binary search on the
+        running maximum of gpt rather than scanning the whole array."""
+        i = int(np.searchsorted(self.gpt_cummax, t, side="right"))
+        return i if i < self.tot_pkts else 0
+
+    def scene_packet_range(self, sts: float, ste: float) -> tuple[int, int]:
+        """Return the packet range for the scene with the given start and
+        end GPS time. This is the first packet after the start time, and
+        the first packet after the end time (or the number of packets if
+        the scene runs to the end of the file). We use the saved range if
+        we have it, otherwise we calculate and save it."""
+        m = (self.scene[:, 0] == sts) & (self.scene[:, 1] == ste)
+        if m.any():
+            i = int(np.argmax(m))
+            return int(self.scene[i, 2]), int(self.scene[i, 3])
+        p0 = self.packet_after(sts)
+        p1 = int(np.searchsorted(self.gpt_cummax, ste, side="right"))
+        self.add_scene(sts, ste, p0, p1)
+        return p0, p1
+
+    def add_scene(self, sts: float, ste: float, p0: int, p1: int) -> None:
+        """Save the packet range for a scene in the index file."""
+        row = np.array([[sts, ste, p0, p1]], dtype=np.float64)
+        self.scene = np.concatenate([self.scene, row])
+        try:
+            with h5py.File(self.fname, "a") as f:
+                d = f["scene"]
+                d.resize((d.shape[0] + 1, 4))
+                d[-1, :] = row[0]
+        except OSError:
+            # Index file may be read only (e.g., shared cache), not an error
+            pass
+
+
+__all__ = ["L0bIndexFile"]
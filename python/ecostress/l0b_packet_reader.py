@@ -0,0 +1,104 @@
+from __future__ import annotations
+import h5py  # type: ignore
+import numpy as np
+from typing import Any
+
+
+class L0bPacketReader(object):
+    """This gives streaming access to the flex/bip data in a L0B file.
+
+    The flex/bip array is (packets x 64 x 256 x bands) int16, which for a
+    full orbit is much larger than we want to hold in memory. Rather than
+    reading the whole file in with driver="core", this keeps a window of
+    packets in memory. We prime the window at the start of each scene, and
+    then slide it forward as packets past the end of the window are
+    requested. Memory use is then bounded by the window size, independent
+    of the orbit length.
+
+    This supports just the indexing that L1aRawPixGenerate uses - an
+    integer packet index or a slice of packets (optionally followed by
+    indexes for the remaining dimensions). The returned array is a view
+    into the window, so it should be copied before the next read."""
+
+    def __init__(self, dset: h5py.Dataset, read_ahead: int = 512) -> None:
+        """Create a reader for the given flex/bip dataset. read_ahead is
+        the number of packets we read at a time."""
+        self.dset: h5py.Dataset | None = dset
+        self.fname = dset.file.filename
+        self.dset_name = dset.name
+        self.shape = dset.shape
+        self.dtype = dset.dtype
+        self.ndim = dset.ndim
+        self.read_ahead = read_ahead
+        self.buf = np.empty((read_ahead,) + self.shape[1:], dtype=self.dtype)
+        self.w0 = 0
+        self.w1 = 0
+        self.npacket_read = 0
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def close(self) -> None:
+        """Close the underlying file. h5py file handles can't be used
+        across a fork, so we close the file before starting worker
+        processes and then reopen it in each worker."""
+        if self.dset is not None:
+            self.dset.file.close()
+        self.dset = None
+        self.w0 = 0
+        self.w1 = 0
+
+    def reopen(self) -> None:
+        """Open the file again, e.g. in a worker process."""
+        self.dset = h5py.File(self.fname, "r")[self.dset_name]
+        self.w0 = 0
+        self.w1 = 0
+
+    def prime(self, pkt_idx: int) -> None:
+        """Fill the window starting at the given packet, e.g., the first
+        packet of a scene."""
+        self._read(pkt_idx, min(pkt_idx + self.read_ahead, self.shape[0]))
+
+    def _read(self, p0: int, p1: int) -> None:
+        """Read packets p0 to p1 into the window."""
+        p0 = max(p0, 0)
+        p1 = min(max(p1, p0 + self.read_ahead), self.shape[0])
+        if p1 - p0 > self.buf.shape[0]:
+            # Only happens if a single request is larger than read_ahead
+            self.buf = np.empty((p1 - p0,) + self.shape[1:], dtype=self.dtype)
+        if self.dset is None:
+            raise RuntimeError("L0bPacketReader has been closed")
+        if p1 > p0:
+            self.dset.read_direct(self.buf, np.s_[p0:p1], np.s_[0 : (p1 - p0)])
+        self.w0 = p0
+        self.w1 = p1
+        self.npacket_read += p1 - p0
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if isinstance(key, tuple):
+            pkey = key[0]
+            rest = key[1:]
+        else:
+            pkey = key
+            rest = ()
+        if isinstance(pkey, slice):
+            p0, p1, step = pkey.indices(self.shape[0])
+            if step != 1:
+                raise IndexError("L0bPacketReader only supports unit step slices")
+            p1 = max(p1, p0)
+            if p0 < self.w0 or p1 > self.w1:
+                self._read(p0, p1)
+            wkey: Any = slice(p0 - self.w0, p1 - self.w0)
+        else:
+            p = int(pkey)
+            if p < 0:
+                p += self.shape[0]
+            if p < 0 or p >= self.shape[0]:
+                raise IndexError("Packet index %d out of range" % p)
+            if p < self.w0 or p >= self.w1:
+                self._read(p, p + 1)
+            wkey = p - self.w0
+        return self.buf[(wkey,) + rest]
+
+
+__all__ = ["L0bPacketReader"]
@@ -3,11 +3,11 @@ import numpy as np
 import h5py  # type: ignore
 
 # from .misc import time_split, ecostress_file_name
+from .misc import j2000_to_gps
 from .write_standard_metadata import WriteStandardMetadata
 import os
 import re
 from datetime import datetime
-from geocal import Time  # type: ignore
 
 # import pkt_defs.py
 
@@ -177,20 +177,29 @@ class L0BSimulate(object):
         self.l1a_raw_att_fname = l1a_raw_att_fname
         self.scene_files = scene_files
 
-    def kelvin_to_dn(self, x: np.ndarray, k: float) -> int:
+    def kelvin_to_dn(self, x: np.ndarray, k: float | np.ndarray) -> int | np.ndarray:
         # convert Kelvin temperature to PRT DN values given PRT coefficients
         # a = array of coefficients
         # K = kelvin temperature
         # DN is the "+" solution of quadratic wth the following coefficients
-        a = x[0] * x[3] * x[3]
-        b = 2.0 * x[0] * x[3] * x[4] + x[1] * x[3]
+        #
+        # This can also be called with x an array of coefficients (..., 5) and
+        # k an array of temperatures, which get broadcast together
+        x = np.asarray(x, dtype=np.float64)
+        k = np.asarray(k, dtype=np.float64)
+        a = x[..., 0] * x[..., 3] * x[..., 3]
+        b = 2.0 * x[..., 0] * x[..., 3] * x[..., 4] + x[..., 1] * x[..., 3]
         c = (
-            x[0] * x[4] * x[4] + x[1] * x[4] + x[2] - (k - 273.15)
+            x[..., 0] * x[..., 4] * x[..., 4]
+            + x[..., 1] * x[..., 4]
+            + x[..., 2]
+            - (k - 273.15)
         )  # needs to be celsius
         rdn = (np.sqrt(b * b - 4.0 * a * c) - b) / (2.0 * a)
-        dn = int(rdn + 0.5)
         # print("kelvin_to_dn,X=%f %f %f %f %f K=%f RDN=%f DN=%d" % (x[0],x[1],x[2],x[3],x[4],K,rdn,dn))
-        return dn  # little-Endian
+        if rdn.ndim == 0:
+            return int(rdn + 0.5)  # little-Endian
+        return (rdn + 0.5).astype(np.int64)
 
     def create_file(self, l0b_fname: str) -> None:
         print("====  CREATE_FILE L0B_FNAME %s ====" % l0b_fname)
@@ -369,22 +378,16 @@ class L0BSimulate(object):
         att[:, :] = aq[:, :]
         pos[:, :] = ep[:, :] / 0.3048
         vel[:, :] = ev[:, :] / 0.3048
-        for i in range(aqc):
-            att_time[i] = Time.time_j2000(at[i]).gps
-        for i in range(epc):
-            att_fsw[i] = Time.time_j2000(et[i]).gps
+        att_time[:] = j2000_to_gps(at[:])
+        att_fsw[:] = j2000_to_gps(et[:])
 
         #  ****  convert Kelvin to DN  ****
-        for i in range(enc):
-            for j in range(enr):
-                bbt[i, 0, j] = self.kelvin_to_dn(kc[j, :], r2k[i, j])
-                bbt[i, 1, j] = self.kelvin_to_dn(kh[j, :], r3k[i, j])
-                # print("ENC=%d ENR=%d R2K=%f R3K=%f BB2=%d BB3=%d" %(enr,enc,r2k[i,j],r3k[i,j],bbt[i,0,j],bbt[i,1,j]))
-
-        eng_time = l1e["/rtdBlackbodyGradients/time_j2000"]
-        for i in range(enc):
-            bb_time[i] = Time.time_j2000(eng_time[i, 0]).gps
-            bb_fsw[i] = Time.time_j2000(eng_time[i, 1]).gps
+        bbt[:, 0, :] = self.kelvin_to_dn(kc[:enr, :], r2k[:, :])
+        bbt[:, 1, :] = self.kelvin_to_dn(kh[:enr, :], r3k[:, :])
+
+        eng_time = l1e["/rtdBlackbodyGradients/time_j2000"][:, :]
+        bb_time[:] = j2000_to_gps(eng_time[:enc, 0])
+        bb_fsw[:] = j2000_to_gps(eng_time[:enc, 1])
         att_fd.close()
         l1e.close()
         l0b_fd.flush()
@@ -417,34 +420,54 @@ class L0BSimulate(object):
             "time_sync_fsw", shape=(1,), maxshape=(None,), dtype="uint64"
         )
 
-        # running count of packets
-        tot_pkt = 0
-        # running count of image lines
-        tot_lines = 0
-        # *** packet ID adjust for missing packets ***
-        pkt_id = 0
-
-        # working array including PIX and BB, and 1 packet
-        bufsiz = fpb3 + FPPPKT
-        pix_buf = np.zeros((PPFP, bufsiz, BANDS), dtype=np.uint16)
-        ev_buf = np.zeros(bufsiz, dtype=np.uint32)
-        evc = np.zeros((2, fpb3), dtype=np.uint32)
+        # Each scan is a buffer of fpb3 FPs, with the HBB, CBB and IMG
+        # data at offsets ev0, ev1 and ev2. The packets are just this
+        # stream of scans cut into FPPPKT FP pieces, with the remainder of
+        # a scan carried over to the first packet of the next one. We
+        # require that the 3 pieces fill the scan buffer, otherwise we'd
+        # have stale data in the gaps.
+        seg = sorted([(ev0, bblen), (ev1, bblen), (ev2, fppsc)])
+        if seg[0][0] != 0 or any(
+            seg[i][0] + seg[i][1] != seg[i + 1][0] for i in range(2)
+        ):
+            raise RuntimeError(
+                "*** EV offsets %d %d %d don't fill scan ***" % (ev0, ev1, ev2)
+            )
 
-        for i in range(2):  # generate EVs for both mirror phases
-            for j in range(bblen):  # BB pixels
-                evc[i, j + ev0] = int(ev_codes[0, i * 2] + j * fp_ev + 0.5) % max_fpie
-                evc[i, j + ev1] = int(ev_codes[1, i * 2] + j * fp_ev + 0.5) % max_fpie
-            for j in range(fppsc):  # image pixels
-                evc[i, j + ev2] = int(ev_codes[2, i * 2] + j * fp_ev + 0.5) % max_fpie
-
-        p0 = 0
-        prev = 0
-        evp = 0
-        t0 = 0
-        pix_dat = [np.empty((0, 0)) for b in range(BANDS)]
-        b295 = [np.empty((0, 0)) for b in range(BANDS)]
-        b325 = [np.empty((0, 0)) for b in range(BANDS)]
-        ### angnadir = 180.0
+        # EVs for both mirror phases
+        evc = np.zeros((2, fpb3), dtype=np.uint32)
+        for i in range(2):
+            jb = np.arange(bblen)
+            ji = np.arange(fppsc)
+            evc[i, ev0 : ev0 + bblen] = (ev_codes[0, i * 2] + jb * fp_ev + 0.5).astype(
+                np.int64
+            ) % max_fpie
+            evc[i, ev1 : ev1 + bblen] = (ev_codes[1, i * 2] + jb * fp_ev + 0.5).astype(
+                np.int64
+            ) % max_fpie
+            evc[i, ev2 : ev2 + fppsc] = (ev_codes[2, i * 2] + ji * fp_ev + 0.5).astype(
+                np.int64
+            ) % max_fpie
+
+        # Packet offset into a scan (relative to the scan start) for the
+        # packets that start in the scan, and the time offset for that
+        # packet. Packets starting in the BB are given the time of the
+        # following IMG packet, backed up to the BB. This depends on
+        # the number of FPs left over from the previous scan, which is
+        # one of FPPPKT values.
+        kmax = (fpb3 + FPPPKT - 1) // FPPPKT
+        kgrid = np.arange(kmax)
+
+        # Global count of scans, used for the alternating EVs and the
+        # leftover at the start of each scan
+        tot_scan = 0
+        # FPs (pixel data and EVs) left over from the previous scan
+        rem_pix = np.zeros((0, PPFP, BANDS), dtype=np.uint16)
+        rem_ev = np.zeros((0,), dtype=np.uint32)
+        # J2000 time at end of previous scan, used for the packet
+        # that straddles the scans
+        t0 = 0.0
+        tot_pkt = 0
 
         # process scenes make sure to do it in order
         total_scenes = len(self.scene_files)
@@ -457,181 +480,116 @@ class L0BSimulate(object):
             # Also get simulated black body data
             bb_fd = h5py.File(l1a_bb_fname, "r", driver="core")
 
-            # link to pixel and bb datsasets
-            for b in range(BANDS):
-                pix_dat[b] = pix_fd["/UncalibratedPixels/pixel_data_%d" % (b + 1)]
-                b295[b] = bb_fd["/BlackBodyPixels/b%d_blackbody_295" % (b + 1)]
-                b325[b] = bb_fd["/BlackBodyPixels/b%d_blackbody_325" % (b + 1)]
-
-            pix_2k = pix_fd["/Time/line_start_time_j2000"]
+            pix_2k = pix_fd["/Time/line_start_time_j2000"][:]
 
             # lines and pix per scene (assume all BANDS are the same)
-            lines, pix = pix_dat[0].shape
-            tot_lines = tot_lines + lines
-            line = 0
-            # pkts for scene
-            tot_pkt = int((fpb3 * tot_lines / PPFP + FPPPKT - 1) / FPPPKT)
-            # extend packet dataset to new total
-            bip.resize(tot_pkt, 0)
-            lid.resize(tot_pkt, 0)
-            pid.resize(tot_pkt, 0)
-            flex_st.resize(tot_pkt, 0)
-            fswt.resize(tot_pkt, 0)
-            fpie_sync.resize(tot_pkt, 0)
-            fsw_sync.resize(tot_pkt, 0)
+            lines, pix = pix_fd["/UncalibratedPixels/pixel_data_1"].shape
+            nscan = (lines + PPFP - 1) // PPFP
             print(
-                "\n===  Scene=%d %s TOTAL=%d P0=%d tot_lines=%d tot_pkt=%d"
-                % (v, l1a_raw_pix_fname, total_scenes, p0, tot_lines, tot_pkt)
+                "\n===  Scene=%d %s TOTAL=%d P0=%d lines=%d scans=%d"
+                % (v, l1a_raw_pix_fname, total_scenes, rem_ev.shape[0], lines, nscan)
             )
 
-            # Iterate through data lines in current scene 256 lines at a time
-            ## scan = 0
-            while line < lines:
-                # pix_buf and ev_buf offsets
-                ps0 = p0 + ev0
-                pe0 = ps0 + bblen  # HBB first
-                ps1 = p0 + ev1
-                pe1 = ps1 + bblen  # then CBB
-                ps2 = p0 + ev2
-                pe2 = ps2 + fppsc  # then IMG
-
-                # assemble pix and bb data into buffer, with offset from previous buffer
-                for b in range(BANDS):
-                    pix_buf[:, ps0:pe0, b] = b325[b][line : line + PPFP, :]
-                    pix_buf[:, ps1:pe1, b] = b295[b][line : line + PPFP, :]
-                    pix_buf[:, ps2:pe2, b] = pix_dat[b][line : line + PPFP, :]
-
-                ## ev_buf[ps2:pe2] = env[scan,:] # Use provided EVs for IMG
-                ## for i in range(bblen): # calculate EVs for BBs
-                ##   ev_buf[ps1+i] = (ev_buf[ps2] + int( (i-bblen)*fp_ev+0.5 ))%max_fpie
-                ##   ev_buf[ps0+i] = (ev_buf[ps1+i] - int( bblen*fp_ev+0.5 ))%max_fpie
-                ## scan += 1
-
-                ev_buf[ps0:pe0] = evc[evp, ev0 : ev0 + bblen]  # use generated EVs
-                ev_buf[ps1:pe1] = evc[evp, ev1 : ev1 + bblen]
-                ev_buf[ps2:pe2] = evc[evp, ev2 : ev2 + fppsc]
-
-                # step through buffer in packet steps (FPPPKT) starting from 0
-                bts = 0
-                bte = p0 + fpb3
-                t2k = pix_2k[line]
-                if p0 > 0:
-                    t2k += fp_dur * float(FPPPKT - p0)  # for next packet
-                ### angnadir = 180.0 - angnadir
-                print("====  ", datetime.now(), "  ====")
-                print(
-                    "L=%d PKT=%d GPT=%f GPP=%f T0=%f EVP=%d BTE=%d P0=%d PS0=%d PS1=%d PS2=%d PE2=%d"
-                    % (
-                        line,
-                        pkt_id,
-                        Time.time_j2000(t2k).gps,
-                        Time.time_j2000(pix_2k[line]).gps,
-                        Time.time_j2000(t0).gps,
-                        evp,
-                        bte,
-                        p0,
-                        ps0,
-                        ps1,
-                        ps2,
-                        pe2,
-                    )
-                )
-                while bts < bte:
-                    # see where current buffer pointer is
-                    pte = bts + FPPPKT
-                    # print("SCENE=%s PKT_ID=%d BTS=%d BTE=%d" %(scene, pkt_id,  bts, bte))
-                    # write a packet if sufficient data
-                    if pte <= bte:
-                        # write next packet ancillary data
-                        pid[pkt_id] = pkt_id + 1
-                        " *** add FPIE sync clock and FPIE 1st pix to FSWT offset (1MHz)"
-                        b = bts - p0
-                        if b >= ev0 and b < ev1:
-                            t = dt3
-                        elif b >= ev1 and b < ev2:
-                            t = dt2
-                        else:
-                            t = 0
-                        if prev == 0:
-                            fswt[pkt_id] = Time.time_j2000(t2k - t).gps
-                            if t == 0 and b >= 0:
-                                t2k += pkt_dur
-                        else:
-                            fswt[pkt_id] = Time.time_j2000(t0).gps
-                        print(
-                            "SCENE=%s Pkt %d GPT=%f T0=%f BTS=%d PTE=%d BTE=%d PREV=%d EV0=%d B=%d"
-                            % (
-                                scene,
-                                pkt_id,
-                                Time.time_j2000(t2k - t).gps,
-                                Time.time_j2000(t0).gps,
-                                bts,
-                                pte,
-                                bte,
-                                prev,
-                                ev_buf[bts],
-                                b,
-                            )
-                        )
-
-                        # write packet data
-                        lid[pkt_id, :] = ev_buf[bts:pte]
-                        for b in range(BANDS):
-                            bip[pkt_id, :, :, b] = pix_buf[
-                                :, bts:pte, bo[b]
-                            ].transpose()
-                        # next point in pix_buf
-                        bts = pte
-                        # next packet
-                        pkt_id += 1
-                        prev = 0
-
-                        if bts == bte:  # reached end of valid data in current pix_buf
-                            # reset offset into next pix_buf
-                            p0 = 0
-                            print(
-                                "End PIX_BUF SCENE=%d BTS=%d PKT_ID=%d"
-                                % (v, bts, pkt_id)
-                            )
-                            evp = 1 - evp  #  swap EV arrays
-
-                    else:  # at the remainder of current pix_buf
-                        # set offset to next pix_buf
-                        p0 = bte - bts
-                        prev = p0
-                        t0 = t2k  # save FSWT from end of current scan for next packet
-                        print(
-                            "Remainder SCENE=%d BTE=%d BTS=%d PKT_ID=%d T0=%f"
-                            % (v, bte, bts, pkt_id, Time.time_j2000(t0).gps)
-                        )
-                        # move remainder data to front of pix_buf
-                        pix_buf[:, :p0, :] = pix_buf[:, bts:bte, :]
-                        ev_buf[:p0] = ev_buf[bts:bte]
-                        evp = 1 - evp  #  swap EV arrays
-                        # escape bts while loop to go to next scene
-                        if v + 1 < total_scenes or line + PPFP < lines:
-                            bts = bte
-                        else:  # last runt packet of last scene< fill remaining with dummy
-                            bts = 0
-                            bte = FPPPKT
-                            print("Final runt packet: %d" % p0)
-                            pix_buf[0:PPFP, p0:FPPPKT, :] = 0xFFFF
-                            # ev_buf[ p0:FPPPKT ] = 0xffffffff
-                            ev_buf[p0:FPPPKT] = ev_buf[p0]
-                    # end writing current packet
-
-                # next line in scene
-                line += PPFP
-                # end copying current pix_buf to packets
+            # Assemble all the scans for the scene. scn_pix is indexed by
+            # scan, FP, pixel, L0B band
+            scn_pix = np.empty((nscan, fpb3, PPFP, BANDS), dtype=np.uint16)
+            for b in range(BANDS):
+                for fname, off, dlen in (
+                    ("/BlackBodyPixels/b%d_blackbody_325", ev0, bblen),
+                    ("/BlackBodyPixels/b%d_blackbody_295", ev1, bblen),
+                    ("/UncalibratedPixels/pixel_data_%d", ev2, fppsc),
+                ):
+                    fd = pix_fd if fname.startswith("/Unc") else bb_fd
+                    d = fd[fname % (bo[b] + 1)][:, :]
+                    scn_pix[:, off : off + dlen, :, b] = d.reshape(
+                        (nscan, PPFP, dlen)
+                    ).transpose(0, 2, 1)
+            scn_ev = evc[(tot_scan + np.arange(nscan)) % 2, :]
+
+            # Packet times. Only IMG packets advance the time, so we build
+            # this up with a (sequential) cumulative sum along each scan
+            p0 = (tot_scan + np.arange(nscan)) * fpb3 % FPPPKT
+            bstart = np.where(p0 > 0, FPPPKT - p0, 0)
+            b = bstart[:, np.newaxis] + kgrid * FPPPKT
+            valid = b + FPPPKT <= fpb3
+            t = np.where(
+                (b >= ev0) & (b < ev1), dt3, np.where((b >= ev1) & (b < ev2), dt2, 0)
+            )
+            t2k_start = pix_2k[np.arange(nscan) * PPFP].astype(np.float64)
+            t2k_start = np.where(
+                p0 > 0, t2k_start + fp_dur * (FPPPKT - p0).astype(np.float64), t2k_start
+            )
+            inc = np.zeros((nscan, kmax + 1), dtype=np.float64)
+            inc[:, 0] = t2k_start
+            inc[:, 1:] = np.where(valid & (t == 0), pkt_dur, 0.0)
+            t2k = np.add.accumulate(inc, axis=1)
+            # Time for the packets straddling the previous scan, followed
+            # by the packets starting in each scan
+            t0_scan = np.concatenate([[t0], t2k[:-1, kmax]])
+            ptime = np.concatenate([t0_scan[:, np.newaxis], t2k[:, :kmax] - t], axis=1)
+            pvalid = np.concatenate([(p0 > 0)[:, np.newaxis], valid], axis=1)
+            ptime = ptime[pvalid]
+            t0 = t2k[-1, kmax]
+
+            # Cut the stream into packets, keeping the remainder for the
+            # next scene
+            spix = np.concatenate([rem_pix, scn_pix.reshape((-1, PPFP, BANDS))])
+            sev = np.concatenate([rem_ev, scn_ev.reshape(-1)])
+            npkt = sev.shape[0] // FPPPKT
+            nfp = npkt * FPPPKT
+            p1 = tot_pkt + npkt
+            bip.resize(p1, 0)
+            lid.resize(p1, 0)
+            pid.resize(p1, 0)
+            flex_st.resize(p1, 0)
+            fswt.resize(p1, 0)
+            fpie_sync.resize(p1, 0)
+            fsw_sync.resize(p1, 0)
+            bip[tot_pkt:p1] = spix[:nfp].reshape((npkt, FPPPKT, PPFP, BANDS))
+            lid[tot_pkt:p1] = sev[:nfp].reshape((npkt, FPPPKT))
+            pid[tot_pkt:p1] = np.arange(tot_pkt + 1, p1 + 1)
+            fswt[tot_pkt:p1] = j2000_to_gps(ptime)
+
+            if v + 1 == total_scenes and sev.shape[0] > nfp:
+                # last runt packet of last scene, fill remaining with dummy.
+                # The EV fill is the EV following the remainder in the last
+                # scan buffer.
+                r = sev.shape[0] - nfp
+                print("Final runt packet: %d" % r)
+                p_last = (tot_scan + nscan - 1) * fpb3 % FPPPKT
+                ev_fill = sev[sev.shape[0] - fpb3 - p_last + r]
+                runt_pix = np.full((FPPPKT, PPFP, BANDS), 0xFFFF, dtype=np.uint16)
+                runt_pix[:r] = spix[nfp:]
+                runt_ev = np.full((FPPPKT,), ev_fill, dtype=np.uint32)
+                runt_ev[:r] = sev[nfp:]
+                p1 += 1
+                bip.resize(p1, 0)
+                lid.resize(p1, 0)
+                pid.resize(p1, 0)
+                flex_st.resize(p1, 0)
+                fswt.resize(p1, 0)
+                fpie_sync.resize(p1, 0)
+                fsw_sync.resize(p1, 0)
+                bip[p1 - 1] = runt_pix
+                lid[p1 - 1] = runt_ev
+                pid[p1 - 1] = p1
+                fswt[p1 - 1] = j2000_to_gps(t0)
+            rem_pix = spix[nfp:]
+            rem_ev = sev[nfp:]
+            tot_pkt = p1
+            tot_scan += nscan
+            p0 = rem_ev.shape[0]
 
             # close current raw pix and bb files
             pix_fd.close()
             bb_fd.close()
-            print("End SCENE=%s time=%s" % (scene, str(datetime.now())))
+            print(
+                "End SCENE=%s PKT_ID=%d time=%s" % (scene, tot_pkt, str(datetime.now()))
+            )
             l0b_fd.flush()
             # end writing packets for current scene file
         # *** take care of runt packet of last scene ***
-        print("End all scenes, TOT_LINES=%d runt P0=%d" % (tot_lines, p0))
+        print("End all scenes, TOT_PKT=%d runt P0=%d" % (tot_pkt, p0))
         # end scene files loop
 
         # Write L0B metadata
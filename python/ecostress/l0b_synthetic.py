@@ -0,0 +1,211 @@
+from __future__ import annotations
+import h5py  # type: ignore
+import math
+import re
+import numpy as np
+from geocal import Time  # type: ignore
+
+
+class L0bSynthetic(object):
+    """This creates a synthetic L0B file with an arbitrary number of
+    scenes, for benchmarking L1A_RAW.
+
+    Rather than simulating the data from scratch (which is what
+    L0BSimulate does, and which needs the full set of L1A files), we take
+    an existing L0B file and scene file (e.g., the 3 scene L0B in the
+    unit test data) and repeat it in time. Each copy is shifted to follow
+    the previous one, so the output looks like one long orbit. The
+    housekeeping data is trimmed to the packet time range (plus a little
+    padding) before repeating it, so its times stay increasing.
+
+    To exercise the error handling in L1A_RAW, we can also drop a
+    fraction of the packets at random and add a time code jump to a
+    number of packets spread through the file.
+
+    The bip data is copied a block of packets at a time, so this can be
+    used to create files much larger than memory."""
+
+    def __init__(
+        self,
+        l0b: str,
+        scene_file: str,
+        number_scene: int,
+        packet_drop_fraction: float = 0.0,
+        number_time_jump: int = 0,
+        time_jump: float = 0.001,
+        hk_pad: float = 10.0,
+        block_size: int = 1024,
+        seed: int = 1234,
+    ) -> None:
+        """Create a L0bSynthetic from the given L0B and scene file.
+        number_scene is the number of scenes in the output.
+        packet_drop_fraction is the fraction of packets to drop, and
+        number_time_jump the number of packets to add time_jump seconds to
+        (spread evenly through the output).
+
+        hk_pad is the padding in seconds we keep for the housekeeping data
+        around the packet time range. block_size is the number of packets
+        we copy at a time."""
+        self.l0b = l0b
+        self.scene_file = scene_file
+        self.number_scene = number_scene
+        self.packet_drop_fraction = packet_drop_fraction
+        self.number_time_jump = number_time_jump
+        self.time_jump = time_jump
+        self.hk_pad = hk_pad
+        self.block_size = block_size
+        self.seed = seed
+        self.scenes = []
+        with open(self.scene_file, "r") as fh:
+            for ln in fh:
+                if ln.strip() == "":
+                    continue
+                orbit, scene_id, sts, ste = re.split(r"\s+", ln.strip())
+                self.scenes.append(
+                    (
+                        int(orbit),
+                        int(scene_id),
+                        Time.parse_time(sts).gps,
+                        Time.parse_time(ste).gps,
+                    )
+                )
+        if len(self.scenes) == 0:
+            raise RuntimeError("No scenes found in %s" % self.scene_file)
+
+    def _packet_time(self, fin: h5py.File) -> np.ndarray:
+        """Packet GPS times, calculated the same way L1aRawPixGenerate
+        does."""
+        return (
+            fin["flex/time_fsw"][:]
+            + (
+                fin["flex/time_sync_fpie"][:].astype(np.int64)
+                - fin["flex/time_sync_fsw"][:].astype(np.int64)
+            )
+            / 1000000.0
+        )
+
+    def create_file(self, l0b_fname: str, scene_fname: str) -> None:
+        """Write out the synthetic L0B file and the matching scene
+        file."""
+        rng = np.random.default_rng(self.seed)
+        with h5py.File(self.l0b, "r") as fin:
+            gpt = self._packet_time(fin)
+            npkt = gpt.shape[0]
+            tmin = gpt.min() - self.hk_pad
+            # Each copy is shifted by tile_dt. Round to a whole number of
+            # seconds, so the fractional part of all the times is unchanged
+            tile_dt = float(math.ceil(gpt.max() + self.hk_pad - tmin))
+            ncopy = int(math.ceil(self.number_scene / len(self.scenes)))
+
+            # Packets we keep from each copy. Always keep the first packet of
+            # a copy, so the copies stay in time order
+            keep = rng.random((ncopy, npkt)) >= self.packet_drop_fraction
+            keep[:, 0] = True
+            nout = int(keep.sum())
+            jump_index = np.zeros(0, dtype=np.int64)
+            if self.number_time_jump > 0:
+                jump_index = np.unique(
+                    np.linspace(0, nout - 1, self.number_time_jump + 2, dtype=np.int64)[
+                        1:-1
+                    ]
+                )
+            print(
+                "Creating %s with %d copies of %s, %d packets, %d dropped"
+                % (l0b_fname, ncopy, self.l0b, nout, ncopy * npkt - nout)
+            )
+
+            with h5py.File(l0b_fname, "w") as fout:
+                for k, v in fin.attrs.items():
+                    fout.attrs[k] = v
+
+                def copy_item(name: str, obj: h5py.HLObject) -> None:
+                    if isinstance(obj, h5py.Group):
+                        g = fout.require_group(name)
+                        for k, v in obj.attrs.items():
+                            g.attrs[k] = v
+                        return
+                    if name.startswith("flex/") and obj.shape[:1] == (npkt,):
+                        self._copy_packet_data(fout, obj, keep, tile_dt)
+                        if name == "flex/time_fsw" and jump_index.shape[0] > 0:
+                            d = fout[name]
+                            d[jump_index] = d[jump_index] + self.time_jump
+                    elif name.startswith("hk/") and obj.ndim > 0:
+                        self._copy_hk_data(fout, obj, tmin, tile_dt, ncopy)
+                    else:
+                        fout.create_dataset(name, data=obj[()], dtype=obj.dtype)
+                    for k, v in obj.attrs.items():
+                        fout[name].attrs[k] = v
+
+                fin.visititems(copy_item)
+
+        with open(scene_fname, "w") as fh:
+            for i in range(self.number_scene):
+                c, j = divmod(i, len(self.scenes))
+                orbit, _, sts, ste = self.scenes[j]
+                print(
+                    "%05d\t%03d\t%s\t%s"
+                    % (
+                        orbit,
+                        i + 1,
+                        str(Time.time_gps(sts + c * tile_dt))[:26],
+                        str(Time.time_gps(ste + c * tile_dt))[:26],
+                    ),
+                    file=fh,
+                )
+
+    def _copy_packet_data(
+        self,
+        fout: h5py.File,
+        dset: h5py.Dataset,
+        keep: np.ndarray,
+        tile_dt: float,
+    ) -> None:
+        """Copy per packet data, a block at a time. The packet time is
+        shifted by tile_dt for each copy."""
+        ncopy, npkt = keep.shape
+        shift = dset.name == "/flex/time_fsw"
+        dout = fout.create_dataset(
+            dset.name,
+            shape=(int(keep.sum()),) + dset.shape[1:],
+            dtype=dset.dtype,
+            chunks=dset.chunks,
+            compression=dset.compression,
+            compression_opts=dset.compression_opts,
+        )
+        j = 0
+        for c in range(ncopy):
+            for i0 in range(0, npkt, self.block_size):
+                i1 = min(i0 + self.block_size, npkt)
+                d = dset[i0:i1][keep[c, i0:i1]]
+                if shift:
+                    d = d + c * tile_dt
+                dout[j : j + d.shape[0]] = d
+                j += d.shape[0]
+
+    def _copy_hk_data(
+        self,
+        fout: h5py.File,
+        dset: h5py.Dataset,
+        tmin: float,
+        tile_dt: float,
+        ncopy: int,
+    ) -> None:
+        """Copy housekeeping data, trimmed to the copy time range and
+        repeated. Each housekeeping group has its own "time" dataset, and
+        the time fields get shifted for each copy."""
+        d = dset[()]
+        # Find the time for this data, which is the closest "time" dataset
+        # in this or a parent group
+        grp = dset.parent
+        while grp.name != "/":
+            if "time" in grp and grp["time"].shape == d.shape[:1]:
+                t = grp["time"][:]
+                d = d[(t >= tmin) & (t < tmin + tile_dt)]
+                break
+            grp = grp.parent
+        shift = dset.name.split("/")[-1] in ("time", "time_fsw")
+        res = [d + c * tile_dt if shift else d for c in range(ncopy)]
+        fout.create_dataset(dset.name, data=np.concatenate(res), dtype=dset.dtype)
+
+
+__all__ = ["L0bSynthetic"]
@@ -0,0 +1,311 @@
+from __future__ import annotations
+import h5py  # type: ignore
+import numpy as np
+import scipy.special  # type: ignore
+import re
+import typing
+from loguru import logger
+from .exception import VicarRunError
+
+# Fill values used by the VICAR calibration (el1a_2pt.pdf)
+FILL_BAD_DATA = -9999
+FILL_STRIPE = -9998
+
+
+class L1aBbCalibrate(object):
+    """This is a python version of the VICAR procedures el1a_bbcal.pdf and
+    el1a_2pt.pdf, which do the two point blackbody calibration of the
+    L1A_RAW_PIX data.
+
+    Rather than writing out scratch VICAR files for each step, we read
+    L1A_RAW_PIX and L1A_BB directly and calculate the output one band at a
+    time. The functions here return the same data that the VICAR
+    procedure writes out (e.g., image_dn is UncalibratedDN/b<band>_image.hlf,
+    gain is ImgRadiance/b<band>_gain.rel), so L1aPixGenerate can write
+    either one to the output files.
+
+    Band numbers are the VICAR ones, so band 1 is SWIR and bands 2 to 6
+    are the TIR bands.
+
+    We don't support the TVAC=1 option, which only generates additional
+    test products and isn't part of the L1A_PIX or gain file. The SWIR dcc
+    (a visual product only) uses a python version of the VICAR fitg
+    gaussian stretch, so it is close to but not byte for byte the same as
+    the VICAR output."""
+
+    # Number of lines in a scan
+    SCAN_LINES = 256
+    # Lines in each scan (0 based) that have stripes, for bands 1, 2 and 6
+    STRIPE_LINES = range(32, 48)
+    # Lines in each scan (0 based) that are bad for band 5
+    BAND5_BAD_LINES = (0, 1, 218, 219)
+    # Worst SWIR lines in each scan (0 based), which we interpolate
+    SWIR_REPAIR_LINES = (93, 194, 208, 240)
+
+    # The combinations of RTDs we look at (1 based, like el1a_bbcal.pdf)
+    RTD_COMBINATIONS = (
+        (1, 2, 3, 4, 5),
+        (1, 2, 3, 4),
+        (1, 2, 3),
+        (2, 3, 4, 5),
+        (2, 3, 4),
+        (3, 4, 5),
+        (1, 3, 4, 5),
+        (1, 3, 4),
+        (1, 2, 4, 5),
+        (1, 2, 4),
+        (2, 4, 5),
+        (1, 2, 3, 5),
+        (2, 3, 5),
+        (1, 2, 5),
+        (1, 3, 5),
+        (1, 4, 5),
+    )
+
+    def __init__(self, l1a_bb: str, l1a_raw: str, upf_fname: str) -> None:
+        """Create a L1aBbCalibrate for the given L1A_BB, L1A_RAW_PIX
+        and UPF file (L1A_PCF_UPF.txt in the L1_OSP_DIR)."""
+        self.l1a_bb = l1a_bb
+        self.l1a_raw = l1a_raw
+        self.upf_fname = upf_fname
+        self.upf = self.read_upf(upf_fname)
+        self.planck_algorithm = int(self.upf_value("PLANCK_ALGORITHM", 1))
+        self.c1 = self.upf_value("FIRST_CONSTANT_C1", 1.191042e08)
+        self.c2 = self.upf_value("SECOND_CONSTANT_C2", 14387.752)
+        self.a1 = self.upf_value("WATTS_CONVERT", 8.73068e-13)
+        self.tol = self.upf_value("ITERATION_TOLERANCE", 0.00000001)
+        self.bbgain = self.upf_value("BBTEMP_GAIN", 1.0)
+        self.bboffs = self.upf_value("BBTEMP_OFFS", 0.0)
+        # Pre-flight default temperatures, used if the RTDs are bad. These
+        # aren't in the UPF, they are parameters in el1a_bbcal.pdf
+        self.pre325 = 318.75
+        self.pre295 = 293.00
+        self._fpa_temperature: dict[int, float] = {}
+        self.rtd_failure = False
+        with h5py.File(self.l1a_raw, "r") as f:
+            self.shape = f["UncalibratedPixels/pixel_data_1"].shape
+        if self.shape[0] % self.SCAN_LINES != 0:
+            raise VicarRunError(
+                "L1A_RAW_PIX has %d lines, which isn't a whole number of scans"
+                % self.shape[0]
+            )
+
+    @classmethod
+    def read_upf(cls, fname: str) -> dict[str, str]:
+        """Read the UPF file, which has lines of the form KEYWORD=value."""
+        res = {}
+        with open(fname, "r") as fh:
+            for ln in fh:
+                m = re.match(r"\s*(\w+)\s*=\s*(\S+)", ln)
+                if m:
+                    res[m.group(1)] = m.group(2)
+        return res
+
+    def upf_value(self, keyword: str, default: float) -> float:
+        """Return the given UPF value as a float, or the default if it isn't
+        found in the UPF file."""
+        if keyword in self.upf:
+            return float(self.upf[keyword])
+        return default
+
+    def blackbody_temperature(
+        self, rtd: np.ndarray, tmin: float, tmax: float
+    ) -> tuple[float, float]:
+        """Determine the blackbody temperature from the 5 pt-RTD
+        measurements. We average all the combinations of 3, 4 and 5 RTDs,
+        and select the combination with the smallest standard deviation
+        that has a temperature in the range tmin to tmax.
+
+        Returns the temperature and standard deviation, or (0, 0) if no
+        combination is in range. Like the VICAR hist program, zero values
+        are excluded."""
+        res = []
+        for c in self.RTD_COMBINATIONS:
+            v = rtd[[i - 1 for i in c]]
+            v = v[v != 0]
+            if v.shape[0] == 0:
+                continue
+            res.append((v.std(), v.mean()))
+        for sd, avg in sorted(res):
+            if tmin <= avg <= tmax:
+                return float(avg), float(sd)
+        return 0.0, 0.0
+
+    def fpa_temperature(self, temp: int) -> np.ndarray:
+        """The hot (temp=325) or cold (temp=295) blackbody temperature,
+        as a nline x 1 array. This is BlackbodyTemp/fpa_<temp>.rel in the
+        VICAR output.
+
+        If the RTDs are bad we fall back to the pre-flight temperature, and
+        set rtd_failure to True."""
+        if temp not in self._fpa_temperature:
+            if temp == 325:
+                tmin, tmax, tdef = 310, 330, self.pre325
+            else:
+                tmin, tmax, tdef = 275, 305, self.pre295
+            with h5py.File(self.l1a_bb, "r") as f:
+                rtd = f["rtdBlackbodyGradients/RTD_%dK" % temp][0, :5].astype(
+                    np.float64
+                )
+            t, sd = self.blackbody_temperature(rtd, tmin, tmax)
+            logger.info(f"RTD {temp}K temperature {t:f}, standard deviation {sd:f}")
+            if sd > 0.3 or t < 1:
+                logger.warning(f"Bad RTDs, using default temperature {tdef:f}")
+                self.rtd_failure = True
+                t = tdef
+            self._fpa_temperature[temp] = t * self.bbgain + self.bboffs
+        return np.full((self.shape[0], 1), self._fpa_temperature[temp], np.float32)
+
+    def _band_value(self, name: str, band: int) -> float:
+        return self.upf_value("B%d_%s" % (band, name), 0.0)
+
+    def planck_radiance(self, temp: np.ndarray | float, band: int) -> np.ndarray:
+        """Calculate the blackbody radiance for the given temperature for
+        the given TIR band. Uses either the center wavelength (algorithm 1)
+        or integrates over the band (algorithm 2)."""
+        t = np.asarray(temp, dtype=np.float64)
+        cw = self._band_value("CW", band)
+        if self.planck_algorithm == 1:
+            return self.c1 / (cw**5 * (np.exp(self.c2 / (cw * t)) - 1))
+
+        def band_sum(w: float) -> np.ndarray:
+            x = self.c2 / w / t
+            s = np.zeros_like(t)
+            for n in range(1, 101):
+                xn = n * x
+                term = np.exp(-xn) / n**4 * (6.0 + xn * (6.0 + xn * (3.0 + xn)))
+                s = s + term
+                if np.all(term / s < self.tol):
+                    break
+            return s
+
+        s1 = band_sum(self._band_value("LW", band))
+        s2 = band_sum(self._band_value("HW", band))
+        return self.a1 * t**4 * (s2 - s1) * 10000 / self._band_value("BW", band) / 3.14
+
+    def _to_int16(self, d: np.ndarray) -> np.ndarray:
+        """The VICAR code converts the data to int16 using gdal_translate,
+        which clips out of range values (so the 0xffff fill becomes
+        32767). Do the same here."""
+        return np.clip(d, -32768, 32767).astype(np.int16)
+
+    def image_dn(self, band: int) -> np.ndarray:
+        """Raw image DN for the given band. This is
+        UncalibratedDN/b<band>_image.hlf in the VICAR output."""
+        with h5py.File(self.l1a_raw, "r") as f:
+            return self._to_int16(f["UncalibratedPixels/pixel_data_%d" % band][:])
+
+    def bb_dn(self, band: int, temp: int) -> np.ndarray:
+        """Blackbody DN averaged over the 64 blackbody pixels in each line,
+        as a nline x 1 array. This is BlackBodyDN/dn<temp>b<band>.rel in
+        the VICAR output."""
+        with h5py.File(self.l1a_bb, "r") as f:
+            d = f["BlackBodyPixels/b%d_blackbody_%d" % (band, temp)][:]
+        if d.shape[0] != self.shape[0]:
+            raise VicarRunError(
+                "L1A_BB has %d lines, but L1A_RAW_PIX has %d"
+                % (d.shape[0], self.shape[0])
+            )
+        return self._to_int16(d).astype(np.float32).mean(axis=1, keepdims=True)
+
+    def _scan_line_mask(self, lines: typing.Iterable[int]) -> np.ndarray:
+        """Boolean array, true for the given lines in each scan."""
+        r = np.zeros((self.SCAN_LINES,), dtype=bool)
+        r[list(lines)] = True
+        return np.tile(r, self.shape[0] // self.SCAN_LINES)[:, np.newaxis]
+
+    def mask(self, band: int, dn: np.ndarray) -> np.ndarray:
+        """Data mask for the given band, 1 for good data, 0 for bad or
+        missing data and -1 for stripes."""
+        good = (dn >= 0) & (dn <= 32000)
+        res = np.zeros(dn.shape, dtype=np.int8)
+        if band in (1, 2, 6):
+            stripe = self._scan_line_mask(self.STRIPE_LINES)
+            res[good & ~stripe] = 1
+            res[np.broadcast_to(stripe, dn.shape)] = -1
+        elif band == 5:
+            res[good & ~self._scan_line_mask(self.BAND5_BAD_LINES)] = 1
+        else:
+            res[(dn > 0) & (dn <= 32000)] = 1
+        return res
+
+    def _apply_mask(self, d: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        d[mask == 0] = FILL_BAD_DATA
+        d[mask == -1] = FILL_STRIPE
+        return d
+
+    def _line_gain_offset(self, band: int) -> tuple[np.ndarray, np.ndarray]:
+        """Gain and offset for each line, as nline x 1 arrays."""
+        r325 = self.planck_radiance(self.fpa_temperature(325), band)
+        r295 = self.planck_radiance(self.fpa_temperature(295), band)
+        dn325 = self.bb_dn(band, 325).astype(np.float64)
+        dn295 = self.bb_dn(band, 295).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            offset = (r325 * dn295 - r295 * dn325) / (dn295 - dn325)
+            gain = (r295 - r325) / (dn295 - dn325)
+        # VICAR f2 returns 0 for division by zero
+        offset[~np.isfinite(offset)] = 0
+        gain[~np.isfinite(gain)] = 0
+        return gain.astype(np.float32), offset.astype(np.float32)
+
+    def gain_offset(self, band: int) -> tuple[np.ndarray, np.ndarray]:
+        """Gain and offset image for the given TIR band, with -9999 for bad
+        data and -9998 for stripes. This is ImgRadiance/b<band>_gain.rel and
+        ImgRadiance/b<band>_offset.rel in the VICAR output.
+
+        The offset includes the linearity correction (B<band>IVAL and
+        B<band>SINC in the UPF)."""
+        gain, offset = self._line_gain_offset(band)
+        mask = self.mask(band, self.image_dn(band))
+        nsamp = self.shape[1]
+        lin = self.upf_value("B%dIVAL" % band, 0.0) + self.upf_value(
+            "B%dSINC" % band, 0.0
+        ) * np.arange(nsamp, dtype=np.float32)
+        gimg = np.empty(self.shape, dtype=np.float32)
+        gimg[:] = gain
+        oimg = offset + lin.astype(np.float32)
+        return self._apply_mask(gimg, mask), self._apply_mask(oimg, mask)
+
+    def gaussian_fit(
+        self, d: np.ndarray, mean: float = 127.5, sigma: float = 3.5
+    ) -> np.ndarray:
+        """Stretch d so its histogram matches a gaussian with the given mean,
+        with 0 to 255 covering sigma standard deviations on each side.
+        This is the equivalent of the VICAR "fitg 'byte 'gauss"."""
+        v, inv, cnt = np.unique(d, return_inverse=True, return_counts=True)
+        cdf = (np.cumsum(cnt) - cnt / 2.0) / d.size
+        z = scipy.special.ndtri(cdf)
+        r = np.clip(np.round(mean + z * (mean / sigma)), 0, 255)
+        return r[inv].reshape(d.shape).astype(np.uint8)
+
+    def swir_dcc(self) -> np.ndarray:
+        """SWIR visual product (deprecated counts correction). This isn't
+        calibrated, it is just stretched for viewing. This is
+        ImgRadiance/b1_dcc.hlf in the VICAR output."""
+        dn = self.image_dn(1)
+        mask = self.mask(1, dn)
+        if dn.mean() > 32000:
+            # SWIR data is missing
+            return self._apply_mask(dn, mask)
+        # Stretch each line of the scans separately, across all the scans
+        nscan = self.shape[0] // self.SCAN_LINES
+        d = dn.reshape((nscan, self.SCAN_LINES, self.shape[1]))
+        res = np.empty(d.shape, dtype=np.uint8)
+        for i in range(self.SCAN_LINES):
+            res[:, i, :] = self.gaussian_fit(d[:, i, :])
+        res = res.reshape(self.shape)
+        # Invert the image
+        vmax = int(res[res != 0].max()) + 1 if np.any(res != 0) else 1
+        res = np.clip(vmax - res.astype(np.int16), 0, 255)
+        # Repair the worst lines, interpolating from the line before and
+        # after
+        for i in range(nscan):
+            for ln in self.SWIR_REPAIR_LINES:
+                j = i * self.SCAN_LINES + ln
+                res[j, :] = (res[j - 1, :] + res[j + 1, :] + 1) // 2
+        res = res.astype(np.int16)
+        res[mask == -1] = FILL_STRIPE
+        return res
+
+
+__all__ = ["L1aBbCalibrate"]
@@ -4,6 +4,9 @@ import h5py  # type: ignore
 from .write_standard_metadata import WriteStandardMetadata
 from .misc import process_run
 from .exception import VicarRunError
+from .l1a_bb_calibrate import L1aBbCalibrate
+from .parallel_chunk_writer import ParallelChunkWriter
+import numpy as np
 import re
 import os
 import subprocess
@@ -14,6 +17,37 @@ if typing.TYPE_CHECKING:
     from .run_config import RunConfig
 
 
+class VicarCalibrateOutput(object):
+    """This gives access to the output of the VICAR procedure el1a_bbcal,
+    with the same interface as L1aBbCalibrate."""
+
+    def __init__(self, dirname: str) -> None:
+        self.dirname = dirname
+        self.shape = self.image_dn(1).shape
+
+    def image_dn(self, band: int) -> np.ndarray:
+        return geocal.mmap_file(
+            "%s/UncalibratedDN/b%d_image.hlf" % (self.dirname, band)
+        )
+
+    def fpa_temperature(self, temp: int) -> np.ndarray:
+        return geocal.mmap_file("%s/BlackbodyTemp/fpa_%d.rel" % (self.dirname, temp))
+
+    def bb_dn(self, band: int, temp: int) -> np.ndarray:
+        return geocal.mmap_file(
+            "%s/BlackBodyDN/dn%db%d.rel" % (self.dirname, temp, band)
+        )
+
+    def gain_offset(self, band: int) -> tuple[np.ndarray, np.ndarray]:
+        return (
+            geocal.mmap_file("%s/ImgRadiance/b%d_gain.rel" % (self.dirname, band)),
+            geocal.mmap_file("%s/ImgRadiance/b%d_offset.rel" % (self.dirname, band)),
+        )
+
+    def swir_dcc(self) -> np.ndarray:
+        return geocal.mmap_file("%s/ImgRadiance/b1_dcc.hlf" % self.dirname)
+
+
 class L1aPixGenerate(object):
     """This generates a L1A pix file from the given L1A_BB and L1A_RAW
     files."""
@@ -31,10 +65,24 @@ class L1aPixGenerate(object):
         collection_label: str = "ECOSTRESS",
         pge_version: str = "0.30",
         file_version: str = "01",
+        calibration_engine: str = "vicar",
+        number_cpu: int = 1,
     ) -> None:
         """Create a L1aPixGenerate with the given input files
         and output file name. To actually generate, execute the 'run'
-        command."""
+        command.
+
+        calibration_engine can be "vicar" to run the VICAR procedure
+        el1a_bbcal, or "python" to use L1aBbCalibrate which does the same
+        calculation in process without any scratch files.
+
+        number_cpu is the number of threads to use to compress the
+        output data."""
+        if calibration_engine not in ("vicar", "python"):
+            raise RuntimeError(
+                "Unknown calibration_engine '%s', should be 'vicar' or 'python'"
+                % calibration_engine
+            )
         self.l1a_bb = os.path.abspath(l1a_bb)
         self.l1a_raw = os.path.abspath(l1a_raw)
         self.l1_osp_dir = os.path.abspath(l1_osp_dir)
@@ -46,6 +94,8 @@ class L1aPixGenerate(object):
         self.build_id = build_id
         self.pge_version = pge_version
         self.file_version = file_version
+        self.calibration_engine = calibration_engine
+        self.number_cpu = number_cpu
 
     def _create_dir(self) -> str:
         i = 1
@@ -59,11 +109,12 @@ class L1aPixGenerate(object):
                 i += 1
         return dirname
 
-    def run(self) -> None:
-        """Do the actual generation of data."""
-        # Run Tom's vicar code. Note we assume we are already in the directory
-        # to run in, and that Tom's code is on the TAE_PATH. This is try in
-        # the way we run with the top level script
+    def _run_vicar(self) -> str:
+        """Run Tom's VICAR calibration code, returning the directory the
+        output is in."""
+        # Note we assume we are already in the directory to run in, and
+        # that Tom's code is on the TAE_PATH. This is try in the way we run
+        # with the top level script
         curdir = os.getcwd()
         # The old VICAR programs use a lot of stack space
         # (specifically ibis calls). Linux usually has 8M, we need at
@@ -120,69 +171,65 @@ class L1aPixGenerate(object):
                 raise VicarRunError(mtch.group(2))
         else:
             raise VicarRunError("Success result not seen in log")
+        return dirname
+
+    def run(self) -> None:
+        """Do the actual generation of data."""
+        cal: L1aBbCalibrate | VicarCalibrateOutput
+        if self.calibration_engine == "python":
+            cal = L1aBbCalibrate(
+                self.l1a_bb, self.l1a_raw, "%s/L1A_PCF_UPF.txt" % self.l1_osp_dir
+            )
+            # Check the blackbody temperatures before writing anything,
+            # the VICAR code fails the job if the RTDs are bad.
+            cal.fpa_temperature(325)
+            cal.fpa_temperature(295)
+            if cal.rtd_failure:
+                raise VicarRunError("pt-RTD Temperature Failure Detected")
+        else:
+            cal = VicarCalibrateOutput(self._run_vicar())
         fout = h5py.File(self.output_name, "w")
         fout_gain = h5py.File(self.output_gain_name, "w")
-        # Copy output from vicar into output file.
-        g = fout.create_group("UncalibratedDN")
-        for b in range(1, 7):
-            t = g.create_dataset(
-                "b%d_image" % b,
-                data=geocal.mmap_file("%s/UncalibratedDN/b%d_image.hlf" % (dirname, b)),
-                compression="gzip",
-            )
-            t.attrs["Units"] = "dimensionless"
-            t.attrs["valid_min"] = 0
-            t.attrs["valid_max"] = 32767
-        g = fout.create_group("BlackbodyTemp")
-        for temp in (325, 295):
-            t = g.create_dataset(
-                "fpa_%d" % temp,
-                data=geocal.mmap_file("%s/BlackbodyTemp/fpa_%d.rel" % (dirname, temp)),
-                compression="gzip",
-            )
-            t.attrs["Units"] = "K"
-        g["fpa_325"].attrs["valid_min"] = 310
-        g["fpa_325"].attrs["valid_max"] = 330
-        g["fpa_295"].attrs["valid_min"] = 275
-        g["fpa_295"].attrs["valid_max"] = 305
-
-        g = fout.create_group("BlackbodyBandDN")
-        for b in range(1, 7):
-            for temp in (325, 295):
-                t = g.create_dataset(
-                    "b%d_%d" % (b, temp),
-                    data=geocal.mmap_file(
-                        "%s/BlackBodyDN/dn%db%d.rel" % (dirname, temp, b)
-                    ),
-                    compression="gzip",
-                )
+        # Copy calibration output into output file. The compression is
+        # done in parallel by the writer, reading directly from the VICAR
+        # memory mapped files.
+        with ParallelChunkWriter(self.number_cpu) as writer:
+            g = fout.create_group("UncalibratedDN")
+            for b in range(1, 7):
+                t = writer.create_dataset(g, "b%d_image" % b, cal.image_dn(b))
                 t.attrs["Units"] = "dimensionless"
                 t.attrs["valid_min"] = 0
                 t.attrs["valid_max"] = 32767
-        g = fout_gain.create_group("Gain")
-        g2 = fout_gain.create_group("Offset")
-        for b in range(1, 6):
-            t = g.create_dataset(
-                "b%d_gain" % b,
-                data=geocal.mmap_file("%s/ImgRadiance/b%d_gain.rel" % (dirname, b + 1)),
-                compression="gzip",
-            )
-            t.attrs["Units"] = "W/m^2/sr/um"
-            t = g2.create_dataset(
-                "b%d_offset" % b,
-                data=geocal.mmap_file(
-                    "%s/ImgRadiance/b%d_offset.rel" % (dirname, b + 1)
-                ),
-                compression="gzip",
-            )
-            t.attrs["Units"] = "W/m^2/sr/um"
-        g = fout_gain.create_group("SWIR")
-        t = g.create_dataset(
-            "b6_dcc",
-            data=geocal.mmap_file("%s/ImgRadiance/b1_dcc.hlf" % dirname),
-            compression="gzip",
-        )
-        t.attrs["Units"] = "dimensionless"
+            g = fout.create_group("BlackbodyTemp")
+            for temp in (325, 295):
+                t = writer.create_dataset(g, "fpa_%d" % temp, cal.fpa_temperature(temp))
+                t.attrs["Units"] = "K"
+            g["fpa_325"].attrs["valid_min"] = 310
+            g["fpa_325"].attrs["valid_max"] = 330
+            g["fpa_295"].attrs["valid_min"] = 275
+            g["fpa_295"].attrs["valid_max"] = 305
+
+            g = fout.create_group("BlackbodyBandDN")
+            for b in range(1, 7):
+                for temp in (325, 295):
+                    t = writer.create_dataset(
+                        g, "b%d_%d" % (b, temp), cal.bb_dn(b, temp)
+                    )
+                    t.attrs["Units"] = "dimensionless"
+                    t.attrs["valid_min"] = 0
+                    t.attrs["valid_max"] = 32767
+            g = fout_gain.create_group("Gain")
+            g2 = fout_gain.create_group("Offset")
+            for b in range(1, 6):
+                gain, offset = cal.gain_offset(b + 1)
+                t = writer.create_dataset(g, "b%d_gain" % b, gain)
+                t.attrs["Units"] = "W/m^2/sr/um"
+                t = writer.create_dataset(g2, "b%d_offset" % b, offset)
+                t.attrs["Units"] = "W/m^2/sr/um"
+                del gain, offset
+            g = fout_gain.create_group("SWIR")
+            t = writer.create_dataset(g, "b6_dcc", cal.swir_dcc())
+            t.attrs["Units"] = "dimensionless"
         # Copy over metadata
         fin = h5py.File(self.l1a_raw, "r")
         g = fout.create_group("Time")
@@ -259,7 +306,7 @@ class L1aPixGenerate(object):
             )
         except KeyError:
             pass
-        shp = geocal.mmap_file("%s/UncalibratedDN/b1_image.hlf" % dirname).shape
+        shp = cal.shape
         m.set("ImageLines", shp[0])
         m.set("ImagePixels", shp[1])
         m2.set("ImageLines", shp[0])
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import h5py  # type: ignore
+import numpy as np
+import typing
+
+
+class L1aPixScanReader(object):
+    """This reads the DN, gain and offset for one scan of a band from
+    the L1A_PIX and L1A_RAD_GAIN files.
+
+    This replaces going through GdalRasterImage (as EcostressRadApply
+    does). GDAL opens the file separately for each of the DN, gain and
+    offset of each band, and the GDAL HDF5 driver reads in its own tiles
+    without regard to the HDF5 chunking. Here we open each file once, and
+    keep the datasets open so the HDF5 chunk cache is kept between scans.
+    The chunk cache is made large enough to hold the chunks that
+    straddle a scan boundary, so each compressed chunk only gets
+    decompressed once as we go through the scans in order.
+
+    Data is read directly into the output array with the type we want
+    (int32 DN, float64 gain and offset), so we don't make extra copies.
+
+    This can be pickled to send to a multiprocessing pool, the files are
+    reopened in each process."""
+
+    def __init__(
+        self,
+        l1a_pix: str,
+        l1a_gain: str,
+        number_line_scan: int = 256,
+        chunk_cache_size: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Open the given L1A_PIX and L1A_RAD_GAIN files. chunk_cache_size
+        is the size in bytes of the HDF5 chunk cache for each dataset."""
+        self.l1a_pix_fname = l1a_pix
+        self.l1a_gain_fname = l1a_gain
+        self.number_line_scan = number_line_scan
+        self.chunk_cache_size = chunk_cache_size
+        self._open()
+
+    def _open(self) -> None:
+        # w0 of 1 means chunks that have been fully read are evicted
+        # first, which is what we want since we go through the scans in
+        # order.
+        self.l1a_pix = h5py.File(
+            self.l1a_pix_fname, "r", rdcc_nbytes=self.chunk_cache_size, rdcc_w0=1.0
+        )
+        self.l1a_gain = h5py.File(
+            self.l1a_gain_fname, "r", rdcc_nbytes=self.chunk_cache_size, rdcc_w0=1.0
+        )
+        self._dataset: dict[str, h5py.Dataset] = {}
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = self.__dict__.copy()
+        del state["l1a_pix"]
+        del state["l1a_gain"]
+        del state["_dataset"]
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    def close(self) -> None:
+        self._dataset = {}
+        self.l1a_pix.close()
+        self.l1a_gain.close()
+
+    def __enter__(self) -> L1aPixScanReader:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def _get_dataset(self, f: h5py.File, name: str) -> h5py.Dataset:
+        # Keep the dataset open, the chunk cache belongs to the open dataset
+        key = f"{f.filename}:{name}"
+        if key not in self._dataset:
+            self._dataset[key] = f[name]
+        return self._dataset[key]
+
+    def dn_dataset(self, band: int) -> h5py.Dataset:
+        """The DN data for the given band. The SWIR band (band 0) doesn't
+        have a gain, we instead use the b6_dcc from the gain file."""
+        if band == 0:
+            return self._get_dataset(self.l1a_gain, "SWIR/b6_dcc")
+        return self._get_dataset(self.l1a_pix, "UncalibratedDN/b%d_image" % (band + 1))
+
+    def shape(self, band: int) -> tuple[int, int]:
+        """Number of lines and samples for the given band."""
+        return self.dn_dataset(band).shape
+
+    def number_scan(self, band: int) -> int:
+        return self.shape(band)[0] // self.number_line_scan
+
+    def _read(
+        self, dset: h5py.Dataset, scan_index: int, dtype: typing.Any
+    ) -> np.ndarray:
+        sline = scan_index * self.number_line_scan
+        res = np.empty((self.number_line_scan, dset.shape[1]), dtype=dtype)
+        dset.read_direct(res, np.s_[sline : sline + self.number_line_scan, :])
+        return res
+
+    def scan_data(
+        self, band: int, scan_index: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read the DN, gain and offset for one scan of one band. For the
+        SWIR band we use a gain of 1 and offset of 0."""
+        dn = self._read(self.dn_dataset(band), scan_index, np.int32)
+        if band == 0:
+            return dn, np.ones(dn.shape), np.zeros(dn.shape)
+        gain = self._read(
+            self._get_dataset(self.l1a_gain, "Gain/b%d_gain" % band),
+            scan_index,
+            np.float64,
+        )
+        offset = self._read(
+            self._get_dataset(self.l1a_gain, "Offset/b%d_offset" % band),
+            scan_index,
+            np.float64,
+        )
+        return dn, gain, offset
+
+    def radiance(self, band: int, scan_index: int) -> np.ndarray:
+        """Radiance for one scan, with bad data set to -9999. This is the
+        same as EcostressRadApply, and is mostly useful for testing."""
+        dn, gain, offset = self.scan_data(band, scan_index)
+        return np.where(
+            (dn < 0) | (gain < -9998) | (offset < -9998), -9999.0, dn * gain + offset
+        )
+
+
+__all__ = ["L1aPixScanReader"]
@@ -92,11 +92,8 @@ class L1aPixSimulate(object):
         g = fout.create_group("Time")
         t = g.create_dataset(
             "line_start_time_j2000",
-            data=np.array(
-                [
-                    self.igc.time_table.time(geocal.ImageCoordinate(i, 0))[0].j2000
-                    for i in range(self.igc.time_table.max_line + 1)
-                ]
+            data=self.igc.time_table.line_time_j2000(
+                0, self.igc.time_table.max_line + 1
             ),
             dtype="f8",
         )
@@ -0,0 +1,694 @@
+from __future__ import annotations
+import numpy as np
+from geocal import Time  # type: ignore
+import typing
+
+if typing.TYPE_CHECKING:
+    import h5py  # type: ignore
+
+# Status returned by L1aRawAssemble._seek_sequence
+_FOUND = 0
+_PAST_END = 1
+_DISCO = 2
+_EOF = 3
+
+
+def sequence_start_table(
+    lev: np.ndarray, ev_codes: np.ndarray, max_fpie: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """For each of the hot BB, cold BB and image sequences find the first
+    focal plane in each packet that falls in the sequence start window of
+    ev_codes, along with the mirror phase (0 or 1). Returns seq_fp and
+    seq_phase, both (3, number packet). seq_fp is -1 and seq_phase 2 for
+    packets with no match."""
+    tot_pkts = lev.shape[0]
+    seq_fp = np.full((3, tot_pkts), -1, dtype=np.int16)
+    seq_phase = np.full((3, tot_pkts), 2, dtype=np.int8)
+    for seq in range(3):
+        lid0 = (lev + ev_codes[seq, 4]) % max_fpie
+        lid1 = (lev + ev_codes[seq, 5]) % max_fpie
+        m0 = (lid0 >= ev_codes[seq, 0]) & (lid0 <= ev_codes[seq, 1])
+        m = m0 | ((lid1 >= ev_codes[seq, 2]) & (lid1 <= ev_codes[seq, 3]))
+        has = m.any(axis=1)
+        first = np.argmax(m, axis=1)
+        seq_fp[seq, has] = first[has]
+        seq_phase[seq, has] = np.where(m0[np.arange(tot_pkts), first], 0, 1)[has]
+    return seq_fp, seq_phase
+
+
+class L0bPacketIndex(object):
+    """This is the per packet classification of a L0B file that
+    L1aRawPixGenerate needs to assemble scenes.
+
+    Everything here is calculated once for the whole file with array
+    operations: the packet GPS times, the encoder values, and for each of
+    the hot BB, cold BB and image sequences the first focal plane in each
+    packet that falls in the sequence start window of ev_codes (along
+    with the mirror phase). We also flag packets with an encoder
+    discontinuity relative to the previous packet, packets followed by a
+    time jump, and packets followed by a non-consecutive packet ID.
+
+    The tests here are exactly the ones done packet by packet in the
+    original L1aRawPixGenerate.run loop, so a scene assembled with this
+    index is identical to one assembled the old way.
+
+    The sequence start table can be passed in if it has already been
+    calculated (e.g., read from a L0bIndexFile)."""
+
+    def __init__(
+        self,
+        gpt: np.ndarray,
+        lev: np.ndarray,
+        pid: np.ndarray,
+        ev_codes: np.ndarray,
+        max_fpie: int,
+        ev_dur: float,
+        scan_dur: float,
+        pkt_dur: float,
+        pkt_durt: float,
+        seq_fp: np.ndarray | None = None,
+        seq_phase: np.ndarray | None = None,
+    ) -> None:
+        self.gpt = gpt
+        self.lev = lev
+        self.pid = pid
+        self.tot_pkts = gpt.shape[0]
+        self.fpppkt = lev.shape[1]
+        # First FP in each packet that starts a sequence (-1 if none), and
+        # the mirror phase of that FP.
+        if seq_fp is None or seq_phase is None:
+            seq_fp, seq_phase = sequence_start_table(lev, ev_codes, max_fpie)
+        self.seq_fp = seq_fp
+        self.seq_phase = seq_phase
+        # Encoder jump of more than a half scan from the first FP of the
+        # previous packet
+        self.disco = np.zeros(self.tot_pkts, dtype=bool)
+        self.disco[1:] = ((lev[1:, 0] - lev[:-1, 0]) % max_fpie).astype(
+            np.float64
+        ) * ev_dur > scan_dur
+        # Time to the next packet differs from the nominal packet duration
+        self.time_jump = np.zeros(self.tot_pkts, dtype=bool)
+        dt = gpt[1:] - gpt[:-1]
+        self.time_jump[:-1] = (dt < 0) | (np.abs(dt - pkt_dur) > pkt_durt)
+        # Packet ID of the next packet isn't consecutive
+        pidv = pid.astype(np.int64)
+        self.pid_break = np.zeros(self.tot_pkts, dtype=bool)
+        self.pid_break[:-1] = (pidv[1:] > 1) & (pidv[1:] - pidv[:-1] != 1)
+        self._update_lookup()
+
+    def _update_lookup(self) -> None:
+        """Sorted packet indexes of the flags, used to find the next flagged
+        packet with a binary search."""
+        self.seq_idx = [np.flatnonzero(self.seq_fp[seq] >= 0) for seq in range(3)]
+        self.disco_idx = np.flatnonzero(self.disco)
+        self.time_jump_idx = np.flatnonzero(self.time_jump)
+
+    def next_index(self, idx: np.ndarray, e0: int) -> int:
+        """Return the first entry of the sorted array idx that is >= e0, or
+        tot_pkts if there isn't one."""
+        i = np.searchsorted(idx, e0)
+        if i < idx.shape[0]:
+            return int(idx[i])
+        return self.tot_pkts
+
+
+class L1aRawAssemble(object):
+    """This is an alternative to the packet by packet scene assembly loop
+    in L1aRawPixGenerate.run.
+
+    The scan and sequence logic is the same as the original, but we use a
+    L0bPacketIndex to jump directly to the packet starting each hot BB,
+    cold BB and image sequence, and copy each run of well behaved packets
+    into img/hbb/cbb with one fancy indexing assignment rather than a
+    transpose per packet and band. Packets that need special handling
+    (time jumps inside the image sequence) go through a copy of the original
+    per packet code, so the output is byte for byte the same.
+
+    The output buffers are filled in place, L1aRawPixGenerate.run is
+    responsible for setting them to fill values before each scene."""
+
+    def __init__(
+        self,
+        index: L0bPacketIndex,
+        bip: np.ndarray | h5py.Dataset,
+        obuf: list[np.ndarray],
+        pix_time: np.ndarray,
+        ev_buf: np.ndarray,
+        ev_codes: np.ndarray,
+        ev_names: list[str],
+        max_fpie: int,
+        fp_dur: float,
+        fp_ev: float,
+        fp_evt: float,
+        ev_dur: float,
+        pkt_dur: float,
+        pkt_durt: float,
+        img_dur: float,
+        scan_dur: float,
+        tcorr: np.ndarray | None = None,
+        terr: np.ndarray | None = None,
+    ) -> None:
+        self.index = index
+        self.bip = bip
+        self.obuf = obuf
+        self.pix_time = pix_time
+        self.ev_buf = ev_buf
+        self.ev_codes = ev_codes
+        self.ev_names = ev_names
+        self.max_fpie = max_fpie
+        self.fp_dur = fp_dur
+        self.fp_ev = fp_ev
+        self.fp_evt = fp_evt
+        self.ev_dur = ev_dur
+        self.pkt_dur = pkt_dur
+        self.pkt_durt = pkt_durt
+        self.img_dur = img_dur
+        self.scan_dur = scan_dur
+        self.tcorr = tcorr
+        self.terr = terr
+        self.ppfp = obuf[2].shape[0] // ev_buf.shape[0]
+        self.scps = ev_buf.shape[0]
+        self.ldd = np.zeros(index.fpppkt - 1, dtype=np.float32)
+        self.jumps = 0
+
+    def _seek_sequence(
+        self, seq: int, e0: int, e1: int, rse: float, past_end_idx: np.ndarray
+    ) -> tuple[int, int, float, int]:
+        """Find the packet and FP where sequence seq starts, searching from
+        packet e0. This returns e0, e1, dt and the status (_FOUND,
+        _PAST_END, _DISCO or _EOF)."""
+        ind = self.index
+        lev = ind.lev
+        dt = 0.0
+        if e0 < ind.tot_pkts:
+            # The first packet is compared against the FP where the last
+            # sequence started, so we can't use the precomputed disco flag
+            if e0 > 0:
+                dt = float((lev[e0, 0] - lev[e0 - 1, e1]) % self.max_fpie) * self.ev_dur
+            if ind.gpt[e0] > rse:
+                return e0, e1, dt, _PAST_END
+            if abs(dt) > self.scan_dur and seq > 0:
+                return e0, e1, dt, _DISCO
+            if ind.seq_fp[seq, e0] >= 0:
+                return e0, int(ind.seq_fp[seq, e0]), dt, _FOUND
+            e0 += 1
+        e1 = 0
+        e = min(
+            ind.next_index(ind.seq_idx[seq], e0),
+            ind.next_index(past_end_idx, e0),
+            ind.next_index(ind.disco_idx, e0) if seq > 0 else ind.tot_pkts,
+        )
+        if e >= ind.tot_pkts:
+            return ind.tot_pkts, e1, dt, _EOF
+        if e > 0:
+            dt = float((lev[e, 0] - lev[e - 1, 0]) % self.max_fpie) * self.ev_dur
+        if ind.gpt[e] > rse:
+            return e, e1, dt, _PAST_END
+        if ind.disco[e] and seq > 0:
+            return e, e1, dt, _DISCO
+        return e, int(ind.seq_fp[seq, e]), dt, _FOUND
+
+    def _copy_packet(
+        self,
+        orb: str,
+        scene_id: int,
+        seq: int,
+        scan: int,
+        line: int,
+        e0: int,
+        p1: int,
+        fpc: int,
+        op: int,
+        op0: int,
+        op1: int,
+        rst: float,
+        p0t: float,
+        sse: float,
+    ) -> tuple[int, int, int, float, bool, int]:
+        """Copy a single packet, handling time jumps. This is the body of
+        the copy loop in the original L1aRawPixGenerate.run.
+
+        Returns e0, op, remain, sse, if we terminated the scan, and the
+        number of FPs copied."""
+        ind = self.index
+        lev = ind.lev
+        gpt = ind.gpt
+        pid = ind.pid
+        tot_pkts = ind.tot_pkts
+        FPPPKT = ind.fpppkt
+        PPFP = self.ppfp
+        remain = op1 - op  # remaining FPs to fill in current scan
+        opinc = 0
+        #  calculate delta time between packets
+        if e0 == tot_pkts - 1:  # at last packet in file
+            dt = self.pkt_dur
+            lid0 = e0 - 1
+            lid1 = e0
+        else:
+            lid0 = e0
+            lid1 = e0 + 1  # correct time
+            dt = gpt[lid1] - gpt[lid0]
+
+        """  check against expected delta T between sequences  """
+        if (
+            op > op0 and (dt < 0 or abs(dt - self.pkt_dur) > self.pkt_durt) and seq == 2
+        ):  # time discontinuity
+            self.ldd[:] = (
+                lev[e0, 1:] - lev[e0, : FPPPKT - 1]
+            ) % self.max_fpie  # find FP with EV jump
+            fpc = int(np.argmax(self.ldd > self.fp_evt))
+            if fpc == 0:
+                if self.ldd[0] > self.fp_evt:
+                    fpc = 1
+                else:
+                    fpc = FPPPKT
+            else:
+                fpc += 1
+
+            if fpc < remain:  # jump occurred before end of IMG
+                self.jumps += 1
+                print(
+                    "*** Orbit %s Scene %d scan %d %s Time jump PKT=%d %s DT=%10.8f OP=%d "
+                    % (
+                        orb,
+                        scene_id,
+                        scan,
+                        self.ev_names[seq],
+                        lid1,
+                        Time.time_gps(gpt[lid1]),
+                        dt,
+                        op,
+                    ),
+                    end="",
+                )
+
+                if (
+                    dt > self.img_dur - (op1 - op) * self.fp_dur
+                ):  # jump outside of current IMG, go to next scan
+                    print("past IMG seq", end="")
+
+                if e0 == tot_pkts - 1:  # at end of data
+                    dev = 0.0
+                    d2 = 0.0
+                else:  # check EV continuity to next packet
+                    dev = abs((lev[lid1, 0] - lev[lid0, 0]) - self.fp_ev * FPPPKT)
+                    d2 = abs(
+                        (lev[lid1, FPPPKT - 1] - lev[lid0, FPPPKT - 1])
+                        - self.fp_ev * FPPPKT
+                    )
+                if (
+                    (op == op0 and d2 <= self.fp_evt)
+                    or (op >= op1 - FPPPKT and dev <= self.fp_evt)
+                    or (dev <= self.fp_evt and d2 <= self.fp_evt)
+                ):
+                    opinc = 0  # EV continuous
+                else:
+                    opinc = int(dt / self.fp_dur + 0.5) - FPPPKT
+
+                if dt < 0:
+                    print("Negative time jump", end="")
+                else:
+                    print(" ...continuing", end="")
+
+                print(" OPINC=%d  ***" % opinc)
+                print(
+                    "Copying remaining %d FPs from PKT [%d,%d] to scan %d at %d"
+                    % (fpc, e0, p1, scan, op)
+                )
+            # End jump detection
+
+        if fpc >= remain:
+            fpc = remain  # runt at end of sequence
+            print(
+                "Last %s chunk:%d FPC=%d IDX=[%d,%d] OP=%d"
+                % (self.ev_names[seq], remain, fpc, e0, p1, op),
+                end="",
+            )
+            if seq == 2:
+                sse = gpt[e0 - 1] + self.pkt_dur + fpc * self.fp_dur + self.fp_dur
+                print(" SSE=%f" % sse)
+            else:
+                print(" NULL")
+            if remain == FPPPKT:
+                remain = 0  # next search in next packet
+
+        dp = op - op0
+        self.obuf[seq][line : line + PPFP, dp : dp + fpc, :] = np.transpose(
+            self.bip[e0, :, :, :], (1, 0, 2)
+        )[:, p1 : p1 + fpc, :]
+        if seq == 2:
+            self.ev_buf[scan, dp : dp + fpc] = lev[e0, p1 : p1 + fpc]
+        ncopy = fpc
+
+        if (
+            (e0 < tot_pkts - 1)
+            and pid[lid1] > 1
+            and (int(pid[lid1]) - int(pid[lid0])) != 1
+        ):  # skip non-consecutive packet ID
+            print(
+                "found non-contiguous PKT %d PIDs=%d %d" % (lid1, pid[lid0], pid[lid1])
+            )
+
+            if opinc < 0:
+                e0 += 1
+                print("Skipping disco PKT %d ID=%d" % (e0, pid[e0]))
+                opinc = 0
+
+        op = op + opinc + fpc
+        if op < op0 or op > op1:  # next packet outside of current scan
+            sse = rst + fpc * self.fp_dur + self.fp_dur
+            print(
+                "Terminating scan %d in %s at FP %d E0=%d FPC=%d P0T=%f RST=%f SSE=%f"
+                % (scan, self.ev_names[seq], op, e0, fpc, p0t, rst, sse)
+            )
+            return e0, 0, remain, sse, True, ncopy
+        e0 += 1
+        return e0, op, remain, sse, False, ncopy
+
+    def _copy_run(
+        self,
+        seq: int,
+        scan: int,
+        line: int,
+        e0: int,
+        p1: int,
+        op: int,
+        op0: int,
+        op1: int,
+        sse: float,
+    ) -> tuple[int, int, int, float, int]:
+        """Copy the packets starting at e0 in bulk, up to the end of the
+        sequence, the end of the file or the next packet that needs
+        _copy_packet.
+
+        Returns e0, op, remain, sse and the number of FPs copied."""
+        ind = self.index
+        FPPPKT = ind.fpppkt
+        PPFP = self.ppfp
+        remain = op1 - op
+        e_end = min(e0 + (p1 + remain + FPPPKT - 1) // FPPPKT, ind.tot_pkts)
+        if seq == 2:
+            e_end = min(e_end, ind.next_index(ind.time_jump_idx, e0 + 1))
+        n = e_end - e0
+        ncopy = min(remain, n * FPPPKT - p1)
+        d = np.asarray(self.bip[e0:e_end])
+        d = d.reshape((n * FPPPKT, PPFP, d.shape[3]))[p1 : p1 + ncopy, :, :]
+        dp = op - op0
+        self.obuf[seq][line : line + PPFP, dp : dp + ncopy, :] = np.transpose(
+            d, (1, 0, 2)
+        )
+        if seq == 2:
+            self.ev_buf[scan, dp : dp + ncopy] = ind.lev[e0:e_end, :].reshape(-1)[
+                p1 : p1 + ncopy
+            ]
+        # Last packet we actually used
+        elast = e0 + (p1 + ncopy - 1) // FPPPKT
+        for e in np.flatnonzero(ind.pid_break[e0 : elast + 1]) + e0:
+            print(
+                "found non-contiguous PKT %d PIDs=%d %d"
+                % (e + 1, ind.pid[e], ind.pid[e + 1])
+            )
+        # Remaining count at the start of the last packet, this is what the
+        # packet by packet loop leaves in "remain"
+        if elast > e0:
+            rlast = remain - ((elast - e0) * FPPPKT - p1)
+            plast = 0
+        else:
+            rlast = remain
+            plast = p1
+        if ncopy == remain:
+            print(
+                "Last %s chunk:%d FPC=%d IDX=[%d,%d] OP=%d"
+                % (self.ev_names[seq], rlast, rlast, elast, plast, op1 - rlast),
+                end="",
+            )
+            if seq == 2:
+                sse = (
+                    ind.gpt[elast - 1]
+                    + self.pkt_dur
+                    + rlast * self.fp_dur
+                    + self.fp_dur
+                )
+                print(" SSE=%f" % sse)
+            else:
+                print(" NULL")
+            if rlast == FPPPKT:
+                rlast = 0
+        return elast + 1, op + ncopy, rlast, sse, ncopy
+
+    def assemble_scene(
+        self,
+        orbit: int,
+        orb: str,
+        scene_id: int,
+        pkt_idx: int,
+        rst: float,
+        rse: float,
+        pxet: Time,
+        ste: Time,
+        sse: float,
+        sst0: float,
+        good: np.ndarray,
+    ) -> tuple[int, float, float, float]:
+        """Assemble one scene into the output buffers. The arguments are
+        the state L1aRawPixGenerate.run has when it starts the scan loop
+        for a scene. good is updated in place with the good FP counts.
+
+        Returns scans, rst, sse and sst0."""
+        ind = self.index
+        lev = ind.lev
+        gpt = ind.gpt
+        tot_pkts = ind.tot_pkts
+        FPPPKT = ind.fpppkt
+        PPFP = self.ppfp
+        SCPS = self.scps
+        SCAN_DUR = self.scan_dur
+        ev_names = self.ev_names
+        gpix = np.zeros(3, dtype=np.float32)
+        past_end_idx = np.flatnonzero(gpt > rse)
+        line = 0
+        scan = 0
+        scans = 0
+        remain = -1234
+        op = 0
+        dt = 0.0
+        while scan < SCPS and pxet < ste:
+            cont = 1
+            e1 = 0
+            #  Loop through HBB, CBB, and IMG sequences in scan
+            seq = 0
+            gpix[:] = 0
+            while seq < 3:
+                e0, e1, dt, status = self._seek_sequence(
+                    seq, pkt_idx, e1, rse, past_end_idx
+                )
+                if status == _PAST_END:  # packet time past end of scene
+                    scans = scan
+                    sse = rst + scans * SCAN_DUR
+                    print(
+                        "** Finish orbit %05d short scene %s SCANS=%d end=%s(%f) GPT=%s(%f) at %d"
+                        % (
+                            orbit,
+                            scene_id,
+                            scans,
+                            Time.time_gps(sse),
+                            sse,
+                            Time.time_gps(gpt[e0]),
+                            gpt[e0],
+                            e0,
+                        )
+                    )
+                    scan = SCPS  # force finish up current scene
+                    cont = 0
+                    pxet = ste  # force out of scan loop
+                elif status == _DISCO:
+                    print(
+                        "** Discontinuity seeking %s IDX=%d DT=%f E1=%d"
+                        % (ev_names[seq], e0, dt, e1)
+                    )
+                    cont = 0
+                    scan = int((gpt[e0] - rst) / SCAN_DUR)
+                    print("** start Next scan %d" % scan)
+                print("Out of SEQ seek E0=%d E1=%d" % (e0, e1))
+
+                if e0 >= tot_pkts:  # hit EOF; finish up any existing scans
+                    print("** Hit EOF ")
+                    e0 = tot_pkts - 1
+                    e1 = FPPPKT - 1
+                    cont = 0
+                    scans = scan  # save any scans already copied
+                    scan = SCPS  # force out of scan loop
+
+                pkt_idx = e0
+                if cont == 0:
+                    break  # discont in SEQ seek, break out of SEQ loop
+
+                # Found start of SEQ, check continuity of first SEQ PKT
+                if e0 < tot_pkts - 1:
+                    lid1 = e0 + 1
+                else:
+                    lid1 = e0
+                lid0 = lid1 - 1
+                if lid0 < 0:
+                    lid0 = 0
+
+                l0 = lev[lid0, e1] - int(self.fp_ev + 0.5)  #  add 1 FP of counts
+                if e1 == 0:  #  ends in current packet
+                    dt = (
+                        float((lev[lid0, FPPPKT - 1] - l0) % self.max_fpie)
+                    ) * self.ev_dur
+                else:  #  ends in next packet
+                    dt = (float((lev[lid1, e1 - 1] - l0) % self.max_fpie)) * self.ev_dur
+                adt = abs(dt - self.pkt_dur)
+                if adt > self.pkt_durt or e0 >= tot_pkts - 1:
+                    print(
+                        "Scene %d Disco %s, terminating scan %d E0=%d E1=%d DT=%f"
+                        % (scene_id, ev_names[seq], scan, e0, e1, dt)
+                    )
+                    pkt_idx = e0 + 1  # get past current packet
+                    scan += 1
+                    cont = 0
+                    op = 0
+                    break
+
+                # calculate fswt of first FP in SEQ
+                if e1 == 0:  #  Seq starts at beginning of PKT
+                    p0t = gpt[e0]
+                else:  #  count backward from next PKT
+                    dt = (FPPPKT - e1) * self.fp_dur
+                    p0t = gpt[e0 + 1] - dt
+                dpt = gpt[lid1] - gpt[lid0]
+
+                # calculate ISS time correction
+                if self.tcorr is not None and self.terr is not None:
+                    tdx = np.argmax(p0t < self.terr)
+                    print(
+                        "Scene %d scan %d TCORR=%f TDX=%d"
+                        % (scene_id, scan, self.tcorr[tdx], tdx)
+                    )
+                if scan == 0:  # save refined scene start time of IMG
+                    rst = p0t
+                if seq == 0:  # save scan start time
+                    sst = p0t
+                    scan = int((sst - rst) / SCAN_DUR + 0.5)
+                    dst = sst - sst0
+                    std = dst - SCAN_DUR
+                    fpd = std / self.fp_dur
+                    sst0 = sst
+                    print(
+                        "Calculated scan=%02d SCENE=%s SST=%f RST=%f DST=%f STD=%9f FPD=%9f"
+                        % (scan, scene_id, sst, rst, dst, std, fpd)
+                    )
+                    if scan >= SCPS:
+                        print(
+                            "PKT[%d] Time %f outside of current scene %d Terminating"
+                            % (e0, gpt[e0], scene_id)
+                        )
+                        cont = 0
+                        break
+                    line = scan * PPFP
+
+                elif seq == 2:  # save and replicate IMG start time
+                    print(
+                        "Orbit %s SCENE %d SCAN %d P0T=%f" % (orb, scene_id, scan, p0t)
+                    )
+                    self.pix_time[line : line + PPFP] = Time.time_gps(p0t).j2000
+
+                print(
+                    "Found %s LID[%d,%d]=%d PH=%d SCENE=%s SCAN=%d GPS=%f DPT=%f %s"
+                    % (
+                        ev_names[seq],
+                        e0,
+                        e1,
+                        lev[e0, e1],
+                        ind.seq_phase[seq, e0],
+                        scene_id,
+                        scan,
+                        p0t,
+                        dpt,
+                        Time.time_gps(p0t),
+                    )
+                )
+
+                # Copy pixels from PKTs
+                p1 = e1
+                op0 = self.ev_codes[3, seq]  # starting output fp of sequence
+                op1 = self.ev_codes[3, seq + 1]  # ending output fp of sequence
+                op = op0  # initialize output FP pointer
+                terminated = False
+                while op < op1 and e0 < tot_pkts:
+                    if seq == 2 and op > op0 and ind.time_jump[e0]:
+                        e0, op, remain, sse, terminated, ncopy = self._copy_packet(
+                            orb,
+                            scene_id,
+                            seq,
+                            scan,
+                            line,
+                            e0,
+                            p1,
+                            FPPPKT - p1,
+                            op,
+                            op0,
+                            op1,
+                            rst,
+                            p0t,
+                            sse,
+                        )
+                    else:
+                        e0, op, remain, sse, ncopy = self._copy_run(
+                            seq, scan, line, e0, p1, op, op0, op1, sse
+                        )
+                    gpix[seq] += ncopy
+                    p1 = 0
+                    if terminated:
+                        seq = 3  # force exit SEQ loop
+                        break
+
+                # end seq copy loop
+                if e0 >= tot_pkts:
+                    pkt_idx = tot_pkts - 1
+                    sse = gpt[pkt_idx] + self.pkt_dur - self.fp_dur
+                    print(
+                        "Hit EOF, E0=%d, set scene end time to end of last packet: %f"
+                        % (e0, sse)
+                    )
+                else:
+                    if op > op0 and remain > 0:
+                        pkt_idx = e0 - 1
+                    else:
+                        pkt_idx = e0
+                seq += 1
+            # end seq loop
+
+            print(
+                "SCENE=%s SCAN=%d SCANS=%d LINE=%d DT=%f s2k=%f IDX=%d REMAIN=%d OP=%d RSE=%f"
+                % (
+                    scene_id,
+                    scan,
+                    scans,
+                    line,
+                    dt,
+                    self.pix_time[scans],
+                    pkt_idx,
+                    remain,
+                    op,
+                    rse,
+                )
+            )
+            if cont == 0:
+                if scans == 0:  # restart scanning with new IDX
+                    scan = 0
+                if pkt_idx == tot_pkts - 1:  # EOF
+                    break  # break out of scan loop
+            else:
+                good[:] += gpix[:]
+                pxet += SCAN_DUR
+                scans += 1
+                scan += 1
+
+        # end scan loop
+        print("Out of scan loop scan=%d scans=%s" % (scan, scans))
+        return scans, rst, sse, sst0
+
+
+__all__ = ["sequence_start_table", "L0bPacketIndex", "L1aRawAssemble"]
@@ -10,12 +10,19 @@ from __future__ import annotations
 import h5py  # type: ignore
 import re
 import os
-import glob
+import multiprocessing
+import time
 import numpy as np
 from .write_standard_metadata import WriteStandardMetadata
+from .l1a_raw_assemble import L0bPacketIndex, L1aRawAssemble
+from .l0b_packet_reader import L0bPacketReader
+from .l0b_index_file import L0bIndexFile
+from .obstruction_index import ObstructionIndex
+from .background_writer import BackgroundWriter
 from .misc import (
     ecostress_file_name,
     time_split,
+    gps_to_j2000,
     create_dem,
     setup_spice,
     create_time_table,
@@ -121,6 +128,49 @@ LPS = PPFP * SCPS
 " standard packets per scene rounded up "
 # PPSC = int( (SCPS*FPB3+FPPPKT-1) / FPPPKT )
 
+# Scene processing function used by the worker processes when we run in
+# parallel. This is set by _scene_worker_init in each worker.
+_scene_func = None
+
+
+class _SceneState(object):
+    """State the scene loop carries from one scene to the next. sse (the
+    scan end time) is used as the refined scene end time, so a scene that
+    doesn't set it gets the end time of the previous scene. sst0 (the
+    previous scan start time) and remain are only used in log messages
+    before they are set in a scene."""
+
+    def __init__(self, sse: float = 0.0, sst0: float = 0, remain: int = -1234):
+        self.sse = sse
+        self.sst0 = sst0
+        self.remain = remain
+
+
+class _SceneStateNeeded(Exception):
+    """Raised when a scene needs the end time carried from the previous
+    scene, but we don't have it (sse is nan)."""
+
+    pass
+
+
+def _scene_worker_init(func, bip: L0bPacketReader) -> None:
+    global _scene_func
+    _scene_func = func
+    bip.reopen()
+
+
+def _scene_worker(orbit: int, scene_id: int, sts: Time, ste: Time):
+    """Process a scene without knowing the state from the previous scene.
+    Returns the result of process_scene, the sse to carry to the next
+    scene (nan if the scene didn't set it), and True if the scene needs
+    the previous scene's sse and has to be redone once we know it."""
+    state = _SceneState(sse=np.nan)
+    try:
+        r = _scene_func(orbit, scene_id, sts, ste, state)
+    except _SceneStateNeeded:
+        return None, np.nan, True
+    return r, state.sse, False
+
 
 class L1aRawPixGenerate(object):
     """This generates a L1A_RAW_PIX, L1A_BB, L1A_ENG and L1A_RAW_ATT
@@ -138,9 +188,52 @@ class L1aRawPixGenerate(object):
         pge_version: str = "0.50",
         file_version: str = "01",
         use_obst_file: str = "YES",
+        vectorized_assembly: bool = False,
+        streaming: bool = False,
+        read_ahead: int = 512,
+        number_cpu: int = 1,
+        use_index: bool = False,
+        index_dir: str | None = None,
+        obst_cache_file: str | None = None,
+        write_queue_size: int = 0,
     ) -> None:
         """Create a L1aRawPixGenerate to process the given L0 file.
-        To actually generate, execute the "run" command."""
+        To actually generate, execute the "run" command.
+
+        By default scenes are assembled with the original packet by packet
+        loop. If vectorized_assembly is True we instead use L1aRawAssemble,
+        which gives identical output but is much faster on a full orbit.
+
+        By default the L0B file and the output files are held in memory
+        (h5py driver="core"). For long orbits this can use more memory
+        than we have, so if streaming is True we instead read flex/bip
+        through a L0bPacketReader, read_ahead packets at a time starting
+        at each scene, and write the output files directly to disk. Peak
+        memory is then about one scene of output plus the read ahead
+        window.
+
+        If number_cpu > 1 the scenes are processed in parallel. The packet
+        times, encoder values and (if used) the vectorized assembly index
+        are calculated once, and each worker then reads just the packets
+        for its scenes.
+
+        If use_index is True we use a L0bIndexFile (next to the L0B, or in
+        index_dir if supplied) for the packet times, sequence starts and
+        scene packet ranges, creating it if needed. This is shared with
+        l0b_scan.py, and saves recalculating these when we reprocess the
+        same L0B.
+
+        The obstruction reports in obst_dir are read once into an
+        ObstructionIndex. If obst_cache_file is supplied, the parsed
+        reports are cached there for use by later runs.
+
+        By default each scene is written out (including the gzip
+        compression of the BB data) before we start assembling the next
+        one. If write_queue_size > 0, scenes are instead handed to a
+        BackgroundWriter thread, with at most write_queue_size scenes
+        waiting or being written at a time. Each of these holds a copy of
+        the scene buffers, so this trades memory for time. This only
+        applies when number_cpu is 1."""
         self.l0b = l0b
         self.obst_dir = obst_dir
         self.osp_dir = osp_dir
@@ -151,6 +244,16 @@ class L1aRawPixGenerate(object):
         self.pge_version = pge_version
         self.file_version = file_version
         self.use_obst_file = use_obst_file
+        self.vectorized_assembly = vectorized_assembly
+        self.streaming = streaming
+        self.read_ahead = read_ahead
+        self.number_cpu = number_cpu
+        self.use_index = use_index
+        self.index_dir = index_dir
+        self.obst_cache_file = obst_cache_file
+        self.obst_index: ObstructionIndex | None = None
+        self.write_queue_size = write_queue_size
+        self.timing: dict[str, float] = {}
 
     def process_scene_file(self) -> list[tuple[int, int, Time, Time]]:
         """Process the scene file, returning the orbit, scene id, start,
@@ -195,7 +298,7 @@ class L1aRawPixGenerate(object):
         # if(primary_file):
         #    self.log_fname =  os.path.splitext(fname)[0] + ".log"
         #    self.log = open(self.log_fname, "w")
-        fout = h5py.File(fname, "w", driver="core")
+        fout = h5py.File(fname, "w", driver=None if self.streaming else "core")
         m = WriteStandardMetadata(
             fout,
             product_specfic_group=prod_type + "Metadata",
@@ -219,72 +322,44 @@ class L1aRawPixGenerate(object):
         return fout, m, fname
 
     def detect_obst(self, sts: Time, ste: Time) -> str:
-        # look for dolar array obstruction on scene using start/end times
-        # and solar array obstruction reports from HOSC
-
-        ys = str(sts)[0:4]
-        path = self.obst_dir
-        obst_files = path + "/ECO*Obst." + ys
+        """Look for solar array obstruction on scene using start/end times
+        and solar array obstruction reports from HOSC. Returns "YES", "NO",
+        or "NA" if we don't have any obstruction reports for the year."""
         print("STS=%s STE=%s" % (str(sts), str(ste)))
-        print("OBSTFILES=%s" % obst_files)
-        fov_obst = "NO"
-        found_file = 0
-        for file_name in glob.glob(obst_files):
-            found_file += 1
-            fn = os.path.basename(file_name)
-            pre, doy1, doy2, post, year = re.split(r"\_|\.", fn)
-            d1 = year + "::" + doy1
-            yr = int(year)
-            if int(doy2) < int(doy1):
-                yr = yr + 1
-            year2 = str(yr)
-            d2 = year2 + "::" + doy2
-            t1 = Time.parse_time(d1)
-            t2 = Time.parse_time(d2)
-            # print("ObstFile dates=%s %s" %( d1, d2 ) )
-            if ste < t1:
-                break  #  time codes beyond scene end
-            if sts > t2:  #  time codes before scene start
-                continue
-            print("Found file %s" % file_name)
-            with open(file_name, "r") as ifd:
-                for lbuf in ifd:
-                    if "OBSTRUCTED" not in lbuf:  #  Look for "OBSTRUCTED"
-                        continue
-                    a, b, c, doy1, t1, d, doy2, t2 = re.split(r" |\,|\/", lbuf)
-                    # print("%s/%s %s/%s" %(doy1,t1,doy2,t2), end=" ")
-                    yr = int(year)
-                    if int(doy2) < int(doy1):
-                        yr = yr + 1
-                    year2 = str(yr)
-                    d1 = year + "::" + doy1 + " " + t1
-                    d2 = year2 + "::" + doy2 + " " + t2[0:8]
-                    t1 = Time.parse_time(d1)
-                    t2 = Time.parse_time(d2)
-                    if ste < t1:
-                        break  #  time codes beyond scene end
-                    if sts > t2:  #  time codes before scene start
-                        continue
-                    print("Found OBST times %s %s" % (t1, t2))
-                    print("OBST scene %s %s" % (sts, ste))
-                    fov_obst = "YES"
-                    break
-            print("Close file %s FOV_OBST=%s" % (file_name, fov_obst))
-            ifd.close()
-            if fov_obst != "NO":
-                break
-        if found_file == 0:
-            fov_obst = "NA"
+        if self.obst_index is None:
+            self.obst_index = ObstructionIndex(
+                self.obst_dir, cache_file=self.obst_cache_file
+            )
+        fov_obst = self.obst_index.detect(sts, ste)
+        print("FOV_OBST=%s" % fov_obst)
         return fov_obst
 
+    def _phase_done(self, phase: str, t0: float) -> float:
+        """Add the time since t0 to self.timing[phase], and return the
+        current time."""
+        t = time.perf_counter()
+        self.timing[phase] = self.timing.get(phase, 0.0) + (t - t0)
+        return t
+
     def run(self) -> int:
-        """Do the actual generation of data."""
+        """Do the actual generation of data.
+
+        The wall clock time of each of the processing phases is saved in
+        self.timing, for use in benchmarking. The "assemble" and "write"
+        phases are only filled in when number_cpu is 1, otherwise the
+        scenes are processed in other processes."""
         print("====  Start run ", datetime.now(), "  ====")
         self.log = None
+        self.timing = {}
+        trun = time.perf_counter()
+        tphase = trun
 
         if self.use_obst_file == "YES" and not os.path.isdir(self.obst_dir):
             print("Error:  OBST_DIR not found: %s" % self.obst_dir)
             return -6
+        self.obst_index = ObstructionIndex(
+            self.obst_dir, cache_file=self.obst_cache_file
+        )
 
         #  setup for locating scene corners
         sys.path.append(self.osp_dir)
@@ -442,16 +517,23 @@ class L1aRawPixGenerate(object):
             )
             return -1
 
+        tphase = self._phase_done("setup", tphase)
+
         # open L0B file
-        self.fin = h5py.File(self.l0b, "r", driver="core")
-        bip = self.fin["flex/bip"]
+        if self.streaming or self.number_cpu > 1:
+            self.fin = h5py.File(self.l0b, "r")
+            bip = L0bPacketReader(self.fin["flex/bip"], read_ahead=self.read_ahead)
+        else:
+            self.fin = h5py.File(self.l0b, "r", driver="core")
+            bip = self.fin["flex/bip"]
         tot_pkts = bip.shape[0]
         print("Opened L0B file %s, TOT_PKTS=%d" % (self.l0b, tot_pkts))
 
         fpie_sync = np.zeros(tot_pkts, dtype=np.int64)
         fsw_sync = np.zeros(tot_pkts, dtype=np.int64)
         lid = self.fin["flex/id_line"]
-        pid = self.fin["flex/id_packet"]
+        # Small, read into memory so per packet access doesn't go to the file
+        pid = self.fin["flex/id_packet"][:]
         # flex_st=self.fin["flex/state"]
         fswt = self.fin["flex/time_fsw"]
         fpie_sync[:] = self.fin["flex/time_sync_fpie"]
@@ -489,7 +571,6 @@ class L1aRawPixGenerate(object):
             BANDS = 3
             bo = [1, 0, 2]
             bs = [8.7, 10.5, 12.0]
-        BandSpec = np.zeros(BANDS, dtype=np.float64)
 
         tdpuio = [0]
         tcorr = [0.0]
@@ -515,6 +596,7 @@ class L1aRawPixGenerate(object):
         bbtime[:] = bb_time[:]
         bbfsw = np.zeros(epc, dtype=np.float64)
         bbfsw[:] = bb_fsw[:]
+        tphase = self._phase_done("read_l0b", tphase)
         " create engineering file and datasets "
         print("creating ENG file, EPC=%d" % epc)
         if epc > 0:
@@ -530,27 +612,33 @@ class L1aRawPixGenerate(object):
             print("Error:  No HK time in L0B file")
             return -4
         eng_g = eng.create_group("/rtdBlackbodyGradients")
-        rtd295 = eng_g.create_dataset("RTD_295K", shape=(epc, 5), dtype="f4")
+        # Convert DNs to Kelvin with PRT parameters
+        bbt = bbt[:]
+        rtd295_k = np.zeros((epc, 5), dtype=np.float32)
+        rtd325_k = np.zeros((epc, 5), dtype=np.float32)
+        for j in range(5):
+            rtd295_k[:, j] = prc[j](p7r(bbt[:, 0, j]))
+            rtd325_k[:, j] = prh[j](p7r(bbt[:, 1, j]))
+        rtd295 = eng_g.create_dataset("RTD_295K", data=rtd295_k, dtype="f4")
         rtd295.attrs["Units"] = "K"
         rtd295.attrs["valid_min"] = "290"
         rtd295.attrs["valid_max"] = "320"
         rtd295.attrs["fill"] = "-9999"
-        rtd325 = eng_g.create_dataset("RTD_325K", shape=(epc, 5), dtype="f4")
+        rtd325 = eng_g.create_dataset("RTD_325K", data=rtd325_k, dtype="f4")
         rtd325.attrs["Units"] = "K"
         rtd325.attrs["valid_min"] = "320"
         rtd325.attrs["valid_max"] = "330"
         rtd325.attrs["fill"] = "-9999"
-        rtdtime = eng_g.create_dataset("time_j2000", shape=(epc, 2), dtype="f8")
+        rtdtime = eng_g.create_dataset(
+            "time_j2000",
+            # sample time, hk pkt time
+            data=np.stack([gps_to_j2000(bbtime), gps_to_j2000(bbfsw)], axis=1),
+            dtype="f8",
+        )
         rtdtime.attrs["Units"] = "seconds"
         rtdtime.attrs["valid_min"] = "0"
         rtdtime.attrs["valid_max"] = "N/A"
         rtdtime.attrs["fill"] = "-9999"
-        for i in range(epc):  # Convert DNs to Kelvin with PRT parameters
-            for j in range(5):
-                rtd295[i, j] = prc[j](p7r(bbt[i, 0, j]))
-                rtd325[i, j] = prh[j](p7r(bbt[i, 1, j]))
-            rtdtime[i, 0] = Time.time_gps(bbtime[i]).j2000  # sample time
-            rtdtime[i, 1] = Time.time_gps(bbfsw[i]).j2000  # hk pkt time
         rtd295.attrs["Units"] = "K"
         rtd295.attrs["valid_min"] = "290"
         rtd295.attrs["valid_max"] = "300"
@@ -583,26 +671,23 @@ class L1aRawPixGenerate(object):
             print("Error:  No ATT data in L0B file")
             return -5
         att_g = attf.create_group("/Attitude")
-        a2k = att_g.create_dataset("time_j2000", shape=(aqc,), dtype="f8")
-        q = att_g.create_dataset("quaternion", shape=(aqc, 4), dtype="f8")
+        att_j2000 = gps_to_j2000(att_time[:])
+        # hk pkt time
+        a2k = att_g.create_dataset("time_j2000", data=att_j2000, dtype="f8")
+        q = att_g.create_dataset("quaternion", data=att[:, :], dtype="f8")
         eph_g = attf.create_group("/Ephemeris")
-        e2k = eph_g.create_dataset("time_j2000", shape=(aqc,), dtype="f8")
-        epos = eph_g.create_dataset("eci_position", shape=(aqc, 3), dtype="f8")
-        evel = eph_g.create_dataset("eci_velocity", shape=(aqc, 3), dtype="f8")
-        for i in range(aqc):
-            a2k[i] = Time.time_gps(att_time[i]).j2000  # hk pkt time
-            e2k[i] = Time.time_gps(att_time[i]).j2000  # hk sample time
+        # hk sample time
+        e2k = eph_g.create_dataset("time_j2000", data=att_j2000, dtype="f8")
+        epos = eph_g.create_dataset("eci_position", data=pos[:, :] * 0.3048, dtype="f8")
+        evel = eph_g.create_dataset("eci_velocity", data=vel[:, :] * 0.3048, dtype="f8")
         a2k.attrs["Units"] = "Seconds"
         e2k.attrs["Units"] = "Seconds"
-        q[:, :] = att[:, :]
         q.attrs["Description"] = (
             "Attitude quaternion, goes from spacecraft to ECI. The coefficient convention used has the real part in the first column."
         )
         q.attrs["Units"] = "dimensionless"
-        epos[:, :] = pos[:, :] * 0.3048
         epos.attrs["Description"] = "ECI position"
         epos.attrs["Units"] = "m"
-        evel[:, :] = vel[:, :] * 0.3048
         evel.attrs["Description"] = "ECI velocity"
         evel.attrs["Units"] = "m/s"
         attf_met.set("ImageLines", 0)
@@ -611,6 +696,7 @@ class L1aRawPixGenerate(object):
         # attf_met.set("FieldOfViewObstruction", fov_obst) # need code arrangement
         attf_met.write()
         attf.close()
+        tphase = self._phase_done("eng_att", tphase)
 
         # correct for time code error from new firmware
 
@@ -638,8 +724,26 @@ class L1aRawPixGenerate(object):
 
         # calculate FSW times of each packet (GPS times)
 
-        gpt = np.zeros(tot_pkts, dtype=np.float64)
-        gpt[:] = fswt[:] + (fpie_sync[:] - fsw_sync[:]) / 1000000.0
+        # Use the L0B index file if we can (e.g., we may not be able to
+        # write it), otherwise fall back to scanning all the packets
+        l0b_index = None
+        if self.use_index:
+            try:
+                l0b_index = L0bIndexFile(
+                    self.l0b, self.fin, ev_codes, MAX_FPIE, cache_dir=self.index_dir
+                )
+                print(
+                    "%s L0B index file %s"
+                    % ("Created" if l0b_index.created else "Using", l0b_index.fname)
+                )
+            except OSError as exc:
+                print("Not using L0B index file: %s" % exc)
+                l0b_index = None
+        if l0b_index is not None:
+            gpt = l0b_index.gpt
+        else:
+            gpt = np.zeros(tot_pkts, dtype=np.float64)
+            gpt[:] = fswt[:] + (fpie_sync[:] - fsw_sync[:]) / 1000000.0
 
         # extract encoder values
         i, j = lid.shape
@@ -659,514 +763,69 @@ class L1aRawPixGenerate(object):
 
         good = np.zeros(3, dtype=np.float32)
         gpix = np.zeros(3, dtype=np.float32)
-        scenes = []  # record refined scene start/stop times
-
-        # start looking at first packet in file
-        # iterate through scenes from scene start/stop file
-        o_start_time = None
-        jumps = 0
-        remain = -1234
-        sst0 = 0
-        for orbit, scene_id, sts, ste in self.process_scene_file():
-            orb = str("%05d" % orbit)
-            if orb != onum:  # process only matching orbit numbers
-                print(
-                    "Ignoring mismatch orbit number %s, ref=%s scene=%d"
-                    % (orb, onum, scene_id)
-                )
-                continue
-            print("====  ", datetime.now(), "  ====")
-            dt = ste.gps - sts.gps
-            print(
-                "SCENE=%03d START=%s(%f) END=%s(%f) DT=%f"
-                % (scene_id, sts, sts.gps, ste, ste.gps, dt)
-            )
-
-            # detect field of view obstruction
-            fov_obst = self.detect_obst(sts, ste)
-            if fov_obst == "NA":
-                print(
-                    "Error:  Obstruction files not found in DIR %s, terminating"
-                    % self.obst_dir
-                )
-                if self.use_obst_file == "YES":
-                    return -6
-            good[:] = 0.0
 
-            # *** Assume packets in time sequence ***
-            " search for packet containing scene start time "
-            if sts.gps > gpt[tot_pkts - 1]:
-                t0 = Time.time_gps(gpt[tot_pkts - 1])
-                print(
-                    "Scene time %s(%f) past data time %s(%f)"
-                    % (sts, sts.gps, t0, gpt[tot_pkts - 1])
-                )
-                continue  # go to next scene
-            pkt_idx = np.argmax(gpt > sts.gps)
-            if pkt_idx > 0:
-                pkt_idx -= 1
-            t0 = Time.time_gps(gpt[pkt_idx])
-            dt = t0 - sts
-            print(
-                "Located scene %s start time %f in PKT[%d] %s(%f) DT=%f"
-                % (scene_id, sts.gps, pkt_idx, str(t0), t0.gps, dt)
+        # Classify all the packets up front for the vectorized assembly
+        assembler = None
+        if self.vectorized_assembly:
+            print("Building packet index, TOT_PKTS=%d" % tot_pkts)
+            pkt_index = L0bPacketIndex(
+                gpt,
+                lev,
+                pid,
+                ev_codes,
+                MAX_FPIE,
+                EV_DUR,
+                SCAN_DUR,
+                PKT_DUR,
+                PKT_DURT,
+                seq_fp=l0b_index.seq_fp if l0b_index is not None else None,
+                seq_phase=l0b_index.seq_phase if l0b_index is not None else None,
             )
-            rst = t0.gps - dt
-            rse = ste.gps  # initialize refined scene end time
-            print(
-                "Initial guess of refined scene start/end time %s(%f) %s(%f)"
-                % (Time.time_gps(rst), rst, Time.time_gps(rse), rse)
+            assembler = L1aRawAssemble(
+                pkt_index,
+                bip,
+                obuf,
+                pix_time,
+                ev_buf,
+                ev_codes,
+                ev_names,
+                MAX_FPIE,
+                FP_DUR,
+                FP_EV,
+                FP_EVT,
+                EV_DUR,
+                PKT_DUR,
+                PKT_DURT,
+                IMG_DUR,
+                SCAN_DUR,
+                tcorr=tcorr[:] if iss_tcorr > 0 else None,
+                terr=terr[:] if iss_tcorr > 0 else None,
             )
 
-            # initialize buffers to fill values
-            img[:, :, :] = 0xFFFF
-            hbb[:, :, :] = 0xFFFF
-            cbb[:, :, :] = 0xFFFF
-            pix_time[:] = 0.0
-            ev_buf[:, :] = 0xFFFFFFFF
-
-            line = 0  # line pointer in output image
-            pxet = t0 + PIX_DUR  # BB and IMG pixel end time
-
-            scan = 0
-            scans = 0
-            if pkt_idx > 0:
-                pkt_idx -= 1  # compensate for time code error
-
-            while scan < SCPS and pxet < ste:
-                cont = 1
-                flex_buf[:, :, :] = 0xFFFF
-                e1 = 0
-                #  Loop through HBB, CBB, and IMG sequences in scan
-                seq = 0
-                gpix[:] = 0
-                """ph0 = 2
-                ph0_idx = 0"""
-                while seq < 3:
-                    e0 = pkt_idx
-                    ph = 2  # mirror phase should be 0 or 1
-                    while e0 < tot_pkts and ph == 2:  # search for sequence start
-                        if e0 == 0:
-                            dt = 0
-                        else:
-                            dt = (
-                                float((lev[e0, 0] - lev[e0 - 1, e1]) % MAX_FPIE)
-                            ) * EV_DUR
-                        adt = abs(dt)
-                        if gpt[e0] > rse:  # packet time past end of scene
-                            scans = scan
-                            sse = rst + scans * SCAN_DUR
-                            print(
-                                "** Finish orbit %05d short scene %s SCANS=%d end=%s(%f) GPT=%s(%f) at %d"
-                                % (
-                                    orbit,
-                                    scene_id,
-                                    scans,
-                                    Time.time_gps(sse),
-                                    sse,
-                                    Time.time_gps(gpt[e0]),
-                                    gpt[e0],
-                                    e0,
-                                )
-                            )
-                            scan = SCPS  # force finish up current scene
-                            seq = 3
-                            cont = 0
-                            pxet = ste  # force out of scan loop
-                            break
-
-                        if adt > SCAN_DUR and seq > 0:
-                            print(
-                                "** Discontinuity seeking %s IDX=%d DT=%f E1=%d"
-                                % (ev_names[seq], e0, dt, e1)
-                            )
-                            cont = 0
-
-                            scan = int((gpt[e0] - rst) / SCAN_DUR)
-                            print("** start Next scan %d" % scan)
-
-                            seq = 3  # force exit SEQ loop
-                            break  # break out of packets loop
-
-                        # find start of sequence and mirror phase in PKT
-                        e1 = 0
-                        while e1 < FPPPKT and ph == 2:
-                            lid0 = (lev[e0, e1] + ev_codes[seq, 4]) % MAX_FPIE
-                            lid1 = (lev[e0, e1] + ev_codes[seq, 5]) % MAX_FPIE
-                            if lid0 >= ev_codes[seq, 0] and lid0 <= ev_codes[seq, 1]:
-                                ph = 0
-                            elif lid1 >= ev_codes[seq, 2] and lid1 <= ev_codes[seq, 3]:
-                                ph = 1
-                            else:
-                                e1 += 1  # check next EV
-                        " end seeking SEQ in current packet "
-
-                        if ph == 2:
-                            e0 += 1  #  look in next packet
-                            e1 = 0
-                    " End seeking SEQ through packets "
-                    print("Out of SEQ seek E0=%d E1=%d" % (e0, e1))
-
-                    if e0 >= tot_pkts:  # hit EOF; finish up any existing scans
-                        print("** Hit EOF ")
-                        e0 = tot_pkts - 1
-                        e1 = FPPPKT - 1
-                        cont = 0
-                        scans = scan  # save any scans already copied
-                        scan = SCPS  # force out of scan loop
-
-                    pkt_idx = e0
-                    if cont == 0:
-                        break  # discont in SEQ seek, break out of SEQ loop
-
-                        # check phase
-                    """
-          if seq==0:  # record reference mirror phase
-            ph0 = ph
-            ph0_idx = e0
-          else:
-            if ph != ph0:
-              print("Phase mismatch EXP=%d[%d] ACT=%d PKT=%d" %(ph0, ph0_idx, ph, e0))
-              e0 = ph0_idx+1  # backup to packet after PH0
-              seq = 0
-              continue  # skip remaining SEQ processing and restart
-          """
-
-                    # Found start of SEQ, check continuity of first SEQ PKT
-
-                    if e0 < tot_pkts - 1:
-                        lid1 = e0 + 1
-                    else:
-                        lid1 = e0
-                    lid0 = lid1 - 1
-                    if lid0 < 0:
-                        lid0 = 0
-
-                    l0 = lev[lid0, e1] - int(FP_EV + 0.5)  #  add 1 FP of counts
-                    if e1 == 0:  #  ends in current packet
-                        dt = (float((lev[lid0, FPPPKT - 1] - l0) % MAX_FPIE)) * EV_DUR
-                    else:  #  ends in next packet
-                        dt = (float((lev[lid1, e1 - 1] - l0) % MAX_FPIE)) * EV_DUR
-                    adt = abs(dt - PKT_DUR)
-                    if adt > PKT_DURT or e0 >= tot_pkts - 1:
-                        print(
-                            "Scene %d Disco %s, terminating scan %d E0=%d E1=%d DT=%f"
-                            % (scene_id, ev_names[seq], scan, e0, e1, dt)
-                        )
-                        pkt_idx = e0 + 1  # get past current packet
-                        scan += 1
-                        cont = 0
-                        seq = 3  # break out of sequence loop to next scan
-                        op = 0
-                        break
-
-                    # calculate fswt of first FP in SEQ
-                    if fswtc_err == 1:  # use time from previous PKT+FP_DUR
-                        dpt = e0 - 1
-                        if dpt < 0:
-                            dpt = 0
-                        fswtc = FP_DUR
-                    else:
-                        dpt = e0
-                        fswtc = 0.0
-                    if e1 == 0:  #  Seq starts at beginning of PKT
-                        p0t = gpt[e0] - fswtc * FPPPKT
-                    else:  #  count backward from next PKT
-                        dt = (FPPPKT - e1) * FP_DUR
-                        p0t = gpt[dpt + 1] - dt + fswtc
-                    dpt = gpt[lid1] - gpt[lid0]
-
-                    # calculate ISS time correction
-                    if iss_tcorr > 0:
-                        tdx = np.argmax(p0t < terr)
-                        """ if tcorr[tdx] >= 2147483648: tc = (tcorr[tdx] - 4294967296)
-                        else: tc = tcorr[tdx]  """
-                        print(
-                            "Scene %d scan %d TCORR=%f TDX=%d"
-                            % (scene_id, scan, tcorr[tdx], tdx)
-                        )
-                    if scan == 0:  # save refined scene start time of IMG
-                        rst = p0t
-                        # tc0 = tc
-                    if seq == 0:  # save scan start time
-                        sst = p0t
-                        scan = int((sst - rst) / SCAN_DUR + 0.5)
-                        dst = sst - sst0
-                        std = dst - SCAN_DUR
-                        fpd = std / FP_DUR
-                        sst0 = sst
-                        print(
-                            "Calculated scan=%02d SCENE=%s SST=%f RST=%f DST=%f STD=%9f FPD=%9f"
-                            % (scan, scene_id, sst, rst, dst, std, fpd)
-                        )
-                        if scan >= SCPS:
-                            print(
-                                "PKT[%d] Time %f outside of current scene %d Terminating"
-                                % (e0, gpt[e0], scene_id)
-                            )
-                            cont = 0
-                            break
-                        line = scan * PPFP
-
-                    elif seq == 2:  # save and replicate IMG start time
-                        print(
-                            "Orbit %s SCENE %d SCAN %d P0T=%f"
-                            % (orb, scene_id, scan, p0t)
-                        )
-                        # pix_time[line:line+PPFP] = Time.time_gps( p0t-tc ).j2000
-                        pix_time[line : line + PPFP] = Time.time_gps(p0t).j2000
-
-                    print(
-                        "Found %s LID[%d,%d]=%d PH=%d SCENE=%s SCAN=%d GPS=%f DPT=%f %s"
-                        % (
-                            ev_names[seq],
-                            e0,
-                            e1,
-                            lev[e0, e1],
-                            ph,
-                            scene_id,
-                            scan,
-                            p0t,
-                            dpt,
-                            Time.time_gps(p0t),
-                        )
-                    )
-
-                    # Copy pixels from PKT
-                    p1 = e1
-                    fpc = FPPPKT - p1  # FPs to copy from first PKT
-
-                    op0 = ev_codes[3, seq]  # starting output fp of sequence
-                    op1 = ev_codes[3, seq + 1]  # ending output fp of sequence
-                    op = op0  # initialize output FP pointer
-
-                    while op < op1 and e0 < tot_pkts:
-                        # print("SCENE=%d SCAN=%d E0=%d E1=%d GPS=%f SEQ=%d OP=%d" %(scene_id,scan,e0,e1,gpt[e0], seq, op))
-
-                        remain = op1 - op  # remaining FPs to fill in current scan
-                        opinc = 0
-                        #  calculate delta time between packets
-                        if e0 == tot_pkts - 1:  # at last packet in file
-                            dt = PKT_DUR
-                            lid0 = e0 - 1
-                            lid1 = e0
-                        else:
-                            if fswtc_err == 1:
-                                lid0 = e0 - 1
-                                lid1 = e0  # time code error
-                            else:
-                                lid0 = e0
-                                lid1 = e0 + 1  # correct time
-                            dt = gpt[lid1] - gpt[lid0]
-                        # if p1==0: sq = (seq-1)%3
-                        # else: sq = seq
-
-                        """  check against expected delta T between sequences  """
-                        if (
-                            op > op0
-                            and (dt < 0 or abs(dt - PKT_DUR) > PKT_DURT)
-                            and seq == 2
-                        ):  # time discontinuity
-                            ldd[:] = (
-                                lev[e0, 1:] - lev[e0, : FPPPKT - 1]
-                            ) % MAX_FPIE  # find FP with EV jump
-                            fpc = int(np.argmax(ldd > FP_EVT))
-                            if fpc == 0:
-                                if ldd[0] > FP_EVT:
-                                    fpc = 1
-                                else:
-                                    fpc = FPPPKT
-                            else:
-                                fpc += 1
-
-                            if fpc < remain:  # jump occurred before end of IMG
-                                jumps += 1
-                                print(
-                                    "*** Orbit %s Scene %d scan %d %s Time jump PKT=%d %s DT=%10.8f OP=%d "
-                                    % (
-                                        orb,
-                                        scene_id,
-                                        scan,
-                                        ev_names[seq],
-                                        lid1,
-                                        Time.time_gps(gpt[lid1]),
-                                        dt,
-                                        op,
-                                    ),
-                                    end="",
-                                )
-
-                                if (
-                                    dt > IMG_DUR - (op1 - op) * FP_DUR
-                                ):  # jump outside of current IMG, go to next scan
-                                    print("past IMG seq", end="")
-                                # elif dt > det[sq] or dt<0:  # greater than normal time gap or negative
-
-                                if e0 == tot_pkts - 1:  # at end of data
-                                    dev = 0.0
-                                    d2 = 0.0
-                                else:  # check EV continuity to next packet
-                                    dev = abs(
-                                        (lev[lid1, 0] - lev[lid0, 0]) - FP_EV * FPPPKT
-                                    )
-                                    d2 = abs(
-                                        (lev[lid1, FPPPKT - 1] - lev[lid0, FPPPKT - 1])
-                                        - FP_EV * FPPPKT
-                                    )
-                                if (
-                                    (op == op0 and d2 <= FP_EVT)
-                                    or (op >= op1 - FPPPKT and dev <= FP_EVT)
-                                    or (dev <= FP_EVT and d2 <= FP_EVT)
-                                ):
-                                    opinc = 0  # EV continuous
-                                else:
-                                    opinc = int(dt / FP_DUR + 0.5) - FPPPKT
-
-                                if dt < 0:
-                                    print("Negative time jump", end="")
-                                else:
-                                    print(" ...continuing", end="")
-
-                                print(" OPINC=%d  ***" % opinc)
-                                print(
-                                    "Copying remaining %d FPs from PKT [%d,%d] to scan %d at %d"
-                                    % (fpc, e0, p1, scan, op)
-                                )
-                            # End jump detection
-
-                        for b in range(BANDS):  # transpose new packet to flex_buf
-                            flex_buf[:, :, b] = np.transpose(bip[e0, :, :, b])
-
-                        if fpc >= remain:
-                            fpc = remain  # runt at end of sequence
-                            print(
-                                "Last %s chunk:%d FPC=%d IDX=[%d,%d] OP=%d"
-                                % (ev_names[seq], remain, fpc, e0, p1, op),
-                                end="",
-                            )
-                            if seq == 2:
-                                sse = gpt[e0 - 1] + PKT_DUR + fpc * FP_DUR + FP_DUR
-                                print(" SSE=%f" % sse)
-                            else:
-                                print(" NULL")
-                            if remain == FPPPKT:
-                                remain = 0  # next search in next packet
-
-                        dp = op - op0
-                        # print("SEQ=%d LINE=%d OP=%d DP=%d P1=%d FPC=%d E0=%d REMAIN=%d OPINC=%d" %(seq,line,op,dp,p1,fpc,e0,remain,opinc))
-                        obuf[seq][line : line + PPFP, dp : dp + fpc, :] = flex_buf[
-                            :, p1 : p1 + fpc, :
-                        ]
-                        if seq == 2:
-                            ev_buf[scan, dp : dp + fpc] = lev[e0, p1 : p1 + fpc]
-                        gpix[seq] += fpc
-
-                        if (
-                            (e0 < tot_pkts - 1)
-                            and pid[lid1] > 1
-                            and (int(pid[lid1]) - int(pid[lid0])) != 1
-                        ):  # skip non-consecutive packet ID
-                            print(
-                                "found non-contiguous PKT %d PIDs=%d %d"
-                                % (lid1, pid[lid0], pid[lid1])
-                            )
-
-                            if opinc < 0:
-                                e0 += 1
-                                print("Skipping disco PKT %d ID=%d" % (e0, pid[e0]))
-                                opinc = 0
-
-                        op = op + opinc + fpc
-                        if op < op0 or op > op1:  # next packet outside of current scan
-                            cont = 1
-                            # sse = gpt[e0 - 1] + PKT_DUR + fpc * FP_DUR + FP_DUR
-                            sse = rst + fpc * FP_DUR + FP_DUR
-                            print(
-                                "Terminating scan %d in %s at FP %d E0=%d FPC=%d P0T=%f RST=%f SSE=%f"
-                                % (scan, ev_names[seq], op, e0, fpc, p0t, rst, sse)
-                            )
-                            seq = 3  # force exit SEQ loop
-                            op = 0
-                            break
-                        fpc = FPPPKT  # full PKTs after (partial) first PKT
-                        p1 = 0
-                        e0 += 1
-
-                    # end seq copy loop
-                    if e0 >= tot_pkts:
-                        pkt_idx = tot_pkts - 1
-                        sse = gpt[pkt_idx] + PKT_DUR - FP_DUR
-                        print(
-                            "Hit EOF, E0=%d, set scene end time to end of last packet: %f"
-                            % (e0, sse)
-                        )
-                    else:
-                        if op > op0 and remain > 0:
-                            pkt_idx = e0 - 1
-                        else:
-                            pkt_idx = e0
-                    if cont == 0:
-                        break  # drop into scan loop
-                    seq += 1
-                # end seq loop
-
-                print(
-                    "SCENE=%s SCAN=%d SCANS=%d LINE=%d DT=%f s2k=%f IDX=%d REMAIN=%d OP=%d RSE=%f"
-                    % (
-                        scene_id,
-                        scan,
-                        scans,
-                        line,
-                        dt,
-                        pix_time[scans],
-                        pkt_idx,
-                        remain,
-                        op,
-                        rse,
-                    )
-                )
-
-                # cont==0 from:
-                # - No SEQ from scene start time
-                #   restart scan loop with scan=0, scans=0, new IDX and scene start time
-
-                if cont == 0:
-                    if scans == 0:  # restart scanning with new IDX
-                        scan = 0
-                    if pkt_idx == tot_pkts - 1:  # EOF
-                        break  # break out of scan loop
-                else:
-                    good[:] += gpix[:]
-                    pxet += SCAN_DUR
-                    scans += 1
-                    scan += 1
-
-            # end scan loop
-            print("Out of scan loop scan=%d scans=%s" % (scan, scans))
-
-            if scans == 0:
-                continue  # skip rest of processing
-
-            good_bb = good[0] + good[1]
+        def write_scene(
+            orbit: int,
+            scene_id: int,
+            rst: float,
+            rse: float,
+            scans: int,
+            good_bb: float,
+            good_img: float,
+            fov_obst: str,
+            img: np.ndarray,
+            hbb: np.ndarray,
+            cbb: np.ndarray,
+            pix_time: np.ndarray,
+            ev_buf: np.ndarray,
+        ) -> None:
+            """Write out the L1A_RAW_PIX and L1A_BB files for an assembled
+            scene, and fill in the scene footprint. This doesn't depend on
+            any of the assembly state, so it can be run by a BackgroundWriter
+            while we assemble the next scene."""
+            twrite = time.perf_counter()
+            orb = str("%05d" % orbit)
             bb_cnt = scans * 2 * BBLEN
-            good_img = good[2]
             img_cnt = scans * FPPSC
-            # rse = sse - tc  # refined scene end time
-            rse = sse  # refined scene end time
-            # if o_start_time is None: o_start_time = Time.time_gps( rst-tc0 )
-            if o_start_time is None:
-                o_start_time = Time.time_gps(rst)
-            o_end_time = Time.time_gps(rse)
-            scenes.append(
-                "%05d	%03d	%s	%s\n"
-                % (
-                    orbit,
-                    scene_id,
-                    str(Time.time_gps(rst))[:26],
-                    str(Time.time_gps(rse))[:26],
-                )
-            )
-            # str( Time.time_gps( rst-tc0 ) )[:26], str( Time.time_gps( rse ) )[:26] ) )
+            BandSpec = np.zeros(BANDS, dtype=np.float64)
 
             # copy to output files
 
@@ -1382,40 +1041,27 @@ class L1aRawPixGenerate(object):
                 % (scene_id, p0, p1, rst, rse, str(datetime.now()))
             )
             print(" ")
-            bt = l1a_rtg.create_dataset("time_j2000", shape=(p1 - p0 + 1,), dtype="f8")
+            bt = l1a_rtg.create_dataset(
+                "time_j2000", data=gps_to_j2000(bbtime[p0 : p1 + 1]), dtype="f8"
+            )
             bt.attrs["Units"] = "seconds"
             bt.attrs["valid_min"] = "0"
             bt.attrs["valid_max"] = "N/A"
             bt.attrs["fill"] = "-9999"
             r2 = l1a_rtg.create_dataset(
-                "RTD_295K",
-                shape=(
-                    p1 - p0 + 1,
-                    5,
-                ),
-                dtype="f4",
+                "RTD_295K", data=rtd295_k[p0 : p1 + 1, :], dtype="f4"
             )
             r2.attrs["Units"] = "K"
             r2.attrs["valid_min"] = "290"
             r2.attrs["valid_max"] = "320"
             r2.attrs["fill"] = "-9999"
             r3 = l1a_rtg.create_dataset(
-                "RTD_325K",
-                shape=(
-                    p1 - p0 + 1,
-                    5,
-                ),
-                dtype="f4",
+                "RTD_325K", data=rtd325_k[p0 : p1 + 1, :], dtype="f4"
             )
             r3.attrs["Units"] = "K"
             r3.attrs["valid_min"] = "320"
             r3.attrs["valid_max"] = "330"
             r3.attrs["fill"] = "-9999"
-            for i in range(p0, p1 + 1):
-                bt[i - p0] = Time.time_gps(bbtime[i]).j2000
-                for j in range(5):
-                    r2[i - p0, j] = prc[j](p7r(bbt[i, 0, j]))
-                    r3[i - p0, j] = prh[j](p7r(bbt[i, 1, j]))
 
             #  Check FOV obstruction
 
@@ -1501,8 +1147,666 @@ class L1aRawPixGenerate(object):
                 os.rename(pname, oname)
                 oname = bname + ".bad"
                 os.rename(bname, oname)
+            self._phase_done("write", twrite)
+
+        def process_scene(
+            orbit: int, scene_id: int, sts: Time, ste: Time, state: _SceneState
+        ) -> None | int | tuple[int, int, float, float, int]:
+            """Assemble and write out a single scene. Returns None if the
+            scene is skipped, a negative error status, or the orbit, scene id,
+            refined scene start and end time and number of time jumps.
+
+            state is the _SceneState from the previous scene, which we
+            update. Other than that scenes are independent of each other,
+            so this can be run in parallel. If state.sse is nan and the
+            scene needs it, we raise _SceneStateNeeded before writing
+            anything."""
+            tassemble = time.perf_counter()
+            jumps = 0
+            remain = state.remain
+            op = 0
+            sst0 = state.sst0
+            sse = state.sse
+            if assembler is not None:
+                assembler_jumps = assembler.jumps
+            orb = str("%05d" % orbit)
+            print("====  ", datetime.now(), "  ====")
+            dt = ste.gps - sts.gps
+            print(
+                "SCENE=%03d START=%s(%f) END=%s(%f) DT=%f"
+                % (scene_id, sts, sts.gps, ste, ste.gps, dt)
+            )
+
+            # detect field of view obstruction
+            fov_obst = self.detect_obst(sts, ste)
+            if fov_obst == "NA":
+                print(
+                    "Error:  Obstruction files not found in DIR %s, terminating"
+                    % self.obst_dir
+                )
+                if self.use_obst_file == "YES":
+                    return -6
+            good[:] = 0.0
+
+            # *** Assume packets in time sequence ***
+            " search for packet containing scene start time "
+            if sts.gps > gpt[tot_pkts - 1]:
+                t0 = Time.time_gps(gpt[tot_pkts - 1])
+                print(
+                    "Scene time %s(%f) past data time %s(%f)"
+                    % (sts, sts.gps, t0, gpt[tot_pkts - 1])
+                )
+                return None  # go to next scene
+            if l0b_index is not None:
+                pkt_idx = l0b_index.scene_packet_range(sts.gps, ste.gps)[0]
+            else:
+                pkt_idx = np.argmax(gpt > sts.gps)
+            if pkt_idx > 0:
+                pkt_idx -= 1
+            t0 = Time.time_gps(gpt[pkt_idx])
+            dt = t0 - sts
+            print(
+                "Located scene %s start time %f in PKT[%d] %s(%f) DT=%f"
+                % (scene_id, sts.gps, pkt_idx, str(t0), t0.gps, dt)
+            )
+            rst = t0.gps - dt
+            rse = ste.gps  # initialize refined scene end time
+            print(
+                "Initial guess of refined scene start/end time %s(%f) %s(%f)"
+                % (Time.time_gps(rst), rst, Time.time_gps(rse), rse)
+            )
+
+            # initialize buffers to fill values
+            img[:, :, :] = 0xFFFF
+            hbb[:, :, :] = 0xFFFF
+            cbb[:, :, :] = 0xFFFF
+            pix_time[:] = 0.0
+            ev_buf[:, :] = 0xFFFFFFFF
+
+            line = 0  # line pointer in output image
+            pxet = t0 + PIX_DUR  # BB and IMG pixel end time
+
+            scan = 0
+            scans = 0
+            if pkt_idx > 0:
+                pkt_idx -= 1  # compensate for time code error
+            if isinstance(bip, L0bPacketReader):
+                bip.prime(pkt_idx)
+
+            if assembler is not None:
+                scans, rst, sse, sst0 = assembler.assemble_scene(
+                    orbit, orb, scene_id, pkt_idx, rst, rse, pxet, ste, sse, sst0, good
+                )
+            else:
+                while scan < SCPS and pxet < ste:
+                    cont = 1
+                    flex_buf[:, :, :] = 0xFFFF
+                    e1 = 0
+                    #  Loop through HBB, CBB, and IMG sequences in scan
+                    seq = 0
+                    gpix[:] = 0
+                    """ph0 = 2
+                    ph0_idx = 0"""
+                    while seq < 3:
+                        e0 = pkt_idx
+                        ph = 2  # mirror phase should be 0 or 1
+                        while e0 < tot_pkts and ph == 2:  # search for sequence start
+                            if e0 == 0:
+                                dt = 0
+                            else:
+                                dt = (
+                                    float((lev[e0, 0] - lev[e0 - 1, e1]) % MAX_FPIE)
+                                ) * EV_DUR
+                            adt = abs(dt)
+                            if gpt[e0] > rse:  # packet time past end of scene
+                                scans = scan
+                                sse = rst + scans * SCAN_DUR
+                                print(
+                                    "** Finish orbit %05d short scene %s SCANS=%d end=%s(%f) GPT=%s(%f) at %d"
+                                    % (
+                                        orbit,
+                                        scene_id,
+                                        scans,
+                                        Time.time_gps(sse),
+                                        sse,
+                                        Time.time_gps(gpt[e0]),
+                                        gpt[e0],
+                                        e0,
+                                    )
+                                )
+                                scan = SCPS  # force finish up current scene
+                                seq = 3
+                                cont = 0
+                                pxet = ste  # force out of scan loop
+                                break
+
+                            if adt > SCAN_DUR and seq > 0:
+                                print(
+                                    "** Discontinuity seeking %s IDX=%d DT=%f E1=%d"
+                                    % (ev_names[seq], e0, dt, e1)
+                                )
+                                cont = 0
+
+                                scan = int((gpt[e0] - rst) / SCAN_DUR)
+                                print("** start Next scan %d" % scan)
+
+                                seq = 3  # force exit SEQ loop
+                                break  # break out of packets loop
+
+                            # find start of sequence and mirror phase in PKT
+                            e1 = 0
+                            while e1 < FPPPKT and ph == 2:
+                                lid0 = (lev[e0, e1] + ev_codes[seq, 4]) % MAX_FPIE
+                                lid1 = (lev[e0, e1] + ev_codes[seq, 5]) % MAX_FPIE
+                                if (
+                                    lid0 >= ev_codes[seq, 0]
+                                    and lid0 <= ev_codes[seq, 1]
+                                ):
+                                    ph = 0
+                                elif (
+                                    lid1 >= ev_codes[seq, 2]
+                                    and lid1 <= ev_codes[seq, 3]
+                                ):
+                                    ph = 1
+                                else:
+                                    e1 += 1  # check next EV
+                            " end seeking SEQ in current packet "
+
+                            if ph == 2:
+                                e0 += 1  #  look in next packet
+                                e1 = 0
+                        " End seeking SEQ through packets "
+                        print("Out of SEQ seek E0=%d E1=%d" % (e0, e1))
+
+                        if e0 >= tot_pkts:  # hit EOF; finish up any existing scans
+                            print("** Hit EOF ")
+                            e0 = tot_pkts - 1
+                            e1 = FPPPKT - 1
+                            cont = 0
+                            scans = scan  # save any scans already copied
+                            scan = SCPS  # force out of scan loop
+
+                        pkt_idx = e0
+                        if cont == 0:
+                            break  # discont in SEQ seek, break out of SEQ loop
+
+                            # check phase
+                        """
+              if seq==0:  # record reference mirror phase
+                ph0 = ph
+                ph0_idx = e0
+              else:
+                if ph != ph0:
+                  print("Phase mismatch EXP=%d[%d] ACT=%d PKT=%d" %(ph0, ph0_idx, ph, e0))
+                  e0 = ph0_idx+1  # backup to packet after PH0
+                  seq = 0
+                  continue  # skip remaining SEQ processing and restart
+              """
+
+                        # Found start of SEQ, check continuity of first SEQ PKT
+
+                        if e0 < tot_pkts - 1:
+                            lid1 = e0 + 1
+                        else:
+                            lid1 = e0
+                        lid0 = lid1 - 1
+                        if lid0 < 0:
+                            lid0 = 0
+
+                        l0 = lev[lid0, e1] - int(FP_EV + 0.5)  #  add 1 FP of counts
+                        if e1 == 0:  #  ends in current packet
+                            dt = (
+                                float((lev[lid0, FPPPKT - 1] - l0) % MAX_FPIE)
+                            ) * EV_DUR
+                        else:  #  ends in next packet
+                            dt = (float((lev[lid1, e1 - 1] - l0) % MAX_FPIE)) * EV_DUR
+                        adt = abs(dt - PKT_DUR)
+                        if adt > PKT_DURT or e0 >= tot_pkts - 1:
+                            print(
+                                "Scene %d Disco %s, terminating scan %d E0=%d E1=%d DT=%f"
+                                % (scene_id, ev_names[seq], scan, e0, e1, dt)
+                            )
+                            pkt_idx = e0 + 1  # get past current packet
+                            scan += 1
+                            cont = 0
+                            seq = 3  # break out of sequence loop to next scan
+                            op = 0
+                            break
+
+                        # calculate fswt of first FP in SEQ
+                        if fswtc_err == 1:  # use time from previous PKT+FP_DUR
+                            dpt = e0 - 1
+                            if dpt < 0:
+                                dpt = 0
+                            fswtc = FP_DUR
+                        else:
+                            dpt = e0
+                            fswtc = 0.0
+                        if e1 == 0:  #  Seq starts at beginning of PKT
+                            p0t = gpt[e0] - fswtc * FPPPKT
+                        else:  #  count backward from next PKT
+                            dt = (FPPPKT - e1) * FP_DUR
+                            p0t = gpt[dpt + 1] - dt + fswtc
+                        dpt = gpt[lid1] - gpt[lid0]
+
+                        # calculate ISS time correction
+                        if iss_tcorr > 0:
+                            tdx = np.argmax(p0t < terr)
+                            """ if tcorr[tdx] >= 2147483648: tc = (tcorr[tdx] - 4294967296)
+                            else: tc = tcorr[tdx]  """
+                            print(
+                                "Scene %d scan %d TCORR=%f TDX=%d"
+                                % (scene_id, scan, tcorr[tdx], tdx)
+                            )
+                        if scan == 0:  # save refined scene start time of IMG
+                            rst = p0t
+                            # tc0 = tc
+                        if seq == 0:  # save scan start time
+                            sst = p0t
+                            scan = int((sst - rst) / SCAN_DUR + 0.5)
+                            dst = sst - sst0
+                            std = dst - SCAN_DUR
+                            fpd = std / FP_DUR
+                            sst0 = sst
+                            print(
+                                "Calculated scan=%02d SCENE=%s SST=%f RST=%f DST=%f STD=%9f FPD=%9f"
+                                % (scan, scene_id, sst, rst, dst, std, fpd)
+                            )
+                            if scan >= SCPS:
+                                print(
+                                    "PKT[%d] Time %f outside of current scene %d Terminating"
+                                    % (e0, gpt[e0], scene_id)
+                                )
+                                cont = 0
+                                break
+                            line = scan * PPFP
+
+                        elif seq == 2:  # save and replicate IMG start time
+                            print(
+                                "Orbit %s SCENE %d SCAN %d P0T=%f"
+                                % (orb, scene_id, scan, p0t)
+                            )
+                            # pix_time[line:line+PPFP] = Time.time_gps( p0t-tc ).j2000
+                            pix_time[line : line + PPFP] = Time.time_gps(p0t).j2000
+
+                        print(
+                            "Found %s LID[%d,%d]=%d PH=%d SCENE=%s SCAN=%d GPS=%f DPT=%f %s"
+                            % (
+                                ev_names[seq],
+                                e0,
+                                e1,
+                                lev[e0, e1],
+                                ph,
+                                scene_id,
+                                scan,
+                                p0t,
+                                dpt,
+                                Time.time_gps(p0t),
+                            )
+                        )
+
+                        # Copy pixels from PKT
+                        p1 = e1
+                        fpc = FPPPKT - p1  # FPs to copy from first PKT
+
+                        op0 = ev_codes[3, seq]  # starting output fp of sequence
+                        op1 = ev_codes[3, seq + 1]  # ending output fp of sequence
+                        op = op0  # initialize output FP pointer
+
+                        while op < op1 and e0 < tot_pkts:
+                            # print("SCENE=%d SCAN=%d E0=%d E1=%d GPS=%f SEQ=%d OP=%d" %(scene_id,scan,e0,e1,gpt[e0], seq, op))
+
+                            remain = op1 - op  # remaining FPs to fill in current scan
+                            opinc = 0
+                            #  calculate delta time between packets
+                            if e0 == tot_pkts - 1:  # at last packet in file
+                                dt = PKT_DUR
+                                lid0 = e0 - 1
+                                lid1 = e0
+                            else:
+                                if fswtc_err == 1:
+                                    lid0 = e0 - 1
+                                    lid1 = e0  # time code error
+                                else:
+                                    lid0 = e0
+                                    lid1 = e0 + 1  # correct time
+                                dt = gpt[lid1] - gpt[lid0]
+                            # if p1==0: sq = (seq-1)%3
+                            # else: sq = seq
+
+                            """  check against expected delta T between sequences  """
+                            if (
+                                op > op0
+                                and (dt < 0 or abs(dt - PKT_DUR) > PKT_DURT)
+                                and seq == 2
+                            ):  # time discontinuity
+                                ldd[:] = (
+                                    lev[e0, 1:] - lev[e0, : FPPPKT - 1]
+                                ) % MAX_FPIE  # find FP with EV jump
+                                fpc = int(np.argmax(ldd > FP_EVT))
+                                if fpc == 0:
+                                    if ldd[0] > FP_EVT:
+                                        fpc = 1
+                                    else:
+                                        fpc = FPPPKT
+                                else:
+                                    fpc += 1
+
+                                if fpc < remain:  # jump occurred before end of IMG
+                                    jumps += 1
+                                    print(
+                                        "*** Orbit %s Scene %d scan %d %s Time jump PKT=%d %s DT=%10.8f OP=%d "
+                                        % (
+                                            orb,
+                                            scene_id,
+                                            scan,
+                                            ev_names[seq],
+                                            lid1,
+                                            Time.time_gps(gpt[lid1]),
+                                            dt,
+                                            op,
+                                        ),
+                                        end="",
+                                    )
+
+                                    if (
+                                        dt > IMG_DUR - (op1 - op) * FP_DUR
+                                    ):  # jump outside of current IMG, go to next scan
+                                        print("past IMG seq", end="")
+                                    # elif dt > det[sq] or dt<0:  # greater than normal time gap or negative
+
+                                    if e0 == tot_pkts - 1:  # at end of data
+                                        dev = 0.0
+                                        d2 = 0.0
+                                    else:  # check EV continuity to next packet
+                                        dev = abs(
+                                            (lev[lid1, 0] - lev[lid0, 0])
+                                            - FP_EV * FPPPKT
+                                        )
+                                        d2 = abs(
+                                            (
+                                                lev[lid1, FPPPKT - 1]
+                                                - lev[lid0, FPPPKT - 1]
+                                            )
+                                            - FP_EV * FPPPKT
+                                        )
+                                    if (
+                                        (op == op0 and d2 <= FP_EVT)
+                                        or (op >= op1 - FPPPKT and dev <= FP_EVT)
+                                        or (dev <= FP_EVT and d2 <= FP_EVT)
+                                    ):
+                                        opinc = 0  # EV continuous
+                                    else:
+                                        opinc = int(dt / FP_DUR + 0.5) - FPPPKT
+
+                                    if dt < 0:
+                                        print("Negative time jump", end="")
+                                    else:
+                                        print(" ...continuing", end="")
+
+                                    print(" OPINC=%d  ***" % opinc)
+                                    print(
+                                        "Copying remaining %d FPs from PKT [%d,%d] to scan %d at %d"
+                                        % (fpc, e0, p1, scan, op)
+                                    )
+                                # End jump detection
+
+                            for b in range(BANDS):  # transpose new packet to flex_buf
+                                flex_buf[:, :, b] = np.transpose(bip[e0, :, :, b])
+
+                            if fpc >= remain:
+                                fpc = remain  # runt at end of sequence
+                                print(
+                                    "Last %s chunk:%d FPC=%d IDX=[%d,%d] OP=%d"
+                                    % (ev_names[seq], remain, fpc, e0, p1, op),
+                                    end="",
+                                )
+                                if seq == 2:
+                                    sse = gpt[e0 - 1] + PKT_DUR + fpc * FP_DUR + FP_DUR
+                                    print(" SSE=%f" % sse)
+                                else:
+                                    print(" NULL")
+                                if remain == FPPPKT:
+                                    remain = 0  # next search in next packet
+
+                            dp = op - op0
+                            # print("SEQ=%d LINE=%d OP=%d DP=%d P1=%d FPC=%d E0=%d REMAIN=%d OPINC=%d" %(seq,line,op,dp,p1,fpc,e0,remain,opinc))
+                            obuf[seq][line : line + PPFP, dp : dp + fpc, :] = flex_buf[
+                                :, p1 : p1 + fpc, :
+                            ]
+                            if seq == 2:
+                                ev_buf[scan, dp : dp + fpc] = lev[e0, p1 : p1 + fpc]
+                            gpix[seq] += fpc
+
+                            if (
+                                (e0 < tot_pkts - 1)
+                                and pid[lid1] > 1
+                                and (int(pid[lid1]) - int(pid[lid0])) != 1
+                            ):  # skip non-consecutive packet ID
+                                print(
+                                    "found non-contiguous PKT %d PIDs=%d %d"
+                                    % (lid1, pid[lid0], pid[lid1])
+                                )
+
+                                if opinc < 0:
+                                    e0 += 1
+                                    print("Skipping disco PKT %d ID=%d" % (e0, pid[e0]))
+                                    opinc = 0
+
+                            op = op + opinc + fpc
+                            if (
+                                op < op0 or op > op1
+                            ):  # next packet outside of current scan
+                                cont = 1
+                                # sse = gpt[e0 - 1] + PKT_DUR + fpc * FP_DUR + FP_DUR
+                                sse = rst + fpc * FP_DUR + FP_DUR
+                                print(
+                                    "Terminating scan %d in %s at FP %d E0=%d FPC=%d P0T=%f RST=%f SSE=%f"
+                                    % (scan, ev_names[seq], op, e0, fpc, p0t, rst, sse)
+                                )
+                                seq = 3  # force exit SEQ loop
+                                op = 0
+                                break
+                            fpc = FPPPKT  # full PKTs after (partial) first PKT
+                            p1 = 0
+                            e0 += 1
+
+                        # end seq copy loop
+                        if e0 >= tot_pkts:
+                            pkt_idx = tot_pkts - 1
+                            sse = gpt[pkt_idx] + PKT_DUR - FP_DUR
+                            print(
+                                "Hit EOF, E0=%d, set scene end time to end of last packet: %f"
+                                % (e0, sse)
+                            )
+                        else:
+                            if op > op0 and remain > 0:
+                                pkt_idx = e0 - 1
+                            else:
+                                pkt_idx = e0
+                        if cont == 0:
+                            break  # drop into scan loop
+                        seq += 1
+                    # end seq loop
+
+                    print(
+                        "SCENE=%s SCAN=%d SCANS=%d LINE=%d DT=%f s2k=%f IDX=%d REMAIN=%d OP=%d RSE=%f"
+                        % (
+                            scene_id,
+                            scan,
+                            scans,
+                            line,
+                            dt,
+                            pix_time[scans],
+                            pkt_idx,
+                            remain,
+                            op,
+                            rse,
+                        )
+                    )
+
+                    # cont==0 from:
+                    # - No SEQ from scene start time
+                    #   restart scan loop with scan=0, scans=0, new IDX and scene start time
+
+                    if cont == 0:
+                        if scans == 0:  # restart scanning with new IDX
+                            scan = 0
+                        if pkt_idx == tot_pkts - 1:  # EOF
+                            break  # break out of scan loop
+                    else:
+                        good[:] += gpix[:]
+                        pxet += SCAN_DUR
+                        scans += 1
+                        scan += 1
+
+                # end scan loop
+                print("Out of scan loop scan=%d scans=%s" % (scan, scans))
+
+            state.sse = sse
+            state.sst0 = sst0
+            state.remain = remain
+            if scans == 0:
+                return None  # skip rest of processing
+
+            good_bb = good[0] + good[1]
+            good_img = good[2]
+            if np.isnan(sse):
+                raise _SceneStateNeeded()
+            # rse = sse - tc  # refined scene end time
+            rse = sse  # refined scene end time
+            if assembler is not None:
+                jumps += assembler.jumps - assembler_jumps
+
+            self._phase_done("assemble", tassemble)
+            if scene_writer.asynchronous:
+                # The assembly buffers are reused for the next scene, so
+                # give the writer its own copy
+                sbuf = [v.copy() for v in (img, hbb, cbb, pix_time, ev_buf)]
+            else:
+                sbuf = [img, hbb, cbb, pix_time, ev_buf]
+            scene_writer.submit(
+                write_scene,
+                orbit,
+                scene_id,
+                rst,
+                rse,
+                scans,
+                good_bb,
+                good_img,
+                fov_obst,
+                *sbuf,
+            )
+            return orbit, scene_id, rst, rse, jumps
+
+        scene_list = []
+        for orbit, scene_id, sts, ste in self.process_scene_file():
+            orb = str("%05d" % orbit)
+            if orb != onum:  # process only matching orbit numbers
+                print(
+                    "Ignoring mismatch orbit number %s, ref=%s scene=%d"
+                    % (orb, onum, scene_id)
+                )
+                continue
+            scene_list.append((orbit, scene_id, sts, ste))
+            if l0b_index is not None:
+                # Fill in the scene packet ranges here, so the workers
+                # below don't all try to update the index file
+                l0b_index.scene_packet_range(sts.gps, ste.gps)
+
+        tphase = self._phase_done("packet_index", tphase)
+
+        # start looking at first packet in file
+        # iterate through scenes from scene start/stop file
+        if self.number_cpu > 1 and len(scene_list) > 1:
+            # Scenes are already written in parallel by the workers. Don't
+            # start a writer thread, threads don't mix well with fork.
+            scene_writer = BackgroundWriter(0)
+            # In the serial loop, a scene without obstruction reports stops
+            # the run before anything is written for it or the scenes after
+            # it. So only send the scenes before it to the workers, and
+            # process it afterwards to get the error.
+            nscene = len(scene_list)
+            if self.use_obst_file == "YES":
+                for i, (_, _, sts, ste) in enumerate(scene_list):
+                    if self.obst_index.detect(sts, ste) == "NA":
+                        nscene = i
+                        break
+            # h5py file handles can't be shared with forked processes, so
+            # close the L0B here and have each worker open its own copy.
+            # Everything else we need from the L0B is already in memory.
+            terr = terr[:]
+            tcorr = tcorr[:]
+            tdpuio = tdpuio[:]
+            bip.close()
+            self.fin.close()
+            wres = []
+            if nscene > 0:
+                # We depend on fork to pass process_scene to the workers
+                pool = multiprocessing.get_context("fork").Pool(
+                    min(self.number_cpu, nscene),
+                    initializer=_scene_worker_init,
+                    initargs=(process_scene, bip),
+                )
+                try:
+                    wres = pool.starmap(_scene_worker, scene_list[:nscene], chunksize=1)
+                finally:
+                    pool.close()
+                    pool.join()
+            # Carry the scene end time from one scene to the next like the
+            # serial loop does. A scene that needed the end time of the
+            # scene before it is redone here, now that we know it.
+            res = []
+            state = _SceneState()
+            for sargs, (r, scene_sse, need_state) in zip(scene_list, wres):
+                if need_state:
+                    if bip.dset is None:
+                        bip.reopen()
+                    r = process_scene(*sargs, state)
+                elif not np.isnan(scene_sse):
+                    state.sse = scene_sse
+                res.append(r)
+            if nscene < len(scene_list):
+                res.append(process_scene(*scene_list[nscene], state))
+            bip.close()
+        else:
+            # Write each scene in the background while we assemble the
+            # next one, if requested
+            res = []
+            state = _SceneState()
+            with BackgroundWriter(self.write_queue_size) as scene_writer:
+                for sargs in scene_list:
+                    r = process_scene(*sargs, state)
+                    res.append(r)
+                    if isinstance(r, int):
+                        break
 
         " end scene loop "
+        self._phase_done("scenes", tphase)
+
+        # Merge the results in scene order
+        o_start_time = None
+        jumps = 0
+        scenes = []  # record refined scene start/stop times
+        for r in res:
+            if r is None:
+                continue
+            if isinstance(r, int):
+                return r
+            orbit, scene_id, rst, rse, sjumps = r
+            jumps += sjumps
+            if o_start_time is None:
+                o_start_time = Time.time_gps(rst)
+            o_end_time = Time.time_gps(rse)
+            scenes.append(
+                "%05d	%03d	%s	%s\n"
+                % (
+                    orbit,
+                    scene_id,
+                    str(Time.time_gps(rst))[:26],
+                    str(Time.time_gps(rse))[:26],
+                )
+            )
 
         if len(scenes) == 0:
             print("****  Error:  FATAL  ****  No scenes generated  ****")
@@ -1532,5 +1836,6 @@ class L1aRawPixGenerate(object):
         # Write out a dummy log file
         # print("This is a dummy log file", file = self.log)
         # self.log.flush()
-        print("====  End Orbit %s" % orb, datetime.now(), "jumps=%d  ====" % jumps)
+        self._phase_done("total", trun)
+        print("====  End Orbit %s" % onum, datetime.now(), "jumps=%d  ====" % jumps)
         return jumps
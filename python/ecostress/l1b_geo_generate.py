@@ -9,6 +9,8 @@ from .pickle_method import *
 import h5py  # type: ignore
 from .geo_write_standard_metadata import GeoWriteStandardMetadata
 from .misc import time_split
+from .shared_array import SharedArray
+from .worker_context import WorkerContext
 import numpy as np
 from loguru import logger
 import os
@@ -36,6 +38,7 @@ class L1bGeoGenerate(object):
         run_config: None | RunConfig = None,
         start_line: int = 0,
         number_line: int = -1,
+        number_thread: int = 1,
         local_granule_id: str | None = None,
         collection_label: str = "ECOSTRESS",
         build_id: str = "0.30",
@@ -52,9 +55,17 @@ class L1bGeoGenerate(object):
         You can pass the run_config in which is used to fill in some of the
         metadata. Without this, we skip that metadata and just have fill data.
         This is useful for testing, but for production you will always want to
-        have the run config available."""
+        have the run config available.
+
+        number_thread is the number of threads the GroundCoordinateArray
+        uses to calculate each scan."""
         self.igc = igc
         self.gc_arr = GroundCoordinateArray(self.igc, True)
+        self.gc_arr.number_thread = number_thread
+        if hasattr(self.igc, "time_table"):
+            self.time_table = self.igc.time_table
+        else:
+            self.time_table = self.igc.sub_time_table
         self.cprocess = cprocess
         self.radfname = radfname
         self.lwm = lwm
@@ -75,6 +86,42 @@ class L1bGeoGenerate(object):
         self.tcorr_after = tcorr_after
         self.geolocation_accuracy_qa = geolocation_accuracy_qa
 
+    def _loc_scan(
+        self,
+        start_line: int,
+        number_line: int,
+        res: np.ndarray,
+        tlinestart: np.ndarray,
+    ) -> int:
+        """Determine the locations for one scan. This writes lat, lon,
+        height, vzenith, vazimuth, szenith, sazimuth and lfrac into
+        res (8 x number_line x number_sample), and the line start times into
+        tlinestart. Returns the number of lines we actually calculated,
+        which might be less than number_line at the end of the data."""
+        try:
+            gres = self.gc_arr.ground_coor_scan_arr(start_line, number_line)
+            nline = gres.shape[0]
+            res[:7, :nline] = np.moveaxis(gres[:, :, 0, 0, :], -1, 0)
+            logger.info(f"Done with [{start_line}, {start_line + nline}]")
+        except RuntimeError:
+            nline = number_line
+            res[:7, :nline] = FILL_VALUE_BAD_OR_MISSING
+            logger.info(f"Skipping [{start_line}, {start_line + nline}]")
+        lat = res[0, :nline]
+        lon = res[1, :nline]
+        # Work around a bug in SrtmDem when we get very close to
+        # longitude 180. We should fix this is geocal, but that is
+        # pretty involved. So for now, tweak the longitude values so we
+        # don't run into this. See git Issue #138
+        lon_tweak = lon.copy()
+        lon_tweak[lon_tweak > 179] = 179.0
+        lfrac = GroundCoordinateArray.interpolate(self.lwm, lat, lon_tweak)
+        res[7, :nline] = np.where(
+            lfrac <= fill_value_threshold, fill_value_threshold, lfrac * 100.0
+        )
+        tlinestart[:nline] = self.time_table.line_time_j2000(start_line, nline)
+        return nline
+
     def loc_parallel_func(
         self, it: tuple[int, int]
     ) -> tuple[
@@ -88,54 +135,39 @@ class L1bGeoGenerate(object):
         np.ndarray,
         np.ndarray,
     ]:
-        """Variation of loc that is easier to use with a multiprocessor pool."""
+        """Variation of loc that is easier to use with a multiprocessor pool.
+        This returns lat, lon, height, vzenith, vazimuth, szenith, sazimuth,
+        lfrac and tlinestart for one scan."""
         start_line, number_line = it
-        try:
-            # Note res here refers to an internal cache array of gc_arr
-            res = self.gc_arr.ground_coor_scan_arr(start_line, number_line)
-            logger.info(f"Done with [{start_line}, {start_line + res.shape[0]}]")
-        except RuntimeError:
-            res = np.empty((number_line, self.igc.image.number_sample, 1, 1, 7))
-            res[:] = FILL_VALUE_BAD_OR_MISSING
-            logger.info(f"Skipping [{start_line}, {start_line + res.shape[0]}]")
-        # Note the copy() here is very important. As an optimization,
-        # ground_coor_scan_arr return a reference to an internal cache
-        # variable. This array gets overwritten in the next call to
-        # ground_coor_scan_arr. So we need to explicitly copy anything
-        # we want to keep.
-        lat = res[:, :, 0, 0, 0].copy()
-        lon = res[:, :, 0, 0, 1].copy()
-        height = res[:, :, 0, 0, 2].copy()
-        vzenith = res[:, :, 0, 0, 3].copy()
-        vazimuth = res[:, :, 0, 0, 4].copy()
-        szenith = res[:, :, 0, 0, 5].copy()
-        sazimuth = res[:, :, 0, 0, 6].copy()
-        # Work around a bug in SrtmDem when we get very close to
-        # longitude 180. We should fix this is geocal, but that is
-        # pretty involved. So for now, tweak the longitude values so we
-        # don't run into this. See git Issue #138
-        lon_tweak = lon.copy()
-        lon_tweak[lon_tweak > 179] = 179.0
-        lfrac = GroundCoordinateArray.interpolate(self.lwm, lat, lon_tweak)
-        lfrac = np.where(
-            lfrac <= fill_value_threshold, fill_value_threshold, lfrac * 100.0
-        )
-        tlinestart = np.array(
-            [
-                self.igc.pixel_time(geocal.ImageCoordinate(ln, 0)).j2000
-                for ln in range(start_line, start_line + res.shape[0])
-            ]
-        )
+        res = np.empty((8, number_line, self.igc.number_sample))
+        tlinestart = np.empty((number_line,))
+        nline = self._loc_scan(start_line, number_line, res, tlinestart)
         return (
-            lat,
-            lon,
-            height,
-            vzenith,
-            vazimuth,
-            szenith,
-            sazimuth,
-            lfrac,
-            tlinestart,
+            res[0, :nline],
+            res[1, :nline],
+            res[2, :nline],
+            res[3, :nline],
+            res[4, :nline],
+            res[5, :nline],
+            res[6, :nline],
+            res[7, :nline],
+            tlinestart[:nline],
+        )
+
+    @staticmethod
+    def loc_shared_parallel_func(
+        it: tuple[WorkerContext, int, int, int, SharedArray, SharedArray],
+    ) -> int:
+        """Variation of loc_parallel_func that writes the results directly
+        into the shared result arrays, starting at out_line. The
+        L1bGeoGenerate comes from the WorkerContext, so it is only sent
+        to each worker once. Returns the number of lines written."""
+        ctx, start_line, number_line, out_line, sres, stime = it
+        return ctx.obj._loc_scan(
+            start_line,
+            number_line,
+            sres.data[:, out_line : out_line + number_line],
+            stime.data[out_line : out_line + number_line],
         )
 
     def loc(
@@ -161,19 +193,50 @@ class L1bGeoGenerate(object):
                     it.append((ls, le - ls))
                 else:
                     it.append((ls, min(le - ls, le2 - ls)))
+        # Each scan writes directly into its rows of the result. With a
+        # pool, the result is in shared memory so the workers don't need to
+        # send their results back.
+        out_line = np.cumsum([0] + [nl for _, nl in it])
+        shape = (8, int(out_line[-1]), self.igc.number_sample)
         if pool is None:
-            r = list(map(self.loc_parallel_func, it))
+            res = np.empty(shape)
+            tlinestart = np.empty(shape[1:2])
+            nwritten = [
+                self._loc_scan(
+                    ls,
+                    nl,
+                    res[:, out_line[i] : out_line[i] + nl],
+                    tlinestart[out_line[i] : out_line[i] + nl],
+                )
+                for i, (ls, nl) in enumerate(it)
+            ]
         else:
-            r = pool.map(self.loc_parallel_func, it)
-        lat = np.vstack([rv[0] for rv in r])
-        lon = np.vstack([rv[1] for rv in r])
-        height = np.vstack([rv[2] for rv in r])
-        vzenith = np.vstack([rv[3] for rv in r])
-        vazimuth = np.vstack([rv[4] for rv in r])
-        szenith = np.vstack([rv[5] for rv in r])
-        sazimuth = np.vstack([rv[6] for rv in r])
-        lfrac = np.vstack([rv[7] for rv in r])
-        tlinestart = np.hstack([rv[8] for rv in r])
+            with (
+                SharedArray(shape) as sres,
+                SharedArray(shape[1:2]) as stime,
+                WorkerContext(self) as ctx,
+            ):
+                nwritten = pool.map(
+                    L1bGeoGenerate.loc_shared_parallel_func,
+                    [
+                        (ctx, ls, nl, int(out_line[i]), sres, stime)
+                        for i, (ls, nl) in enumerate(it)
+                    ],
+                )
+                res = sres.copy()
+                tlinestart = stime.copy()
+        # Normally every scan fills in all its lines, but if not we drop the
+        # lines we didn't calculate.
+        if any(nw < nl for nw, (_, nl) in zip(nwritten, it)):
+            keep = np.concatenate(
+                [
+                    np.arange(out_line[i], out_line[i] + nw)
+                    for i, nw in enumerate(nwritten)
+                ]
+            )
+            res = res[:, keep]
+            tlinestart = tlinestart[keep]
+        lat, lon, height, vzenith, vazimuth, szenith, sazimuth, lfrac = res
         return lat, lon, height, vzenith, vazimuth, szenith, sazimuth, lfrac, tlinestart
 
     def run(self, pool: None | Pool = None) -> None:
@@ -211,10 +274,7 @@ class L1bGeoGenerate(object):
         )
         if self.run_config is not None:
             m.process_run_config_metadata(self.run_config)
-        if hasattr(self.igc, "time_table"):
-            tt = self.igc.time_table
-        else:
-            tt = self.igc.sub_time_table
+        tt = self.time_table
         m.set("CloudCover", self.cloud_cover)
         m.set("WestBoundingCoordinate", lon[lon > -998].min())
         m.set("EastBoundingCoordinate", lon[lon > -998].max())
@@ -63,6 +63,7 @@ class L1bGeoProcess:
         landsat_band: int = -1,
         number_cpu: int = 10,
         number_line: int = -1,
+        number_thread: int = -1,
         # If supplied, should be yaw, pitch, roll to add in degrees
         orbit_offset: list[float] | None = None,
         force_night: bool = False,
@@ -93,6 +94,17 @@ class L1bGeoProcess:
                 )
             self.process_args(prod_dir, l1a_raw_att, l1_osp_dir, l1b_rad, number_cpu)
         self.setup_orthobase(landsat_band, ecostress_band)
+        # Number of threads GroundCoordinateArray uses for each scan. -1
+        # means use the value in the configuration file, defaulting to 1
+        # if it isn't there.
+        if number_thread == -1:
+            self.number_thread = (
+                self.l1b_geo_config.number_thread
+                if hasattr(self.l1b_geo_config, "number_thread")
+                else 1
+            )
+        else:
+            self.number_thread = number_thread
         if orbit_offset is not None:
             self.setup_orbit_offset(orbit_offset)
         self.orb_initial: geocal.Orbit = self.strategy.modify_orbit(self.orb_initial)
@@ -630,6 +642,7 @@ class L1bGeoProcess:
                     self.is_day[i],
                     field_of_view_obscured=field_of_view_obscured,
                     number_line=self.number_line,
+                    number_thread=self.number_thread,
                     run_config=self.config,
                     collection_label=self.collection_label,
                     build_id=self.build_id,
@@ -145,6 +145,7 @@ class L1bCollection2GeoStrategy(L1bGeoStrategy):
             proj_number_subpixel=l1b_geo_process.l1b_geo_config.proj_number_subpixel,
             min_tp_per_scene=l1b_geo_process.l1b_geo_config.min_tp_per_scene,
             min_number_good_scan=l1b_geo_process.l1b_geo_config.min_number_good_scan,
+            number_thread=l1b_geo_process.number_thread,
             pass_number=pass_number,
         )
         tpcol, time_range_tp = t.tpcol(pool=pool)
@@ -203,6 +204,7 @@ class L1bGeoStrategy2Pass(L1bGeoStrategy):
             if pass_number == 1
             else l1b_geo_process.l1b_geo_config.min_tp_per_scene,
             min_number_good_scan=l1b_geo_process.l1b_geo_config.min_number_good_scan,
+            number_thread=l1b_geo_process.number_thread,
             pass_number=pass_number,
         )
         tpcol, time_range_tp = t.tpcol(pool=pool)
@@ -3,6 +3,7 @@ from ecostress_swig import fill_value_threshold, Resampler, GroundCoordinateArra
 import geocal  # type: ignore
 from .pickle_method import *
 from .misc import determine_rotated_map_igc
+from .worker_context import WorkerContext
 import numpy as np
 import scipy.ndimage  # type: ignore
 import os
@@ -36,8 +37,12 @@ class L1bProj(object):
         pass_through_error: bool = False,
         separate_file_per_scan: bool = False,
         rotated: bool = True,
+        number_thread: int = 1,
     ) -> None:
-        """Project igc and generate a Vicar file fname."""
+        """Project igc and generate a Vicar file fname.
+
+        number_thread is the number of threads each GroundCoordinateArray
+        uses to calculate a scan."""
         self.igccol = igccol
         self.gc_arr = list()
         self.qa_file = qa_file
@@ -60,9 +65,9 @@ class L1bProj(object):
             round(60.0 / b.map_info.resolution_meter) for b in self.ortho_base
         ]
         for i in range(self.igccol.number_image):
-            self.gc_arr.append(
-                GroundCoordinateArray(self.igccol.image_ground_connection(i))
-            )
+            gc_arr = GroundCoordinateArray(self.igccol.image_ground_connection(i))
+            gc_arr.number_thread = number_thread
+            self.gc_arr.append(gc_arr)
 
     def scratch_file(self, create: bool = False) -> np.memmap:
         """Open/Create the scratch file we use in our lat/lon calculation."""
@@ -237,6 +242,14 @@ class L1bProj(object):
         logger.info("Done with [%d, %d, %d]" % (igc_ind, start_line, end_line))
         return True
 
+    @staticmethod
+    def proj_scan_worker(it: tuple[WorkerContext, int, int]) -> bool:
+        """Variation of proj_scan for use with a pool, where the L1bProj
+        comes from a WorkerContext so it is only sent to each worker
+        once."""
+        ctx, igc_ind, scan_index = it
+        return ctx.obj.proj_scan((igc_ind, scan_index))
+
     def proj(self, pool: Pool | None = None, include_mask: bool = False) -> list[bool]:
         # Create file, but then close. We reopen in each process. Without
         # this, numpy seems to create some sort of lock where only one
@@ -269,7 +282,8 @@ class L1bProj(object):
         if pool is None:
             list(map(self.proj_scan, it))
         else:
-            pool.map(self.proj_scan, it)
+            with WorkerContext(self) as ctx:
+                pool.map(L1bProj.proj_scan_worker, [(ctx, *t) for t in it])
 
         # Now resample data, and also resample orthobase to the same
         # map projection.
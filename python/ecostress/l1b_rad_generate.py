@@ -8,28 +8,50 @@ from ecostress_swig import (  # type: ignore
     DQI_STRIPE_NOT_INTERPOLATED,
     DQI_NOT_SEEN,
     DQI_GOOD,
-    EcostressRadApply,
-    EcostressRadAverage,
     fill_value_threshold,
-    band_to_band_tie_points,
-    GeometricModelImageHandleFill,
+    band_to_band_tie_points_multi_band,
+    rad_scan_register_average,
 )
 import h5py  # type: ignore
 from .rad_write_standard_metadata import RadWriteStandardMetadata
 from .misc import is_day
+from .shared_array import SharedArray
+from .worker_context import WorkerContext
+from .l1a_pix_scan_reader import L1aPixScanReader
 from .ecostress_interpolate import (
     EcostressAeDeepEnsembleInterpolate,
     EcostressLocalWindowKNNInterpolator,
 )
 import numpy as np
 from loguru import logger
+import resource
 import typing
 from typing import Any
 
 if typing.TYPE_CHECKING:
+    from multiprocessing.pool import Pool
     from .run_config import RunConfig
 
 
+def _image_scan_task(
+    it: tuple[WorkerContext, list[int], int, list[SharedArray]],
+) -> int:
+    """Task for a multiprocessing pool to generate the L1B_RAD data for
+    one scan. The L1bRadGenerate comes from the WorkerContext, so it is
+    only sent to each worker once. We write the result directly into the
+    shared array for each band, and return the number of bands missing for
+    the scan."""
+    ctx, band_list, scan_index, res = it
+    nmissing = 0
+    for i, d in enumerate(ctx.obj.scan_images(band_list, scan_index)):
+        if d is None:
+            nmissing += 1
+            continue
+        nlinescan = d.shape[0]
+        res[i].data[scan_index * nlinescan : (scan_index + 1) * nlinescan, :] = d
+    return nmissing
+
+
 class L1bRadGenerate(object):
     """This generates a L1B rad file from the given L1A_PIX file."""
 
@@ -59,7 +81,12 @@ class L1bRadGenerate(object):
         command."""
         self.igc = igc
         self.l1a_pix_fname = l1a_pix
-        self.l1a_pix = h5py.File(l1a_pix, "r")
+        # The reader opens the files once, and we share the L1A_PIX file
+        # handle for reading the metadata.
+        self.reader = L1aPixScanReader(
+            l1a_pix, l1a_gain, number_line_scan=self.igc.number_line_scan
+        )
+        self.l1a_pix = self.reader.l1a_pix
         if "BandSpecification" in self.l1a_pix["L1A_PIXMetadata"]:
             self.nband = int(
                 np.count_nonzero(
@@ -96,88 +123,183 @@ class L1bRadGenerate(object):
         self.line_order_flipped = line_order_flipped
         self.cal_correction = cal_correction
 
-    def image(self, band: int) -> np.ndarray:
-        """Generate L1B_RAD image.
+    def __getstate__(self) -> dict[str, Any]:
+        # h5py files can't be pickled, so drop them when we send this to
+        # a multiprocessing pool. The reader handles reopening its own files.
+        state = self.__dict__.copy()
+        del state["l1a_pix"]
+        return state
 
-        This applies the gains from L1A_PIX to scale to radiance data.
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.l1a_pix = self.reader.l1a_pix
+
+    @staticmethod
+    def quadratic_coefficient(
+        m: geocal.GeometricModel, number_line: int, number_sample: int
+    ) -> np.ndarray:
+        """Return the coefficients used by rad_scan_register_average for
+        the geometric model m (e.g., a fitted QuadraticGeometricModel).
+        We evaluate the model on a small grid and solve for the quadratic,
+        which is exact for a quadratic model and doesn't depend on how the
+        model stores its parameters."""
+        ln, smp = np.meshgrid(
+            np.linspace(0, number_line - 1, 4),
+            np.linspace(0, number_sample - 1, 4),
+            indexing="ij",
+        )
+        ln = ln.flatten()
+        smp = smp.flatten()
+        a = np.stack([np.ones(ln.shape), ln, smp, ln * ln, ln * smp, smp * smp], axis=1)
+        ic = [
+            m.original_image_coordinate(geocal.ImageCoordinate(i, j))
+            for i, j in zip(ln, smp)
+        ]
+        cline = np.linalg.lstsq(a, np.array([t.line for t in ic]), rcond=None)[0]
+        csamp = np.linalg.lstsq(a, np.array([t.sample for t in ic]), rcond=None)[0]
+        return np.concatenate([cline, csamp])
+
+    def scan_images(
+        self, band_list: list[int], scan_index: int
+    ) -> list[np.ndarray | None]:
+        """Generate the L1B_RAD data for one scan of each band in band_list,
+        with None for any band where all the data in the scan is bad.
 
         We use a quadratic transformation to do band to band registration.
+        The tie points for all the bands are generated together, so we
+        only calculate the reference band ground locations once per scan.
+        The gain, registration and line averaging are then done in one
+        pass by rad_scan_register_average.
         """
-
-        rad = EcostressRadApply(self.l1a_pix_fname, self.l1a_gain_fname, band)
-        res = np.empty((int(rad.number_line / 2), rad.number_sample), dtype=np.float32)
-        nscan = int(rad.number_line / self.igc.number_line_scan)
-        for scan_index in range(nscan):
-            logger.debug(f"Doing scan_index {scan_index} for band {band}")
-            # Perform band to band, unless we have been directed to skip
-            # it (useful for initial working on band to band registration
-            sline = scan_index * self.igc.number_line_scan
-            nlinescan = self.igc.number_line_scan
-            radsub = geocal.SubRasterImage(rad, sline, 0, nlinescan, rad.number_sample)
-            d = radsub.read_all()
+        logger.debug(f"Doing scan_index {scan_index} for bands {band_list}")
+        sdata = {}
+        for band in band_list:
+            dn, gain, offset = self.reader.scan_data(band, scan_index)
             # Skip processing scan if all the data is bad. This allows
             # handling for short scenes, where we might not have the
             # L1A_ATT data to calculate band to band.
-            self.total_possible_scan += 1
-            if np.all(d <= fill_value_threshold):
-                res[int(sline / 2) : int((sline + nlinescan) / 2), :] = (
-                    FILL_VALUE_BAD_OR_MISSING
+            bad = (dn < 0) | (gain < -9998) | (offset < -9998)
+            if not np.all(bad | (dn * gain + offset <= fill_value_threshold)):
+                sdata[band] = (dn, gain, offset)
+        # Perform band to band, unless we have been directed to skip
+        # it (useful for initial working on band to band registration
+        tplist = {}
+        if not self.skip_band_to_band and len(sdata) > 0:
+            tplist = dict(
+                zip(
+                    sdata.keys(),
+                    band_to_band_tie_points_multi_band(
+                        self.igc, scan_index, list(sdata.keys())
+                    ),
                 )
-                self.missing_scan += 1
+            )
+        res: list[np.ndarray | None] = []
+        for band in band_list:
+            if band not in sdata:
+                res.append(None)
+                continue
+            dn, gain, offset = sdata[band]
+            if not self.skip_band_to_band:
+                m = geocal.QuadraticGeometricModel()
+                m.fit_transformation(tplist[band])
+                coeff = self.quadratic_coefficient(m, *dn.shape)
             else:
-                if not self.skip_band_to_band:
-                    tplist = band_to_band_tie_points(self.igc, scan_index, band)
-                    m = geocal.QuadraticGeometricModel()
-                    m.fit_transformation(tplist)
-                    fill_value = FILL_VALUE_NOT_SEEN
-                    rbreg = GeometricModelImageHandleFill(
-                        radsub, m, radsub.number_line, radsub.number_sample, fill_value
-                    )
-                    rbreg_avg = EcostressRadAverage(rbreg)
-                else:
-                    rbreg_avg = EcostressRadAverage(radsub)
-                if self.line_order_flipped:
-                    res[int(sline / 2) : int((sline + nlinescan) / 2), :] = np.flipud(
-                        rbreg_avg.read_all_double()
-                    )
-                else:
-                    res[int(sline / 2) : int((sline + nlinescan) / 2), :] = (
-                        rbreg_avg.read_all_double()
+                coeff = np.zeros((0,))
+            d = rad_scan_register_average(dn, gain, offset, coeff, FILL_VALUE_NOT_SEEN)
+            if self.line_order_flipped:
+                d = np.flipud(d)
+            res.append(d)
+        return res
+
+    def scan_image(self, band: int, scan_index: int) -> np.ndarray | None:
+        """Generate the L1B_RAD data for one scan of one band, or None if
+        all the data in the scan is bad."""
+        return self.scan_images([band], scan_index)[0]
+
+    def images(self, band_list: list[int], pool: None | Pool = None) -> np.ndarray:
+        """Generate L1B_RAD images for the given list of bands, returning
+        an array that is band x line x sample.
+
+        This applies the gains from L1A_PIX to scale to radiance data.
+
+        All the bands of a scan are done together, so the band to band
+        tie points share the reference ground locations. Each scan is
+        independent, so if we are passed a pool we process the scans in
+        parallel.
+        """
+        nline, nsamp = self.reader.shape(band_list[0])
+        nscan = int(nline / self.igc.number_line_scan)
+        shape = (len(band_list), int(nline / 2), nsamp)
+        self.total_possible_scan += len(band_list) * nscan
+        if pool is None:
+            res = np.empty(shape, dtype=np.float32)
+            nlinescan = int(self.igc.number_line_scan / 2)
+            for scan_index in range(nscan):
+                for i, d in enumerate(self.scan_images(band_list, scan_index)):
+                    if d is None:
+                        d = FILL_VALUE_BAD_OR_MISSING
+                        self.missing_scan += 1
+                    res[i, scan_index * nlinescan : (scan_index + 1) * nlinescan, :] = d
+        else:
+            # Each band gets its own shared array, so we can copy a band out
+            # and free its shared memory before copying the next one. This
+            # way we never hold more than one band in both places.
+            sres = [
+                SharedArray(shape[1:], np.float32, FILL_VALUE_BAD_OR_MISSING)
+                for _ in band_list
+            ]
+            try:
+                with WorkerContext(self) as ctx:
+                    missing = pool.map(
+                        _image_scan_task,
+                        [
+                            (ctx, band_list, scan_index, sres)
+                            for scan_index in range(nscan)
+                        ],
                     )
+                self.missing_scan += sum(missing)
+                res = np.empty(shape, dtype=np.float32)
+                for i, s in enumerate(sres):
+                    res[i] = s.data
+                    s.close()
+            finally:
+                for s in sres:
+                    s.close()
         # We don't actually correct SWIR.
         # self.cal_correction is 2 x band, where first entry is gain and second
-        # if offset
-        if band != 0:
-            res = np.where(
-                res <= fill_value_threshold,
-                res,
-                self.cal_correction[0, band - 1] * res
-                + self.cal_correction[1, band - 1],
-            )
+        # if offset. We apply this in place, keeping the data float32
+        for i, band in enumerate(band_list):
+            if band != 0:
+                good = res[i] > fill_value_threshold
+                np.multiply(
+                    res[i], self.cal_correction[0, band - 1], out=res[i], where=good
+                )
+                np.add(res[i], self.cal_correction[1, band - 1], out=res[i], where=good)
         return res
 
-    def run(self) -> None:
-        """Do the actual generation of data."""
+    def image(self, band: int, pool: None | Pool = None) -> np.ndarray:
+        """Generate L1B_RAD image for one band."""
+        return self.images([band], pool)[0]
+
+    def run(self, pool: None | Pool = None) -> None:
+        """Do the actual generation of data. If a pool is passed in, we
+        process the bands and scans in parallel."""
         fout = h5py.File(self.output_name, "w")
-        # Get all data and DQI first, so we can
+        # Get all data and DQI first, so we can interpolate missing data.
+        # This is all kept band x line x sample, float32, so each band is
+        # contiguous.
         self.total_possible_scan = 0
         self.missing_scan = 0
+        dataset = self.images([1, 2, 3, 4, 5], pool)
+        dqi = np.empty(dataset.shape, dtype=np.int8)
         for b in range(5):
-            data = self.image(b + 1)
-            if b == 0:
-                dataset = np.empty((*data.shape, 5))
-                dqi = np.zeros(dataset.shape, dtype=np.int8)
-            dataset[:, :, b] = data
-        inter_uncer = np.zeros(dataset.shape)
-        dqi[dataset == FILL_VALUE_NOT_SEEN] = DQI_NOT_SEEN
-        dqi[dataset == FILL_VALUE_STRIPED] = DQI_STRIPE_NOT_INTERPOLATED
-        dqi[dataset == FILL_VALUE_BAD_OR_MISSING] = DQI_BAD_OR_MISSING
-        dataset, inter_uncer, dqi = self.interpolate_missing(dataset, inter_uncer, dqi)
+            dqi[b] = self.dqi_from_fill(dataset[b])
+        dataset, inter_uncer, dqi = self.interpolate_missing(dataset, dqi)
         g = fout.create_group("Radiance")
         for b in range(5):
             t = g.create_dataset(
                 "radiance_%d" % (b + 1),
-                data=dataset[:, :, b],
+                data=dataset[b],
                 dtype="f4",
                 fillvalue=FILL_VALUE_BAD_OR_MISSING,
                 compression="gzip",
@@ -186,7 +308,7 @@ class L1bRadGenerate(object):
             t.attrs["Units"] = "W/m^2/sr/um"
             t = g.create_dataset(
                 "interpolation_uncertainty_%d" % (b + 1),
-                data=inter_uncer[:, :, b],
+                data=inter_uncer[b],
                 dtype="f4",
                 fillvalue=0.0,
                 compression="gzip",
@@ -202,7 +324,7 @@ See ATB for details.
 Set to 0.0 for values that we haven't interpolated.
 """
             t = g.create_dataset(
-                "data_quality_%d" % (b + 1), data=dqi[:, :, b], compression="gzip"
+                "data_quality_%d" % (b + 1), data=dqi[b], compression="gzip"
             )
             t.attrs["valid_min"] = 0
             t.attrs["valid_max"] = 4
@@ -224,9 +346,11 @@ Data quality indicator.
       instrument design instead of some problem.
 """
             t.attrs["Units"] = "dimensionless"
+        # Done with the TIR data, free it before we do the SWIR
+        del dataset, inter_uncer, dqi
 
         g = fout.create_group("SWIR")
-        data_swir = self.image(0).astype(np.int16)
+        data_swir = self.image(0, pool).astype(np.int16)
         t = g.create_dataset(
             "swir_dn",
             data=data_swir,
@@ -305,12 +429,38 @@ Data quality indicator.
             ]
         )
         m.write()
+        # ru_maxrss is in kilobytes on linux. Pool workers only show up in
+        # RUSAGE_CHILDREN once they have exited.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+        rss_child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024.0
+        logger.info(
+            f"L1B_RAD peak RSS {rss:.1f} MB (largest child process {rss_child:.1f} MB)"
+        )
+
+    @staticmethod
+    def dqi_from_fill(data: np.ndarray) -> np.ndarray:
+        """Data quality indicator for one band, from the fill values in the
+        radiance data. We only look at each pixel once, and then just
+        handle the (usually few) fill values."""
+        dqi = np.zeros(data.shape, dtype=np.int8)
+        fill = data <= fill_value_threshold
+        dfill = data[fill]
+        dqi_fill = np.zeros(dfill.shape, dtype=np.int8)
+        dqi_fill[dfill == FILL_VALUE_NOT_SEEN] = DQI_NOT_SEEN
+        dqi_fill[dfill == FILL_VALUE_STRIPED] = DQI_STRIPE_NOT_INTERPOLATED
+        dqi_fill[dfill == FILL_VALUE_BAD_OR_MISSING] = DQI_BAD_OR_MISSING
+        dqi[fill] = dqi_fill
+        return dqi
 
     def interpolate_missing(
-        self, dataset: np.ndarray, inter_uncer: np.ndarray, dqi: np.ndarray
+        self, dataset: np.ndarray, dqi: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Interpolate missing data. We pull this out, just because it is a bit long
-        and it makes run above a little cleaner"""
+        and it makes run above a little cleaner.
+
+        The data is band x line x sample, and we return the data,
+        interpolation uncertainty and dqi in the same layout. The
+        data and dqi are updated in place."""
         # Only do interpolation if we are directed to,
         # and we have enough data present (e.g., skip
         # if too little of the scene actually has imagery)
@@ -324,10 +474,19 @@ Data quality indicator.
             logger.info(
                 "Skipping interpolation because fraction of scans present is too small (e.g., short scene)"
             )
-            return dataset, inter_uncer, dqi
+            return dataset, np.zeros(dataset.shape, dtype=np.float32), dqi
         elif not self.interpolate_stripe_data:
-            return dataset, inter_uncer, dqi
+            return dataset, np.zeros(dataset.shape, dtype=np.float32), dqi
+        res = self._interpolate_missing(
+            np.moveaxis(dataset, 0, -1), np.moveaxis(dqi, 0, -1)
+        )
+        return tuple(np.moveaxis(t, -1, 0) for t in res)  # type: ignore[return-value]
 
+    def _interpolate_missing(
+        self, dataset: np.ndarray, dqi: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Do the interpolation. This takes line x sample x band views of
+        the data, which is what the interpolators expect."""
         if False:
             # Old interpolator
             inter = EcostressAeDeepEnsembleInterpolate(
@@ -379,6 +538,10 @@ Data quality indicator.
                 center_drop_max_fraction=self.interpolator_parameters.get(
                     "center_drop_max_fraction", 0.10
                 ),
+                n_workers=self.interpolator_parameters.get("n_workers", 1),
+                neighbor_search=self.interpolator_parameters.get(
+                    "neighbor_search", "tiles"
+                ),
             )
 
         # identify horizontal stripes and update data quality mask (if turned on)
@@ -394,12 +557,21 @@ Data quality indicator.
         # but measured can be if we happen to have a small DN). But this isn't
         # overly important, so just go ahead and filter out before we do our training
         # and fill in.
-        if np.any((dataset < 0) & (dqi == DQI_GOOD)):
-            logger.info(
-                "Found negative radiances with good DQI. Setting to FILL_VALUE_BAD_OR_MISSING"
-            )
-            dqi[(dataset < 0) & (dqi == DQI_GOOD)] = DQI_BAD_OR_MISSING
-            dataset[(dataset < 0) & (dqi == DQI_GOOD)] = FILL_VALUE_BAD_OR_MISSING
+        # This is done a band at a time, so the masks are the size of one
+        # band rather than the whole dataset. Note the radiance itself is
+        # left alone, only the DQI changes (the interpolator only uses
+        # DQI_GOOD pixels).
+        found_negative = False
+        for b in range(dataset.shape[-1]):
+            neg = (dataset[..., b] < 0) & (dqi[..., b] == DQI_GOOD)
+            if not np.any(neg):
+                continue
+            if not found_negative:
+                logger.info(
+                    "Found negative radiances with good DQI. Setting DQI to DQI_BAD_OR_MISSING"
+                )
+                found_negative = True
+            dqi[..., b][neg] = DQI_BAD_OR_MISSING
 
         if False:
             # New interpolator doesn't need training
@@ -416,6 +588,8 @@ Data quality indicator.
                 ),
             )
         logger.info("Interpolating missing data")
+        if isinstance(inter, EcostressLocalWindowKNNInterpolator):
+            return inter.interpolate_missing(dataset, dqi, in_place=True)
         return inter.interpolate_missing(dataset, dqi)
 
 
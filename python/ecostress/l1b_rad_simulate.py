@@ -80,12 +80,7 @@ class L1bRadSimulate(object):
         g = fout.create_group("Time")
         t = g.create_dataset(
             "line_start_time_j2000",
-            data=np.array(
-                [
-                    self.time_table.time(geocal.ImageCoordinate(i, 0))[0].j2000
-                    for i in range(self.time_table.max_line + 1)
-                ]
-            ),
+            data=self.time_table.line_time_j2000(0, self.time_table.max_line + 1),
             dtype="f8",
         )
         t.attrs["Description"] = "J2000 time of first pixel in line"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from .l1b_proj import L1bProj
+from .worker_context import WorkerContext
 import geocal  # type: ignore
 from .pickle_method import *
 import shutil
@@ -34,6 +35,7 @@ class L1bTpCollect(object):
         proj_number_subpixel: int = 3,
         min_tp_per_scene: int = 20,
         min_number_good_scan: int = 41,
+        number_thread: int = 1,
         pass_number: int = 1,
     ) -> None:
         self.igccol = igccol
@@ -73,6 +75,7 @@ class L1bTpCollect(object):
             qa_file=self.qa_file,
             min_number_good_scan=min_number_good_scan,
             number_subpixel=proj_number_subpixel,
+            number_thread=number_thread,
             pass_through_error=True,
         )
         # Tom has empirically come up with a set of things to try to
@@ -253,6 +256,16 @@ class L1bTpCollect(object):
             number_match_try,
         )
 
+    @staticmethod
+    def tp_worker(
+        it: tuple[WorkerContext, int],
+    ) -> tuple[geocal.TiePointCollection, geocal.Time, geocal.Time, int, int, int, int]:
+        """Variation of tp for use with a pool, where the L1bTpCollect
+        comes from a WorkerContext so it is only sent to each worker
+        once."""
+        ctx, i = it
+        return ctx.obj.tp(i)
+
     def tpcol(
         self, pool: Pool | None = None
     ) -> tuple[geocal.TiePointCollection, list[tuple[int, geocal.Time, geocal.Time]]]:
@@ -274,7 +287,8 @@ class L1bTpCollect(object):
         if pool is None:
             tpcollist = list(map(self.tp, it))
         else:
-            tpcollist = pool.map(self.tp, it)
+            with WorkerContext(self) as ctx:
+                tpcollist = pool.map(L1bTpCollect.tp_worker, [(ctx, i) for i in it])
         res = geocal.TiePointCollection()
         time_range_tp = []
         for i in range(self.igccol.number_image):
@@ -405,6 +405,19 @@ def time_split(t: geocal.Time) -> tuple[str, str]:
     return mt.group(1), mt.group(2)
 
 
+def gps_to_j2000(t: np.ndarray | float) -> np.ndarray:
+    """Convert GPS time to J2000 time. This is the same as
+    Time.time_gps(t).j2000, but works on a whole array at once. There
+    are no leap seconds between the two, so this is just an offset."""
+    return np.asarray(t, dtype=np.float64) + geocal.Time.time_gps(0.0).j2000
+
+
+def j2000_to_gps(t: np.ndarray | float) -> np.ndarray:
+    """Convert J2000 time to GPS time. This is the same as
+    Time.time_j2000(t).gps, but works on a whole array at once."""
+    return np.asarray(t, dtype=np.float64) + geocal.Time.time_j2000(0.0).gps
+
+
 def ecostress_file_name(
     product_type: str,
     orbit: int,
@@ -629,6 +642,8 @@ __all__ = [
     "ecostress_radiance_scale_factor",
     "time_to_file_string",
     "time_split",
+    "gps_to_j2000",
+    "j2000_to_gps",
     "ecostress_file_name",
     "process_run",
     "find_radiance_file",
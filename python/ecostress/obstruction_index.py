@@ -0,0 +1,137 @@
+from __future__ import annotations
+import glob
+import os
+import pickle
+import re
+import numpy as np
+from geocal import Time  # type: ignore
+
+
+class ObstructionIndex(object):
+    """This reads the solar array obstruction reports from HOSC
+    (ECO*Obst.<year> files in the obstruction directory) once, and then
+    answers whether a scene is obstructed with a binary search.
+
+    Each report file covers a range of days (given in the file name), and
+    has a line for each OBSTRUCTED time window. For each file we keep
+    the window start and end GPS times as arrays, along with the running
+    maximum of each. This gives exactly the same answer as reading the
+    file line by line until we find a window starting after the scene end
+    (which is what L1aRawPixGenerate.detect_obst originally did), even if
+    the windows aren't sorted.
+
+    The parsed files can optionally be cached to disk in cache_file. A
+    file is reparsed if its modification time or size changes, and
+    files that have been added or removed are picked up."""
+
+    def __init__(self, obst_dir: str, cache_file: str | None = None) -> None:
+        self.obst_dir = obst_dir
+        self.cache_file = cache_file
+        cache: dict = {}
+        if cache_file is not None and os.path.exists(cache_file):
+            try:
+                with open(cache_file, "rb") as fh:
+                    cache = pickle.load(fh)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                cache = {}
+        self.files = []
+        updated = False
+        for fname in glob.glob(obst_dir + "/ECO*Obst.*"):
+            st = os.stat(fname)
+            key = os.path.basename(fname)
+            v = cache.get(key)
+            if v is None or v["mtime"] != st.st_mtime or v["size"] != st.st_size:
+                v = self.parse_file(fname)
+                if v is None:
+                    continue
+                v["mtime"] = st.st_mtime
+                v["size"] = st.st_size
+                updated = True
+            v["file_name"] = fname
+            self.files.append(v)
+        # Sort by file start time, so we can stop at the first file past the
+        # scene end
+        self.files.sort(key=lambda v: (v["t1"], v["file_name"]))
+        if cache_file is not None and (updated or len(self.files) != len(cache)):
+            try:
+                tname = "%s.tmp%d" % (cache_file, os.getpid())
+                with open(tname, "wb") as fh:
+                    pickle.dump(
+                        {os.path.basename(v["file_name"]): v for v in self.files}, fh
+                    )
+                os.replace(tname, cache_file)
+            except OSError:
+                # Cache is just an optimization, ok if we can't write it
+                pass
+
+    @staticmethod
+    def parse_file(file_name: str) -> dict | None:
+        """Parse a single obstruction file. Returns None if the file name
+        isn't in the expected format."""
+        fn = os.path.basename(file_name)
+        try:
+            pre, doy1, doy2, post, year = re.split(r"\_|\.", fn)
+        except ValueError:
+            return None
+        yr = int(year)
+        if int(doy2) < int(doy1):
+            yr = yr + 1
+        t1 = Time.parse_time(year + "::" + doy1).gps
+        t2 = Time.parse_time(str(yr) + "::" + doy2).gps
+        start = []
+        end = []
+        with open(file_name, "r") as ifd:
+            for lbuf in ifd:
+                if "OBSTRUCTED" not in lbuf:
+                    continue
+                a, b, c, wdoy1, wt1, d, wdoy2, wt2 = re.split(r" |\,|\/", lbuf)
+                yr = int(year)
+                if int(wdoy2) < int(wdoy1):
+                    yr = yr + 1
+                start.append(Time.parse_time(year + "::" + wdoy1 + " " + wt1).gps)
+                end.append(Time.parse_time(str(yr) + "::" + wdoy2 + " " + wt2[0:8]).gps)
+        start_a = np.array(start, dtype=np.float64)
+        end_a = np.array(end, dtype=np.float64)
+        return {
+            "year": year,
+            "t1": t1,
+            "t2": t2,
+            "start": start_a,
+            "end": end_a,
+            "start_max": np.maximum.accumulate(start_a),
+            "end_max": np.maximum.accumulate(end_a),
+        }
+
+    def detect(self, sts: Time, ste: Time) -> str:
+        """Return "YES" if the scene from sts to ste overlaps an
+        obstruction window, "NO" if not, and "NA" if we don't have any
+        obstruction files for the year of the scene."""
+        ys = str(sts)[0:4]
+        s = sts.gps
+        e = ste.gps
+        found_file = False
+        for v in self.files:
+            if v["year"] != ys:
+                continue
+            found_file = True
+            if e < v["t1"]:
+                break  #  file starts after scene end
+            if s > v["t2"]:  #  file ends before scene start
+                continue
+            # Windows up to the first one starting after the scene end
+            k = int(np.searchsorted(v["start_max"], e, side="right"))
+            if k > 0 and v["end_max"][k - 1] >= s:
+                i = int(np.argmax(v["end"][:k] >= s))
+                print(
+                    "Found OBST times %s %s in %s"
+                    % (
+                        Time.time_gps(v["start"][i]),
+                        Time.time_gps(v["end"][i]),
+                        v["file_name"],
+                    )
+                )
+                return "YES"
+        return "NO" if found_file else "NA"
+
+
+__all__ = ["ObstructionIndex"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import h5py  # type: ignore
+import numpy as np
+import zlib
+import typing
+
+
+class ParallelChunkWriter(object):
+    """This writes gzip compressed datasets to a HDF5 file, doing the
+    compression in a pool of threads.
+
+    h5py compresses each chunk in the thread calling it, so writing a
+    large compressed dataset only uses one core. Instead, we split the
+    data into chunks ourselves, compress them with zlib (which releases
+    the GIL) in a thread pool, and then write the compressed chunks with
+    the HDF5 direct chunk write. The result is the same as
+    create_dataset(..., compression="gzip"), HDF5 and other readers just
+    see a normal deflate compressed dataset.
+
+    Chunks are a number of full rows, so each chunk is a contiguous
+    slice of the input data. This means we can compress straight from
+    a numpy array or memory mapped file without copying the data (only a
+    partial last chunk needs to be padded out).
+
+    All the HDF5 calls are done in the calling thread, since HDF5 isn't
+    thread safe. With number_thread=1 we don't create a thread pool, and
+    just compress in the calling thread."""
+
+    def __init__(
+        self,
+        number_thread: int = 1,
+        compression_level: int = 4,
+        chunk_bytes: int = 1024 * 1024,
+    ) -> None:
+        """Create a ParallelChunkWriter. chunk_bytes is the target chunk
+        size, which should be no larger than the HDF5 chunk cache (1 MB
+        by default) so reading the data line by line stays efficient."""
+        self.number_thread = number_thread
+        self.compression_level = compression_level
+        self.chunk_bytes = chunk_bytes
+        self.pool: ThreadPoolExecutor | None = None
+        if self.number_thread > 1:
+            self.pool = ThreadPoolExecutor(max_workers=self.number_thread)
+
+    def __enter__(self) -> ParallelChunkWriter:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def chunk_shape(self, shape: tuple[int, ...], itemsize: int) -> tuple[int, ...]:
+        """Chunk shape to use, some number of full rows."""
+        row_bytes = itemsize * int(np.prod(shape[1:], dtype=np.int64))
+        nrow = max(1, min(shape[0], self.chunk_bytes // max(row_bytes, 1)))
+        return (nrow,) + tuple(shape[1:])
+
+    def _compress(self, data: np.ndarray, r0: int, nrow: int) -> bytes:
+        d = data[r0 : r0 + nrow]
+        if d.shape[0] < nrow:
+            # HDF5 expects edge chunks to be the full chunk size
+            t = np.zeros((nrow,) + d.shape[1:], dtype=d.dtype)
+            t[: d.shape[0]] = d
+            d = t
+        return zlib.compress(
+            memoryview(np.ascontiguousarray(d)).cast("B"), self.compression_level
+        )
+
+    def create_dataset(
+        self, grp: h5py.Group, name: str, data: np.ndarray
+    ) -> h5py.Dataset:
+        """Create a gzip compressed dataset in grp with the given data,
+        and return the dataset. This is the equivalent of
+        grp.create_dataset(name, data=data, compression="gzip")."""
+        if data.ndim == 0 or data.size == 0:
+            return grp.create_dataset(name, data=data)
+        chunks = self.chunk_shape(data.shape, data.dtype.itemsize)
+        t = grp.create_dataset(
+            name,
+            shape=data.shape,
+            dtype=data.dtype,
+            chunks=chunks,
+            compression="gzip",
+            compression_opts=self.compression_level,
+        )
+        nrow = chunks[0]
+        rstart = range(0, data.shape[0], nrow)
+        zero = (0,) * (data.ndim - 1)
+        if self.pool is not None:
+            res: typing.Iterable[bytes] = self.pool.map(
+                lambda r0: self._compress(data, r0, nrow), rstart
+            )
+        else:
+            res = (self._compress(data, r0, nrow) for r0 in rstart)
+        for r0, buf in zip(rstart, res):
+            t.id.write_direct_chunk((r0,) + zero, buf)
+        return t
+
+
+__all__ = ["ParallelChunkWriter"]
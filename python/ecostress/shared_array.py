@@ -0,0 +1,83 @@
+from __future__ import annotations
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import typing
+
+
+class SharedArray(object):
+    """This is a numpy array in shared memory, which can be passed to a
+    multiprocessing pool. Workers write their results directly into the
+    array, rather than returning them to be pickled and copied back to
+    the parent process.
+
+    The process that creates the SharedArray owns the memory, and should
+    call close() when done (or use this as a context manager). When a
+    SharedArray is pickled we just pass the name of the shared memory, and
+    the unpickled copy attaches to the existing memory."""
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: typing.Any = np.float64,
+        fill_value: float | None = None,
+    ) -> None:
+        """Create a new shared array with the given shape and dtype,
+        optionally filled with fill_value."""
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        nbyte = max(int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize, 1)
+        self.shm = SharedMemory(create=True, size=nbyte)
+        self.owner = True
+        if fill_value is not None:
+            self.data[...] = fill_value
+
+    @property
+    def data(self) -> np.ndarray:
+        """The numpy array, using the shared memory."""
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {"name": self.shm.name, "shape": self.shape, "dtype": self.dtype.str}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.shape = state["shape"]
+        self.dtype = np.dtype(state["dtype"])
+        self.owner = False
+        try:
+            self.shm = SharedMemory(name=state["name"], track=False)  # type: ignore[call-arg]
+        except TypeError:
+            # Before python 3.13 we can't turn off tracking, and attaching
+            # registers the memory with the resource tracker (shared with
+            # the owner) a second time. The tracker then complains about
+            # leaked memory the owner has already freed, so skip the
+            # registration.
+            register = resource_tracker.register
+            resource_tracker.register = lambda *args, **kwargs: None
+            try:
+                self.shm = SharedMemory(name=state["name"])
+            finally:
+                resource_tracker.register = register
+
+    def __enter__(self) -> SharedArray:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def copy(self) -> np.ndarray:
+        """Return a normal numpy array with a copy of the data."""
+        return self.data.copy()
+
+    def close(self) -> None:
+        """Release the shared memory. Only the owner frees the memory, other
+        processes just detach from it."""
+        if self.shm is None:
+            return
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None  # type: ignore[assignment]
+
+
+__all__ = ["SharedArray"]
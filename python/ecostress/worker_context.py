@@ -0,0 +1,87 @@
+from __future__ import annotations
+from .shared_array import SharedArray
+import numpy as np
+import pickle
+import typing
+import uuid
+
+# Objects we have already set up in this process, by WorkerContext key
+_worker_context: dict[str, typing.Any] = {}
+
+
+class WorkerContext(object):
+    """This sends an object (e.g., a L1bProj with its IgcCollection and
+    GroundCoordinateArrays) to the workers of a multiprocessing pool once,
+    rather than with every task.
+
+    Normally we pass a bound method to pool.map, which pickles the whole
+    object for every chunk of tasks, and each worker then unpickles the
+    IgcCollection, orbit, DEM etc. again. Instead we pickle the object
+    once into shared memory. The tasks just pass the WorkerContext (which
+    pickles as a small key) along with the scene and scan to work on. The
+    first time a worker sees a context it unpickles the object and keeps
+    it, so this happens once per worker rather than once per task.
+
+    The pool we use is created once at the start of processing, before
+    we have the objects we want to share, and is used across passes with
+    different IgcCollections. So rather than setting this up in a pool
+    initializer, we set it up the first time a worker uses a new
+    context. Each worker only keeps the most recent context, since we do
+    one step at a time.
+
+    In the process that creates the WorkerContext, obj just returns the
+    original object, so the same task function can be used without a
+    pool.
+
+    The creating process should call close() when done (or use this as a
+    context manager), which frees the shared memory."""
+
+    def __init__(self, obj: typing.Any) -> None:
+        self.key = uuid.uuid4().hex
+        d = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        self.nbyte = len(d)
+        self.sdata: SharedArray | None = SharedArray((self.nbyte,), np.uint8)
+        self.sdata.data[:] = np.frombuffer(d, dtype=np.uint8)
+        self._sdata_state = self.sdata.__getstate__()
+        _worker_context[self.key] = obj
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {"key": self.key, "nbyte": self.nbyte, "sdata": self._sdata_state}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        # We only attach to the shared memory if we actually need to
+        # unpickle the object
+        self.key = state["key"]
+        self.nbyte = state["nbyte"]
+        self._sdata_state = state["sdata"]
+        self.sdata = None
+
+    def __enter__(self) -> WorkerContext:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    @property
+    def obj(self) -> typing.Any:
+        """The object for this context."""
+        if self.key not in _worker_context:
+            _worker_context.clear()
+            sdata = SharedArray.__new__(SharedArray)
+            sdata.__setstate__(self._sdata_state)
+            try:
+                _worker_context[self.key] = pickle.loads(sdata.data)
+            finally:
+                sdata.close()
+        return _worker_context[self.key]
+
+    def close(self) -> None:
+        """Free the shared memory. Only called in the process that created
+        this."""
+        _worker_context.pop(self.key, None)
+        if self.sdata is not None:
+            self.sdata.close()
+            self.sdata = None
+
+
+__all__ = ["WorkerContext"]
@@ -0,0 +1,52 @@
+from datetime import datetime
+import json
+import os
+import subprocess
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB. This is VmHWM from
+    /proc, which (unlike ru_maxrss) starts fresh when a process is
+    spawned, so it doesn't include the memory of the parent process."""
+    with open("/proc/self/status") as fh:
+        for ln in fh:
+            if ln.startswith("VmHWM:"):
+                return int(ln.split()[1]) / 1024.0
+    raise RuntimeError("VmHWM not found in /proc/self/status")
+
+
+def save_result(name, res, request):
+    """Add a result to the JSON file for the benchmark name, tagged with
+    the git commit and date. The file is name_benchmark.json in the
+    directory pytest was run from, or the environment variable
+    ECOSTRESS_<NAME>_BENCHMARK_FILE if set."""
+    res = {
+        "benchmark": name,
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(),
+        **res,
+    }
+    fname = os.environ.get(
+        f"ECOSTRESS_{name.upper()}_BENCHMARK_FILE",
+        os.path.join(request.config.invocation_params.dir, f"{name}_benchmark.json"),
+    )
+    data = {"results": []}
+    if os.path.exists(fname):
+        with open(fname, "r") as fh:
+            data = json.load(fh)
+    data["results"].append(res)
+    with open(fname, "w") as fh:
+        json.dump(data, fh, indent=2)
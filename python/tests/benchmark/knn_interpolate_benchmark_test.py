@@ -0,0 +1,93 @@
+from ecostress import EcostressLocalWindowKNNInterpolator
+from ecostress_swig import (  # type: ignore
+    FILL_VALUE_STRIPED,
+    DQI_INTERPOLATED,
+    DQI_STRIPE_NOT_INTERPOLATED,
+)
+from benchmark_support import save_result
+import time
+import numpy as np
+import pytest
+
+
+def loop_weighted_mean_and_uncertainty(dists, y_nei, eps=1e-6):
+    """The row by row calculation the KNN interpolator used to do, to
+    compare against the batched version."""
+    mu_res = np.zeros(dists.shape[0])
+    uq_res = np.zeros(dists.shape[0])
+    for r in range(dists.shape[0]):
+        d = dists[r]
+        y = y_nei[r]
+        if d[0] <= eps and len(d) >= 2:
+            d = d[1:]
+            y = y[1:]
+        w = 1.0 / (d + eps)
+        w = w / float(np.sum(w))
+        mu = float(np.dot(w, y))
+        w2_sum = float(np.sum(w**2))
+        sw2 = float(np.sum(w * (y - mu) ** 2)) / max(1e-12, 1.0 - w2_sum)
+        mu_res[r] = mu
+        uq_res[r] = float(np.sqrt(max(0.0, sw2 * (1.0 + w2_sum))))
+    return mu_res, uq_res
+
+
+@pytest.mark.long_test
+def test_knn_interpolate_benchmark(request, isolated_dir):
+    """Time the KNN interpolation of a synthetic striped scene, with the
+    tile neighbor search and with a KNN model fit for each window, and the
+    batched neighbor uncertainty calculation against the old row by row
+    loop."""
+    rng = np.random.default_rng(0)
+    h, w = 1000, 1000
+    base = rng.random((h, w)) * 5 + 5
+    dataset = np.stack(
+        [base * (1 + 0.1 * b) + rng.normal(0, 0.05, (h, w)) for b in range(5)],
+        axis=-1,
+    )
+    data_quality = np.zeros(dataset.shape, dtype=np.int8)
+    for b in (1, 4):
+        rows = rng.choice(h, 40, replace=False)
+        dataset[rows, :, b] = FILL_VALUE_STRIPED
+        data_quality[rows, :, b] = DQI_STRIPE_NOT_INTERPOLATED
+    # Import sklearn first, so we don't include that in the window timing
+    import sklearn.neighbors  # type: ignore # noqa: F401
+
+    tstart = time.perf_counter()
+    res, _, dqi = EcostressLocalWindowKNNInterpolator().interpolate_missing(
+        dataset, data_quality
+    )
+    interpolate_time = time.perf_counter() - tstart
+    tstart = time.perf_counter()
+    res2, _, dqi2 = EcostressLocalWindowKNNInterpolator(
+        neighbor_search="window"
+    ).interpolate_missing(dataset, data_quality)
+    interpolate_window_time = time.perf_counter() - tstart
+    np.testing.assert_array_equal(dqi, dqi2)
+    m = dqi == DQI_INTERPOLATED
+
+    npred, k = 200000, 10
+    dists = np.sort(rng.random((npred, k)), axis=1)
+    dists[::7, 0] = 0.0
+    y_nei = rng.random((npred, k))
+    tstart = time.perf_counter()
+    mu_loop, uq_loop = loop_weighted_mean_and_uncertainty(dists, y_nei)
+    loop_time = time.perf_counter() - tstart
+    tstart = time.perf_counter()
+    mu, uq, _ = EcostressLocalWindowKNNInterpolator._weighted_mean_and_uncertainty(
+        dists, y_nei.copy()
+    )
+    batch_time = time.perf_counter() - tstart
+    np.testing.assert_allclose(mu, mu_loop, rtol=1e-12)
+    np.testing.assert_allclose(uq, uq_loop, rtol=1e-12)
+    res = {
+        "scene_shape": [h, w],
+        "interpolate_time": interpolate_time,
+        "interpolate_window_time": interpolate_window_time,
+        "neighbor_search_speedup": interpolate_window_time / interpolate_time,
+        "max_window_difference": float(np.max(np.abs(res[m] - res2[m]))),
+        "number_prediction": npred,
+        "uncertainty_loop_time": loop_time,
+        "uncertainty_batch_time": batch_time,
+        "uncertainty_speedup": loop_time / batch_time,
+    }
+    save_result("knn_interpolate", res, request)
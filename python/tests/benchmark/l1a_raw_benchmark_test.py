@@ -0,0 +1,90 @@
+from ecostress.l0b_synthetic import L0bSynthetic
+from ecostress.l1a_raw_pix_generate import L1aRawPixGenerate
+from benchmark_support import peak_rss_mb, save_result
+import h5py
+import multiprocessing
+import os
+import time
+import pytest
+
+
+def run_l1a_raw(conn, l0b, obst_dir, l1_osp_dir, scene_file, kwargs):
+    """Run L1aRawPixGenerate, and send back the results. This is run in a
+    freshly spawned process, so the peak memory is just this run (plus
+    the python imports) and not the memory of the pytest process."""
+    try:
+        l1a = L1aRawPixGenerate(
+            l0b, obst_dir, l1_osp_dir, scene_file, use_obst_file="NO", **kwargs
+        )
+        tstart = time.perf_counter()
+        status = l1a.run()
+        wall_time = time.perf_counter() - tstart
+        conn.send((status, wall_time, peak_rss_mb(), l1a.timing))
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+@pytest.mark.long_test
+@pytest.mark.parametrize("number_scene", [1, 10, 40])
+@pytest.mark.parametrize(
+    "mode,kwargs",
+    [
+        ("loop", {}),
+        ("vectorized", {"vectorized_assembly": True}),
+    ],
+)
+def test_l1a_raw_benchmark(
+    request, isolated_dir, test_data, number_scene, mode, kwargs
+):
+    """Measure L1A_RAW throughput for a synthetic L0B of the given number
+    of scenes, with some dropped packets and time code jumps."""
+    l0b_in = str(test_data / "L0B_80005_20150124T204251_0100_01.h5")
+    scene_in = str(test_data / "Scene_80005_20150124T204251_20150124T204533.txt")
+    obst_dir = str(test_data / "obst_dir")
+    l1_osp_dir = str(test_data / "l1_osp_dir")
+    # L1aRawPixGenerate gets the orbit number from the file name
+    l0b = os.path.abspath("L0B_80005_synthetic_%03d.h5" % number_scene)
+    scene_file = os.path.abspath("Scene_80005_synthetic_%03d.txt" % number_scene)
+    syn = L0bSynthetic(
+        l0b_in,
+        scene_in,
+        number_scene,
+        packet_drop_fraction=0.001,
+        number_time_jump=number_scene,
+    )
+    syn.create_file(l0b, scene_file)
+    with h5py.File(l0b, "r") as f:
+        npacket = f["flex/bip"].shape[0]
+    os.mkdir("output")
+    os.chdir("output")
+
+    ctx = multiprocessing.get_context("spawn")
+    pconn, cconn = ctx.Pipe(duplex=False)
+    p = ctx.Process(
+        target=run_l1a_raw,
+        args=(cconn, l0b, obst_dir, l1_osp_dir, scene_file, kwargs),
+    )
+    p.start()
+    cconn.close()
+    r = pconn.recv()
+    p.join()
+    if isinstance(r, Exception):
+        raise r
+    status, wall_time, peak_rss_mb, timing = r
+    assert status >= 0
+
+    res = {
+        "mode": mode,
+        "options": kwargs,
+        "number_scene": number_scene,
+        "number_packet": npacket,
+        "packet_drop_fraction": syn.packet_drop_fraction,
+        "number_time_jump": syn.number_time_jump,
+        "wall_time": wall_time,
+        "packets_per_second": npacket / wall_time,
+        "peak_rss_mb": peak_rss_mb,
+        "timing": timing,
+    }
+    save_result("l1a_raw", res, request)
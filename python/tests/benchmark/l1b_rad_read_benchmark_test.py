@@ -0,0 +1,43 @@
+from ecostress import EcostressRadApply, L1aPixScanReader
+from benchmark_support import save_result
+import geocal
+import time
+import numpy as np
+import pytest
+
+
+@pytest.mark.long_test
+def test_l1b_rad_read_benchmark(request, isolated_dir, dn_fname, gain_fname):
+    """Compare the time to read all the scans of each band of the unit
+    test L1A_PIX through GDAL (EcostressRadApply) and through
+    L1aPixScanReader."""
+    band_list = [1, 2, 3, 4, 5, 0]
+    nlinescan = 256
+    tstart = time.perf_counter()
+    d_gdal = []
+    for band in band_list:
+        rad = EcostressRadApply(str(dn_fname), str(gain_fname), band)
+        for scan_index in range(rad.number_line // nlinescan):
+            d_gdal.append(
+                geocal.SubRasterImage(
+                    rad, scan_index * nlinescan, 0, nlinescan, rad.number_sample
+                ).read_all_double()
+            )
+    gdal_time = time.perf_counter() - tstart
+    tstart = time.perf_counter()
+    d_h5py = []
+    with L1aPixScanReader(str(dn_fname), str(gain_fname), nlinescan) as reader:
+        for band in band_list:
+            for scan_index in range(reader.number_scan(band)):
+                d_h5py.append(reader.radiance(band, scan_index))
+    h5py_time = time.perf_counter() - tstart
+    assert len(d_gdal) == len(d_h5py)
+    for d1, d2 in zip(d_gdal, d_h5py):
+        np.testing.assert_allclose(d1, d2)
+    res = {
+        "number_scan": len(d_gdal),
+        "gdal_time": gdal_time,
+        "h5py_time": h5py_time,
+        "speedup": gdal_time / h5py_time,
+    }
+    save_result("l1b_rad_read", res, request)
@@ -45,5 +45,6 @@ def pytest_collection_modifyitems(config, items):
 pytest_plugins = [
     "fixtures.dir_fixture",
     "fixtures.igc_fixture",
+    "fixtures.interpolate_fixture",
     "fixtures.misc_fixture",
 ]
@@ -0,0 +1,41 @@
+# Fixtures used by the stripe interpolation tests
+
+import pytest
+import numpy as np
+from ecostress_swig import (  # type: ignore
+    FILL_VALUE_BAD_OR_MISSING,
+    FILL_VALUE_STRIPED,
+    FILL_VALUE_NOT_SEEN,
+    DQI_BAD_OR_MISSING,
+    DQI_STRIPE_NOT_INTERPOLATED,
+    DQI_NOT_SEEN,
+)
+
+
+@pytest.fixture(scope="function")
+def synthetic_scene():
+    """Return a function that creates a small synthetic 5 band scene,
+    returning the dataset and data quality. By default this has some
+    stripes and bad data, pass stripes=False to get a clean scene."""
+
+    def create(seed=0, h=90, w=120, stripes=True):
+        rng = np.random.default_rng(seed)
+        base = rng.random((h, w)) * 5 + 5
+        dataset = np.stack(
+            [base * (1 + 0.1 * b) + rng.normal(0, 0.05, (h, w)) for b in range(5)],
+            axis=-1,
+        )
+        data_quality = np.zeros(dataset.shape, dtype=np.int8)
+        if not stripes:
+            return dataset, data_quality
+        for b in (1, 4):
+            rows = rng.choice(h, 8, replace=False)
+            dataset[rows, :, b] = FILL_VALUE_STRIPED
+            data_quality[rows, :, b] = DQI_STRIPE_NOT_INTERPOLATED
+        dataset[rng.random((h, w)) < 0.02, 2] = FILL_VALUE_BAD_OR_MISSING
+        data_quality[dataset == FILL_VALUE_BAD_OR_MISSING] = DQI_BAD_OR_MISSING
+        dataset[:, :2, 3] = FILL_VALUE_NOT_SEEN
+        data_quality[dataset == FILL_VALUE_NOT_SEEN] = DQI_NOT_SEEN
+        return dataset, data_quality
+
+    return create
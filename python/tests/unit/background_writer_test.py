@@ -0,0 +1,46 @@
+from ecostress.background_writer import BackgroundWriter
+import time
+import pytest
+
+
+def test_background_writer():
+    res = []
+
+    def job(i):
+        time.sleep(0.01)
+        res.append(i)
+
+    with BackgroundWriter(2) as w:
+        assert w.asynchronous
+        for i in range(10):
+            w.submit(job, i)
+    # Jobs are run in order, in a single thread
+    assert res == list(range(10))
+
+    res = []
+    w = BackgroundWriter(0)
+    assert not w.asynchronous
+    w.submit(job, 1)
+    assert res == [1]
+    w.close()
+
+
+def test_background_writer_exception():
+    def job():
+        raise RuntimeError("Write failed")
+
+    w = BackgroundWriter(1)
+    w.submit(job)
+    with pytest.raises(RuntimeError):
+        w.close()
+
+
+def test_background_writer_exit_with_exception():
+    def job():
+        raise RuntimeError("Write failed")
+
+    # The error in the with block is the one raised, not the job error
+    with pytest.raises(ValueError):
+        with BackgroundWriter(1) as w:
+            w.submit(job)
+            raise ValueError("Processing failed")
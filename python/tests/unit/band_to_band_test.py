@@ -1,5 +1,6 @@
 import ecostress
 import geocal
+import numpy as np
 
 
 def test_band_to_band(isolated_dir, igc_hres, lwm, dn_fname, gain_fname):
@@ -57,3 +58,20 @@ def test_band_to_band(isolated_dir, igc_hres, lwm, dn_fname, gain_fname):
     geocal.GdalRasterImage.save(
         "b3.img", "VICAR", rbreg, geocal.GdalRasterImage.Float64
     )
+
+
+def test_band_to_band_multi_band(igc_hres):
+    """Test that doing all the bands at once gives the same tie points
+    as doing each band separately."""
+    igc_hres.band = ecostress.EcostressImageGroundConnection.REF_BAND
+    scan_index = 10
+    band_list = [1, 2, 3, 4, 5]
+    tplist = ecostress.band_to_band_tie_points_multi_band(
+        igc_hres, scan_index, band_list
+    )
+    assert len(tplist) == len(band_list)
+    for tp, band in zip(tplist, band_list):
+        tp_expect = ecostress.band_to_band_tie_points(igc_hres, scan_index, band)
+        assert tp.x.shape[0] > 0
+        assert np.allclose(tp.x, tp_expect.x)
+        assert np.allclose(tp.y, tp_expect.y)
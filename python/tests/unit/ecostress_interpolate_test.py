@@ -1,4 +1,8 @@
-from ecostress import EcostressLocalWindowKNNInterpolator
+from ecostress import (
+    EcostressAeDeepEnsembleInterpolate,
+    EcostressLocalWindowKNNInterpolator,
+)
+from ecostress.ecostress_interpolate import _GoodPixelIndex, _NeighborTiles
 from ecostress_swig import (  # type: ignore
     FILL_VALUE_BAD_OR_MISSING,
     FILL_VALUE_STRIPED,
@@ -138,3 +142,184 @@ def test_interpolate(isolated_dir, test_data_latest):
 
     for file_path in files:
         run_interpolate(file_path)
+
+
+def test_interpolate_in_place(synthetic_scene):
+    """Interpolating in place, on band x line x sample data, should give the
+    same results as the default copy."""
+    dataset, data_quality = synthetic_scene()
+    kwargs = {"window_size": 21, "n_neighbors": 5, "min_train_per_window": 5}
+    res, uncer, dqi = EcostressLocalWindowKNNInterpolator(**kwargs).interpolate_missing(
+        dataset, data_quality
+    )
+    assert np.count_nonzero(dqi == DQI_INTERPOLATED) > 0
+    dplanar = np.ascontiguousarray(np.moveaxis(dataset, -1, 0))
+    dqi_planar = np.ascontiguousarray(np.moveaxis(data_quality, -1, 0))
+    res2, uncer2, dqi2 = EcostressLocalWindowKNNInterpolator(
+        **kwargs
+    ).interpolate_missing(
+        np.moveaxis(dplanar, 0, -1), np.moveaxis(dqi_planar, 0, -1), in_place=True
+    )
+    assert np.shares_memory(res2, dplanar)
+    np.testing.assert_array_equal(res, res2)
+    np.testing.assert_array_equal(uncer, uncer2)
+    np.testing.assert_array_equal(dqi, dqi2)
+    np.testing.assert_array_equal(dplanar, np.moveaxis(res, -1, 0))
+
+
+def test_interpolate_n_workers(synthetic_scene):
+    """Doing the blocks in parallel should give the same results as doing
+    them serially."""
+    dataset, data_quality = synthetic_scene(seed=1)
+    kwargs = {"window_size": 21, "n_neighbors": 5, "min_train_per_window": 5}
+    res, uncer, dqi = EcostressLocalWindowKNNInterpolator(**kwargs).interpolate_missing(
+        dataset, data_quality
+    )
+    res2, uncer2, dqi2 = EcostressLocalWindowKNNInterpolator(
+        n_workers=3, **kwargs
+    ).interpolate_missing(dataset, data_quality)
+    np.testing.assert_array_equal(res, res2)
+    np.testing.assert_array_equal(uncer, uncer2)
+    np.testing.assert_array_equal(dqi, dqi2)
+
+
+def test_edge_column_exclusion(synthetic_scene):
+    """An edge column that is fully bad within one block's window is
+    excluded from that block's inner region, and this carries over to the
+    later blocks that overlap it. With window_size 21 and block_step 10 on
+    a 35 x 40 scene, the right edge blocks have inner rows 0-14, 15-24 and
+    19-34 (the last block is aligned to the bottom edge). Column 38 is
+    fully bad in the window rows 10-30 of the middle block, but not in the
+    windows of the others."""
+    dataset, data_quality = synthetic_scene(h=35, w=40, stripes=False)
+    dataset[10:33, 38, 0] = FILL_VALUE_BAD_OR_MISSING
+    data_quality[10:33, 38, 0] = DQI_BAD_OR_MISSING
+    kwargs = {
+        "window_size": 21,
+        "block_step": 10,
+        "n_neighbors": 5,
+        "min_train_per_window": 5,
+    }
+    for n_workers in (1, 2):
+        _, _, dqi = EcostressLocalWindowKNNInterpolator(
+            n_workers=n_workers, **kwargs
+        ).interpolate_missing(dataset, data_quality)
+        assert np.all(dqi[10:15, 38, 0] == DQI_INTERPOLATED)
+        assert np.all(dqi[15:25, 38, 0] == DQI_BAD_OR_MISSING)
+        assert np.all(dqi[25:33, 38, 0] == DQI_INTERPOLATED)
+
+
+def test_good_pixel_index(synthetic_scene):
+    """The training pixels from the index should be the same, and in the
+    same order, as masking the window directly."""
+    _, data_quality = synthetic_scene(seed=2)
+    gindex = _GoodPixelIndex(data_quality)
+    rs = slice(10, 41)
+    cs = slice(25, 56)
+    for bands in ([0, 1, 2], [3, 1], [4, 0, 2], [1, 3]):
+        mask = np.all(data_quality[rs, cs][:, :, bands] == DQI_GOOD, axis=2)
+        i, j = gindex.window(bands, rs, cs)
+        ei, ej = np.nonzero(mask)
+        np.testing.assert_array_equal(i, ei + rs.start)
+        np.testing.assert_array_equal(j, ej + cs.start)
+        assert gindex.good_fraction(bands[0], rs, cs) == pytest.approx(
+            np.mean(data_quality[rs, cs, bands[0]] == DQI_GOOD)
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"window_size": 21, "block_step": 10}, {"window_size": 61}]
+)
+def test_neighbor_search_tiles(synthetic_scene, kwargs):
+    """The tile neighbor search should interpolate the same pixels as
+    fitting a KNN model for each window. The training pixels are a bit
+    different (the tiles cover the window short a row and a column, and
+    are subsampled separately), so the values aren't identical. The noise
+    in the synthetic scene is 0.05, and we require the values to agree to
+    within 0.25, with a mean difference below 0.05, and to be as close to
+    the scene without stripes."""
+    h, w = (300, 400) if kwargs.get("window_size") == 61 else (90, 120)
+    clean, _ = synthetic_scene(h=h, w=w, stripes=False)
+    dataset, data_quality = synthetic_scene(h=h, w=w)
+    res, uncer, dqi = EcostressLocalWindowKNNInterpolator(**kwargs).interpolate_missing(
+        dataset, data_quality
+    )
+    res2, uncer2, dqi2 = EcostressLocalWindowKNNInterpolator(
+        neighbor_search="window", **kwargs
+    ).interpolate_missing(dataset, data_quality)
+    np.testing.assert_array_equal(dqi, dqi2)
+    m = dqi == DQI_INTERPOLATED
+    assert np.count_nonzero(m) > 0
+    np.testing.assert_allclose(res[m], res2[m], atol=0.25)
+    assert np.mean(np.abs(res[m] - res2[m])) < 0.05
+    err = np.mean(np.abs(res[m] - clean[m]))
+    err2 = np.mean(np.abs(res2[m] - clean[m]))
+    assert err < 1.1 * err2
+    assert np.mean(uncer[m]) == pytest.approx(np.mean(uncer2[m]), rel=0.1)
+
+
+def test_neighbor_tiles_kneighbors(synthetic_scene):
+    """The nearest neighbors from the tiles should be the nearest of all
+    the good pixels in them, whether we search each tile or merge them
+    into one tree."""
+    dataset, data_quality = synthetic_scene(seed=4)
+    band, feats = 1, [0, 2, 3]
+    tiles = _NeighborTiles(dataset, _GoodPixelIndex(data_quality), 20, 10000)
+    rs = slice(20, 61)
+    cs = slice(40, 81)
+    trees, count = tiles.window_trees(band, feats, rs, cs)
+    assert len(trees) == 4
+    # The tiles are rows and columns 20-59 and 40-79
+    good = np.all(data_quality[20:60, 40:80][:, :, [band, *feats]] == DQI_GOOD, axis=2)
+    assert count == np.count_nonzero(good)
+    x = dataset[20:60, 40:80][good][:, feats]
+    y = dataset[20:60, 40:80, band][good]
+    X_pred = dataset[30:35, 50, feats] + 0.01
+    d_expect = np.linalg.norm(X_pred[:, np.newaxis, :] - x[np.newaxis], axis=2)
+    ind = np.argsort(d_expect, axis=1)[:, :5]
+    for merge_ratio in (1e-6, 1e6):
+        tiles.merge_ratio = merge_ratio
+        d, y_nei = tiles.kneighbors(trees, X_pred, 5)
+        np.testing.assert_allclose(d, np.take_along_axis(d_expect, ind, axis=1))
+        np.testing.assert_allclose(y_nei, y[ind])
+
+
+def test_weighted_mean_and_uncertainty():
+    """An exact self match should be dropped, giving the same result as
+    the shorter row of neighbors."""
+    rng = np.random.default_rng(3)
+    dists = np.sort(rng.random((4, 6)), axis=1)
+    dists[1, 0] = 0.0
+    y_nei = rng.random((4, 6))
+    mu, uq, wgood = EcostressLocalWindowKNNInterpolator._weighted_mean_and_uncertainty(
+        dists.copy(), y_nei.copy()
+    )
+    assert np.all(wgood)
+    w = 1.0 / (dists[0] + 1e-6)
+    w /= w.sum()
+    assert mu[0] == pytest.approx(np.dot(w, y_nei[0]))
+    mu2, uq2, _ = EcostressLocalWindowKNNInterpolator._weighted_mean_and_uncertainty(
+        dists[1:2, 1:].copy(), y_nei[1:2, 1:].copy()
+    )
+    assert mu[1] == pytest.approx(mu2[0])
+    assert uq[1] == pytest.approx(uq2[0])
+
+
+def test_ae_predict_batch_size(synthetic_scene):
+    """Predicting in small batches should give the same results as doing
+    everything at once."""
+    pytest.importorskip("tensorflow")
+    dataset, data_quality = synthetic_scene(seed=4, h=40, w=50)
+    res = []
+    for predict_batch_size in (65536, 37):
+        inter = EcostressAeDeepEnsembleInterpolate(
+            grid_size=3,
+            n_ensemble=2,
+            verbose=False,
+            predict_batch_size=predict_batch_size,
+        )
+        res.append(inter.interpolate_missing(dataset.copy(), data_quality.copy()))
+    assert np.count_nonzero(res[0][2] == DQI_INTERPOLATED) > 0
+    np.testing.assert_allclose(res[0][0], res[1][0], rtol=1e-5)
+    np.testing.assert_allclose(res[0][1], res[1][1], rtol=1e-5)
+    np.testing.assert_array_equal(res[0][2], res[1][2])
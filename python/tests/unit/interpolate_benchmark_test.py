@@ -0,0 +1,41 @@
+from ecostress import InterpolateBenchmark
+from ecostress_swig import (  # type: ignore
+    FILL_VALUE_STRIPED,
+    DQI_GOOD,
+    DQI_STRIPE_NOT_INTERPOLATED,
+)
+import numpy as np
+
+
+def test_inject_stripes(synthetic_scene):
+    dataset, data_quality = synthetic_scene(h=120, w=160, stripes=False)
+    bench = InterpolateBenchmark(dataset, data_quality, edge=10)
+    assert np.any(bench.test_mask)
+    # Only good data is removed, and we always leave at least 2 bands
+    assert np.all(data_quality[bench.test_mask] == DQI_GOOD)
+    assert np.all(bench.striped_dataset[bench.test_mask] == FILL_VALUE_STRIPED)
+    assert np.all(
+        bench.striped_data_quality[bench.test_mask] == DQI_STRIPE_NOT_INTERPOLATED
+    )
+    assert np.all(np.count_nonzero(bench.test_mask, axis=2) <= 3)
+    assert not np.any(bench.test_mask[:, :10])
+    # Reproducible
+    bench2 = InterpolateBenchmark(dataset, data_quality, edge=10)
+    np.testing.assert_array_equal(bench.test_mask, bench2.test_mask)
+
+
+def test_run_grid(synthetic_scene):
+    dataset, data_quality = synthetic_scene(h=120, w=160, stripes=False)
+    bench = InterpolateBenchmark(dataset, data_quality, edge=10)
+    res = bench.run_grid(
+        "knn",
+        {"window_size": [21, 31], "n_neighbors": [5], "min_train_per_window": [5]},
+    )
+    assert len(res) == 2
+    for r in res:
+        assert r["wall_time"] > 0
+        assert r["peak_memory"] > 0
+        assert r["coverage"] > 0.9
+        for b in range(5):
+            if np.any(bench.test_mask[:, :, b]):
+                assert r[f"rmse_b{b + 1}"] < 0.5
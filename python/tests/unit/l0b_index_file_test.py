@@ -0,0 +1,38 @@
+from ecostress.l0b_index_file import L0bIndexFile
+import h5py
+import numpy as np
+
+
+def test_l0b_index_file(isolated_dir, test_data):
+    l0b = str(test_data / "L0B_80005_20150124T204251_0100_01.h5")
+    ev_codes = np.zeros((4, 6), dtype=np.int32)
+    ev_codes[0, 0:4] = [57450, 57525, 931900, 932200]
+    ev_codes[1, 0:4] = [171500, 171575, 1045950, 1046250]
+    ev_codes[2, 0:4] = [337090, 337165, 1211550, 1211850]
+    with h5py.File(l0b, "r") as fin:
+        idx = L0bIndexFile(l0b, fin, ev_codes, 1749248, cache_dir=".")
+        assert idx.created
+        gpt = (
+            fin["flex/time_fsw"][:]
+            + (
+                fin["flex/time_sync_fpie"][:].astype(np.int64)
+                - fin["flex/time_sync_fsw"][:].astype(np.int64)
+            )
+            / 1000000.0
+        )
+        assert np.array_equal(idx.gpt, gpt)
+        for t in (gpt[0] - 1, gpt[10], gpt[-1] - 0.5, gpt[-1] + 1):
+            assert idx.packet_after(t) == np.argmax(gpt > t)
+        p0, p1 = idx.scene_packet_range(gpt[10], gpt[100])
+        assert p0 == np.argmax(gpt > gpt[10])
+        # Second time we should just read the existing file, including
+        # the scene we added
+        idx2 = L0bIndexFile(l0b, fin, ev_codes, 1749248, cache_dir=".")
+        assert not idx2.created
+        assert idx2.scene.shape[0] == 1
+        assert idx2.scene_packet_range(gpt[10], gpt[100]) == (p0, p1)
+        assert np.array_equal(idx2.seq_fp, idx.seq_fp)
+        # Different ev_codes means we need to regenerate the index
+        ev_codes[0, 0] += 1
+        idx3 = L0bIndexFile(l0b, fin, ev_codes, 1749248, cache_dir=".")
+        assert idx3.created
@@ -0,0 +1,18 @@
+from ecostress.l0b_synthetic import L0bSynthetic
+import h5py
+import numpy as np
+import pytest
+
+
+@pytest.mark.long_test
+def test_l0b_synthetic(isolated_dir, test_data):
+    l0b = str(test_data / "L0B_80005_20150124T204251_0100_01.h5")
+    scene_file = str(test_data / "Scene_80005_20150124T204251_20150124T204533.txt")
+    syn = L0bSynthetic(l0b, scene_file, 4, number_time_jump=2)
+    syn.create_file("L0B_80005_synthetic.h5", "Scene_80005_synthetic.txt")
+    with h5py.File(l0b, "r") as fin, h5py.File("L0B_80005_synthetic.h5", "r") as f:
+        # 3 scenes in the input, so we should have 2 copies
+        npkt = fin["flex/bip"].shape[0]
+        assert f["flex/bip"].shape[0] == 2 * npkt
+        assert np.all(np.diff(f["hk/bad/hr/time"][:]) > 0)
+    assert len(open("Scene_80005_synthetic.txt").readlines()) == 4
@@ -0,0 +1,77 @@
+from ecostress.l1a_bb_calibrate import L1aBbCalibrate
+import h5py
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="function")
+def bb_calibrate(isolated_dir):
+    nline, nsamp = 512, 100
+    rng = np.random.default_rng(1234)
+    with h5py.File("l1a_raw.h5", "w") as f:
+        for b in range(1, 7):
+            d = rng.integers(1, 30000, (nline, nsamp)).astype("u2")
+            d[10, 10] = 0xFFFF
+            f["UncalibratedPixels/pixel_data_%d" % b] = d
+    with h5py.File("l1a_bb.h5", "w") as f:
+        f["rtdBlackbodyGradients/RTD_325K"] = np.array(
+            [[320.1, 320.2, 320.15, 321.5, 320.12]]
+        )
+        f["rtdBlackbodyGradients/RTD_295K"] = np.array(
+            [[295.1, 295.2, 295.15, 295.5, 295.12]]
+        )
+        for b in range(1, 7):
+            f["BlackBodyPixels/b%d_blackbody_325" % b] = np.full(
+                (nline, 64), 2500, "u2"
+            )
+            f["BlackBodyPixels/b%d_blackbody_295" % b] = np.full(
+                (nline, 64), 1400, "u2"
+            )
+    with open("L1A_PCF_UPF.txt", "w") as fh:
+        print("PLANCK_ALGORITHM=1", file=fh)
+        for b, cw in enumerate([1.6, 8.28, 8.63, 9.07, 10.52, 12.05]):
+            print("B%d_CW=%f" % (b + 1, cw), file=fh)
+        print("B6IVAL=0.1", file=fh)
+        print("B6SINC=0.001", file=fh)
+    return L1aBbCalibrate("l1a_bb.h5", "l1a_raw.h5", "L1A_PCF_UPF.txt")
+
+
+def test_blackbody_temperature(bb_calibrate):
+    # RTDs 1, 3 and 5 have the smallest spread
+    t = bb_calibrate.fpa_temperature(325)
+    assert t.shape == (512, 1)
+    assert t[0, 0] == pytest.approx(np.mean([320.1, 320.15, 320.12]))
+    assert not bb_calibrate.rtd_failure
+    # Nothing in range, so we fall back to the default
+    assert bb_calibrate.blackbody_temperature(
+        np.array([200.0, 200, 200, 200, 200]), 310, 330
+    ) == (0.0, 0.0)
+
+
+def test_gain_offset(bb_calibrate):
+    t325 = bb_calibrate.fpa_temperature(325)[0, 0]
+    t295 = bb_calibrate.fpa_temperature(295)[0, 0]
+    r325 = bb_calibrate.planck_radiance(t325, 6)
+    r295 = bb_calibrate.planck_radiance(t295, 6)
+    gain, offset = bb_calibrate.gain_offset(6)
+    assert gain.dtype == np.float32
+    assert gain[0, 0] == pytest.approx((r295 - r325) / (1400 - 2500), rel=1e-5)
+    off = (r325 * 1400 - r295 * 2500) / (1400 - 2500)
+    assert offset[0, 0] == pytest.approx(off + 0.1, rel=1e-5)
+    assert offset[0, 50] == pytest.approx(off + 0.1 + 0.05, rel=1e-5)
+    # Stripes and bad data
+    assert np.all(gain[32:48, :] == -9998)
+    assert np.all(gain[256 + 32 : 256 + 48, :] == -9998)
+    assert gain[10, 10] == -9999
+    # Band 5 has bad lines rather than stripes
+    gain, offset = bb_calibrate.gain_offset(5)
+    assert np.all(gain[218:220, :] == -9999)
+    assert np.all(gain[32:48, :] != -9998)
+
+
+def test_swir_dcc(bb_calibrate):
+    d = bb_calibrate.swir_dcc()
+    assert d.dtype == np.int16
+    assert np.all(d[32:48, :] == -9998)
+    assert d[0:32, :].min() >= 0
+    assert d[0:32, :].max() <= 255
@@ -1,5 +1,8 @@
 from ecostress.l1a_pix_generate import L1aPixGenerate
 from ecostress.exception import VicarRunError
+import h5py
+import numpy as np
+import os
 import pytest
 from loguru import logger
 
@@ -37,3 +40,44 @@ def test_l1a_pix_generate_failed(isolated_dir, test_data, vicar_path):
     )
     with pytest.raises(VicarRunError):
         l1apix.run()
+
+
+@pytest.mark.long_test
+def test_l1a_pix_generate_python(isolated_dir, test_data, vicar_path):
+    """Compare the python calibration engine with the VICAR one."""
+    fvar = "80005_001_20150124T204250_0100_01.h5"
+    l1a_bb = str(test_data / f"ECOSTRESS_L1A_BB_{fvar}.expected")
+    l1a_raw = str(test_data / f"L1A_RAW_PIX_{fvar}.expected")
+    l1_osp_dir = str(test_data / "l1_osp_dir")
+    for engine in ("vicar", "python"):
+        l1apix = L1aPixGenerate(
+            l1a_bb,
+            l1a_raw,
+            l1_osp_dir,
+            f"ECOSTRESS_L1A_PIX_{engine}_{fvar}",
+            f"L1A_RAD_GAIN_{engine}_{fvar}",
+            calibration_engine=engine,
+            number_cpu=4,
+        )
+        l1apix.run()
+    # Only the VICAR engine should create a run directory
+    assert os.path.exists("el1a_run_001")
+    assert not os.path.exists("el1a_run_002")
+    for fname in ("ECOSTRESS_L1A_PIX_%s_" + fvar, "L1A_RAD_GAIN_%s_" + fvar):
+        fv = h5py.File(fname % "vicar", "r")
+        fp = h5py.File(fname % "python", "r")
+        for gname in fv:
+            if "Metadata" in gname:
+                continue
+            for dname in fv[gname]:
+                name = f"{gname}/{dname}"
+                dv = fv[name][()]
+                dp = fp[name][()]
+                assert dv.shape == dp.shape
+                if name == "SWIR/b6_dcc":
+                    # The gaussian stretch is close, but not identical to
+                    # the VICAR fitg
+                    assert np.array_equal(dv == -9998, dp == -9998)
+                    assert np.mean(np.abs(dv.astype(float) - dp)) < 2.0
+                else:
+                    assert dv == pytest.approx(dp, rel=1e-5, abs=1e-5)
@@ -0,0 +1,25 @@
+from ecostress import EcostressRadApply, L1aPixScanReader
+import geocal
+import numpy as np
+import pickle
+
+
+def test_l1a_pix_scan_reader(dn_fname, gain_fname):
+    """Compare against reading the data through EcostressRadApply."""
+    scan_index = 10
+    with L1aPixScanReader(str(dn_fname), str(gain_fname), 256) as reader:
+        for band in (1, 0):
+            rad = EcostressRadApply(str(dn_fname), str(gain_fname), band)
+            assert reader.shape(band) == (rad.number_line, rad.number_sample)
+            d_expect = geocal.SubRasterImage(
+                rad, scan_index * 256, 0, 256, rad.number_sample
+            ).read_all_double()
+            np.testing.assert_allclose(reader.radiance(band, scan_index), d_expect)
+        dn, gain, offset = reader.scan_data(1, scan_index)
+        assert dn.dtype == np.int32
+        assert gain.dtype == np.float64
+        assert offset.dtype == np.float64
+        # Check that we can pickle, so we can use in a multiprocessing pool
+        reader2 = pickle.loads(pickle.dumps(reader))
+        np.testing.assert_array_equal(reader2.scan_data(1, scan_index)[0], dn)
+        reader2.close()
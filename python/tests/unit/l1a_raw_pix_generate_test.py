@@ -1,5 +1,9 @@
 from ecostress.l1a_raw_pix_generate import L1aRawPixGenerate
 from geocal import Time
+import h5py
+import numpy as np
+import os
+import glob
 import pytest
 
 
@@ -13,6 +17,65 @@ def test_l1a_raw_pix_generate(isolated_dir, test_data):
     l1arawpix.run()
 
 
+def check_same_output(dir1, dir2):
+    """Check that all the h5 files in dir1 and dir2 have the same data,
+    and that the refined scene files match."""
+    flist = sorted(os.path.basename(f) for f in glob.glob(dir1 + "/*.h5"))
+    assert len(flist) > 0
+    for fname in flist:
+        with (
+            h5py.File(dir1 + "/" + fname, "r") as f1,
+            h5py.File(dir2 + "/" + fname, "r") as f2,
+        ):
+
+            def check(name, obj):
+                if isinstance(obj, h5py.Dataset) and "Metadata" not in name:
+                    assert np.array_equal(obj[()], f2[name][()])
+
+            f1.visititems(check)
+    # Refined scene file has the run time in the name, but the content
+    # should be the same
+    sf1 = glob.glob(dir1 + "/Scene_*.txt")
+    sf2 = glob.glob(dir2 + "/Scene_*.txt")
+    assert len(sf1) == 1 and len(sf2) == 1
+    assert open(sf1[0]).read() == open(sf2[0]).read()
+
+
+@pytest.mark.long_test
+def test_l1a_raw_pix_generate_modes(isolated_dir, test_data):
+    """Check that the vectorized assembly, streaming, parallel, L0B index
+    and background writer modes give the same output as the original packet
+    loop."""
+    l0b = str(test_data / "L0B_80005_20150124T204251_0100_01.h5")
+    obst_dir = str(test_data / "obst_dir")
+    l1_osp_dir = str(test_data / "l1_osp_dir")
+    scene_file = str(test_data / "Scene_80005_20150124T204251_20150124T204533.txt")
+    for d, kwargs in (
+        ("loop", {}),
+        ("vectorized", {"vectorized_assembly": True}),
+        ("streaming", {"streaming": True, "read_ahead": 50}),
+        ("parallel", {"number_cpu": 3, "vectorized_assembly": True}),
+        (
+            "index",
+            {
+                "use_index": True,
+                "index_dir": os.path.abspath("."),
+                "vectorized_assembly": True,
+            },
+        ),
+        ("writer", {"write_queue_size": 2, "vectorized_assembly": True}),
+    ):
+        os.mkdir(d)
+        os.chdir(d)
+        L1aRawPixGenerate(l0b, obst_dir, l1_osp_dir, scene_file, **kwargs).run()
+        os.chdir("..")
+    check_same_output("loop", "vectorized")
+    check_same_output("loop", "streaming")
+    check_same_output("loop", "parallel")
+    check_same_output("loop", "index")
+    check_same_output("loop", "writer")
+
+
 def test_process_scene_file(test_data):
     """Process the scene file that we generated, and make sure everything is
     ok"""
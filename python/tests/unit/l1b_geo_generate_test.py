@@ -1,6 +1,7 @@
 from ecostress.l1b_geo_generate import L1bGeoGenerate
 import geocal
 from multiprocessing import Pool
+import numpy as np
 import pickle
 import pytest
 
@@ -50,3 +51,28 @@ def test_l1b_geo_generate_save(igc, lwm):
     l1bgeo.run(pool=pool)
     with open("l1b_geo_generate.pickle", "wb") as f:
         pickle.dump(l1bgeo, f)
+
+
+@pytest.mark.long_test
+def test_l1b_geo_loc_pool(isolated_dir, igc, lwm):
+    """With a pool, loc has the workers write into shared memory. Check
+    that this gives the same results as running serially."""
+    l1bgeo = L1bGeoGenerate(
+        igc,
+        None,
+        "fake_rad.h5",
+        lwm,
+        "l1b_geo.h5",
+        [
+            "fake_input.h5",
+        ],
+        True,
+        number_line=200,
+    )
+    res = l1bgeo.loc()
+    with Pool(2) as pool:
+        res2 = l1bgeo.loc(pool=pool)
+    assert res[0].shape == (200, igc.number_sample)
+    assert res[8].shape == (200,)
+    for r1, r2 in zip(res, res2):
+        np.testing.assert_allclose(r1, r2)
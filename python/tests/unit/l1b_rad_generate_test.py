@@ -1,5 +1,19 @@
 from ecostress import L1bRadGenerate, L1bProj, L1aPixSimulate, EcostressIgcCollection
 from geocal import VicarRasterImage, mmap_file, VicarLiteRasterImage
+from ecostress import (
+    EcostressRadApply,
+    EcostressRadAverage,
+    GeometricModelImageHandleFill,
+    FILL_VALUE_NOT_SEEN,
+    FILL_VALUE_STRIPED,
+    FILL_VALUE_BAD_OR_MISSING,
+    DQI_GOOD,
+    DQI_NOT_SEEN,
+    DQI_STRIPE_NOT_INTERPOLATED,
+    DQI_BAD_OR_MISSING,
+    band_to_band_tie_points,
+)
+import geocal
 from multiprocessing import Pool
 import subprocess
 import pytest
@@ -28,6 +42,93 @@ def test_l1b_rad_generate(
     l1brad.run()
 
 
+@pytest.mark.long_test
+def test_l1b_rad_generate_parallel(
+    isolated_dir, igc_hres_latest, dn_latest_fname, gain_latest_fname
+):
+    """Check that doing the bands and scans in parallel gives the same
+    results as doing them serially."""
+    cal_correction = np.array(
+        [
+            [0.9433, 0.9532, 0.9021, 0.9597, 0.9516],
+            [0.6508, 0.5216, 0.8955, 0.4820, 0.5164],
+        ]
+    )
+    l1brad = L1bRadGenerate(
+        igc_hres_latest,
+        str(dn_latest_fname),
+        str(gain_latest_fname),
+        "ECOv003_L1B_RAD_03663_001_20190227T101222_01.h5",
+        "fake_osp",
+        cal_correction,
+    )
+    band_list = [1, 2, 3, 4, 5, 0]
+    d_serial = l1brad.images(band_list)
+    total_possible_scan = l1brad.total_possible_scan
+    missing_scan = l1brad.missing_scan
+    l1brad.total_possible_scan = 0
+    l1brad.missing_scan = 0
+    with Pool(4) as pool:
+        d_parallel = l1brad.images(band_list, pool)
+    assert l1brad.total_possible_scan == total_possible_scan
+    assert l1brad.missing_scan == missing_scan
+    np.testing.assert_array_equal(d_serial, d_parallel)
+
+
+def test_l1b_rad_scan_image(
+    isolated_dir, igc_hres_latest, dn_latest_fname, gain_latest_fname
+):
+    """Check that the single pass rad_scan_register_average gives the same
+    results as the RasterImage stack of EcostressRadApply,
+    GeometricModelImageHandleFill and EcostressRadAverage."""
+    l1brad = L1bRadGenerate(
+        igc_hres_latest,
+        str(dn_latest_fname),
+        str(gain_latest_fname),
+        "ECOv003_L1B_RAD_03663_001_20190227T101222_01.h5",
+        "fake_osp",
+        np.ones((2, 5)),
+    )
+    band = 2
+    scan_index = 10
+    nlinescan = igc_hres_latest.number_line_scan
+    rad = EcostressRadApply(str(dn_latest_fname), str(gain_latest_fname), band)
+    radsub = geocal.SubRasterImage(
+        rad, scan_index * nlinescan, 0, nlinescan, rad.number_sample
+    )
+    tp = band_to_band_tie_points(igc_hres_latest, scan_index, band)
+    m = geocal.QuadraticGeometricModel()
+    m.fit_transformation(tp)
+    rbreg = GeometricModelImageHandleFill(
+        radsub,
+        m,
+        radsub.number_line,
+        radsub.number_sample,
+        FILL_VALUE_NOT_SEEN,
+    )
+    d_expect = EcostressRadAverage(rbreg).read_all_double()
+    d = l1brad.scan_image(band, scan_index)
+    assert d.shape == d_expect.shape
+    assert np.allclose(d, d_expect, atol=1e-4)
+
+
+def test_dqi_from_fill():
+    data = np.array(
+        [
+            [1.0, FILL_VALUE_NOT_SEEN, FILL_VALUE_STRIPED],
+            [FILL_VALUE_BAD_OR_MISSING, -5.0, 2.0],
+        ],
+        dtype=np.float32,
+    )
+    np.testing.assert_array_equal(
+        L1bRadGenerate.dqi_from_fill(data),
+        [
+            [DQI_GOOD, DQI_NOT_SEEN, DQI_STRIPE_NOT_INTERPOLATED],
+            [DQI_BAD_OR_MISSING, DQI_GOOD, DQI_GOOD],
+        ],
+    )
+
+
 # Don't normally run this. We had this in place to look at band to band
 # registration, and this test looks at directly projecting each band to make
 # sure the underlying data registers
@@ -0,0 +1,41 @@
+from ecostress.obstruction_index import ObstructionIndex
+from geocal import Time
+import pytest
+
+
+def write_obst_file(fname):
+    with open(fname, "w") as fh:
+        print("Solar array obstruction report", file=fh)
+        print("ISS FOV OBSTRUCTED,100/12:00:00,to,100/12:10:00", file=fh)
+        print("ISS FOV CLEAR,100/12:10:00,to,100/13:00:00", file=fh)
+        print("ISS FOV OBSTRUCTED,101/01:00:00,to,101/01:30:00", file=fh)
+
+
+def test_obstruction_index(isolated_dir):
+    write_obst_file("ECO_100_107_Obst.2018")
+    obst = ObstructionIndex(".", cache_file="obst_cache.pkl")
+    t = Time.parse_time
+    assert obst.detect(t("2018::100 12:05:00"), t("2018::100 12:06:00")) == "YES"
+    assert obst.detect(t("2018::100 11:59:00"), t("2018::100 12:00:30")) == "YES"
+    assert obst.detect(t("2018::100 12:20:00"), t("2018::100 12:30:00")) == "NO"
+    assert obst.detect(t("2018::101 01:29:00"), t("2018::101 01:40:00")) == "YES"
+    assert obst.detect(t("2018::103 01:29:00"), t("2018::103 01:40:00")) == "NO"
+    assert obst.detect(t("2019::100 12:05:00"), t("2019::100 12:06:00")) == "NA"
+
+
+def test_obstruction_index_cache(isolated_dir, monkeypatch):
+    write_obst_file("ECO_100_107_Obst.2018")
+    ObstructionIndex(".", cache_file="obst_cache.pkl")
+
+    # Second time we should use the cache, and not parse the file again
+    def no_parse(fname):
+        raise RuntimeError("Shouldn't parse %s" % fname)
+
+    monkeypatch.setattr(ObstructionIndex, "parse_file", staticmethod(no_parse))
+    obst = ObstructionIndex(".", cache_file="obst_cache.pkl")
+    t = Time.parse_time
+    assert obst.detect(t("2018::100 12:05:00"), t("2018::100 12:06:00")) == "YES"
+    # But a new file does get read
+    write_obst_file("ECO_108_115_Obst.2018")
+    with pytest.raises(RuntimeError):
+        ObstructionIndex(".", cache_file="obst_cache.pkl")
@@ -0,0 +1,36 @@
+from ecostress.parallel_chunk_writer import ParallelChunkWriter
+import h5py
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("number_thread", [1, 4])
+def test_parallel_chunk_writer(isolated_dir, number_thread):
+    rng = np.random.default_rng(1234)
+    data = {
+        "image": rng.integers(0, 32767, (1000, 300)).astype(np.int16),
+        "gain": rng.random((1000, 300)).astype(np.float32),
+        "temp": np.full((1000, 1), 320.0, dtype=np.float32),
+        "big_endian": rng.integers(0, 100, (37, 5)).astype(">i2"),
+    }
+    # Memory mapped input, like we get from VICAR files
+    np.save("gain.npy", data["gain"])
+    data["mmap"] = np.load("gain.npy", mmap_mode="r")
+    with (
+        h5py.File("test.h5", "w") as f,
+        ParallelChunkWriter(number_thread, chunk_bytes=64 * 1024) as w,
+    ):
+        g = f.create_group("Data")
+        for k, v in data.items():
+            t = w.create_dataset(g, k, v)
+            t.attrs["Units"] = "dimensionless"
+    with h5py.File("test.h5", "r") as f:
+        for k, v in data.items():
+            t = f["Data/" + k]
+            assert t.compression == "gzip"
+            assert t.dtype == v.dtype
+            assert t.attrs["Units"] == "dimensionless"
+            assert np.array_equal(t[()], v)
+        # Chunks are full rows. 1000 isn't a multiple of the number of rows
+        # in a chunk, so this also checks the padded edge chunk
+        assert f["Data/image"].chunks == (109, 300)
@@ -0,0 +1,19 @@
+from ecostress.shared_array import SharedArray
+from multiprocessing import Pool
+import numpy as np
+
+
+def fill_row(it):
+    i, sarr = it
+    sarr.data[i, :] = i
+    return i
+
+
+def test_shared_array():
+    with SharedArray((10, 5), np.float32, fill_value=-9999) as sarr:
+        assert np.all(sarr.data == -9999)
+        with Pool(2) as pool:
+            pool.map(fill_row, [(i, sarr) for i in range(0, 10, 2)])
+        d = sarr.copy()
+    for i in range(10):
+        assert np.all(d[i, :] == (i if i % 2 == 0 else -9999))
@@ -0,0 +1,38 @@
+from ecostress.worker_context import WorkerContext
+from multiprocessing import Pool
+import os
+
+# Number of times a Scaler has been unpickled in this process
+number_unpickle = 0
+
+
+class Scaler(object):
+    def __init__(self, scale):
+        self.scale = scale
+
+    def __setstate__(self, state):
+        global number_unpickle
+        number_unpickle += 1
+        self.__dict__.update(state)
+
+    def apply(self, i):
+        return self.scale * i
+
+
+def scale_worker(it):
+    ctx, i = it
+    return (ctx.obj.apply(i), os.getpid(), number_unpickle)
+
+
+def test_worker_context():
+    s = Scaler(3)
+    # Like in L1bGeoProcess, the pool is created before the context
+    with Pool(2) as pool:
+        with WorkerContext(s) as ctx:
+            # In the creating process we get the original object back
+            assert ctx.obj is s
+            r = pool.map(scale_worker, [(ctx, i) for i in range(20)], chunksize=1)
+    assert [v for v, _, _ in r] == [3 * i for i in range(20)]
+    # Each worker only unpickles the object once
+    assert all(n == 1 for _, _, n in r)
+    assert number_unpickle == 0
@@ -0,0 +1,73 @@
+# Run the stripe interpolation over a grid of parameters for one or more
+# clean L1B_RAD files (or simulated ones from L1bRadSimulate), reporting
+# the wall time, peak memory and RMSE per band for each case. See
+# InterpolateBenchmark for details.
+#
+# Example:
+#   python interpolate_benchmark.py --window-size 101 201 --n-neighbors 5 10 \
+#      ECOv003_L1B_RAD_*.h5
+#   python interpolate_benchmark.py --method ae --grid-size 1 3 --n-ensemble 3 \
+#      ECOv003_L1B_RAD_*.h5
+from ecostress import InterpolateBenchmark
+import argparse
+import json
+
+parser = argparse.ArgumentParser(
+    description="Benchmark the cost and accuracy of the stripe interpolation"
+)
+parser.add_argument("l1b_rad", nargs="+", help="Clean L1B_RAD files to use")
+parser.add_argument("--method", choices=["knn", "ae"], default="knn")
+parser.add_argument("--window-size", type=int, nargs="+", default=[201])
+parser.add_argument("--n-neighbors", type=int, nargs="+", default=[10])
+parser.add_argument("--max-train-samples", type=int, nargs="+", default=[5000])
+parser.add_argument(
+    "--block-step",
+    type=int,
+    nargs="+",
+    default=None,
+    help="Default is window_size // 2",
+)
+parser.add_argument("--grid-size", type=int, nargs="+", default=[1], help="For ae")
+parser.add_argument("--n-ensemble", type=int, nargs="+", default=[3], help="For ae")
+parser.add_argument("--latent-dim", type=int, nargs="+", default=[16], help="For ae")
+parser.add_argument(
+    "--predict-batch-size", type=int, nargs="+", default=[65536], help="For ae"
+)
+parser.add_argument("--epochs", type=int, default=25, help="Training epochs for ae")
+parser.add_argument("--seed", type=int, default=0, help="Seed for stripe placement")
+parser.add_argument("--no-memory", action="store_true", help="Skip measuring memory")
+parser.add_argument("--json", help="Also write the results to this JSON file")
+args = parser.parse_args()
+
+if args.method == "knn":
+    grid = {
+        "window_size": args.window_size,
+        "n_neighbors": args.n_neighbors,
+        "max_train_samples": args.max_train_samples,
+        "block_step": args.block_step if args.block_step else [None],
+    }
+    train_parameters = None
+else:
+    grid = {
+        "grid_size": args.grid_size,
+        "n_ensemble": args.n_ensemble,
+        "latent_dim": args.latent_dim,
+        "predict_batch_size": args.predict_batch_size,
+    }
+    train_parameters = {"epochs": args.epochs}
+
+results = []
+for fname in args.l1b_rad:
+    bench = InterpolateBenchmark.from_file(
+        fname, seed=args.seed, measure_memory=not args.no_memory
+    )
+    res = bench.run_grid(args.method, grid, train_parameters=train_parameters)
+    for r in res:
+        r["file"] = fname
+    print(fname)
+    print(InterpolateBenchmark.table(res))
+    print()
+    results.extend(res)
+if args.json:
+    with open(args.json, "w") as fh:
+        json.dump(results, fh, indent=2)